@@ -0,0 +1,82 @@
+# corpus.py
+
+# Lecture du corpus de positions de référence des mesures de performance.
+#
+# Format du fichier (texte) : chaque position commence par une ligne d'en-tête
+#     = <nom> <categorie> <trait>
+# suivie d'autant de lignes que le plateau en compte, une case par caractère : '.' (vide), 'N' ou 'B'.
+# Les lignes vides et les lignes commençant par '#' sont ignorées.
+
+import os
+
+from plateau.plateau import Plateau
+
+FICHIER_POSITIONS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'positions.txt')
+
+
+class Position:
+    """
+    Position de référence du corpus.
+
+    Attributs:
+        nom (str): Nom unique de la position.
+        categorie (str): Catégorie de la position (ouverture, milieu, tactique, fin...).
+        trait (str): Couleur qui a le trait ('N' ou 'B').
+        lignes (list): Le contenu du plateau, une chaîne par ligne.
+    """
+
+    def __init__(self, nom, categorie, trait, lignes):
+        self.nom = nom
+        self.categorie = categorie
+        self.trait = trait
+        self.lignes = lignes
+
+    def plateau(self, classe_plateau=Plateau):
+        """
+        Construit le plateau de la position ; les pierres sont posées avec `jouer`, de sorte que le hash, les
+        frontières des coups candidats et les structures propres à chaque représentation sont à jour.
+
+        Entrée:
+            classe_plateau (type, optionnel): La classe de plateau à construire.
+
+        Retourne:
+            Plateau: Le plateau de la position.
+        """
+        plateau = classe_plateau(len(self.lignes))
+        for ligne, contenu in enumerate(self.lignes):
+            for colonne, case in enumerate(contenu):
+                if case != '.':
+                    plateau.jouer(ligne, colonne, case)
+        return plateau
+
+
+def charger_positions(chemin=FICHIER_POSITIONS):
+    """
+    Lit un fichier de positions.
+
+    Entrée:
+        chemin (str, optionnel): Le chemin du fichier. Par défaut, le corpus fourni.
+
+    Retourne:
+        list: Les positions (Position), dans l'ordre du fichier.
+    """
+    positions = []
+    with open(chemin, encoding='utf-8') as fichier:
+        for numero, ligne in enumerate(fichier, start=1):
+            ligne = ligne.strip()
+            if not ligne or ligne.startswith('#'):
+                continue
+            if ligne.startswith('='):
+                champs = ligne[1:].split()
+                if len(champs) != 3 or champs[2] not in ('N', 'B'):
+                    raise ValueError(f"{chemin}:{numero}: en-tête invalide, attendu '= nom categorie trait'")
+                positions.append(Position(champs[0], champs[1], champs[2], []))
+            elif not positions or set(ligne) - {'.', 'N', 'B'}:
+                raise ValueError(f"{chemin}:{numero}: ligne de plateau invalide")
+            else:
+                positions[-1].lignes.append(ligne)
+    for position in positions:
+        taille = len(position.lignes)
+        if any(len(ligne) != taille for ligne in position.lignes):
+            raise ValueError(f"{chemin}: la position {position.nom} n'est pas carrée")
+    return positions
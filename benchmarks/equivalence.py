@@ -0,0 +1,141 @@
+# equivalence.py
+
+# Vérification que toutes les implémentations de l'évaluation donnent les mêmes scores que l'implémentation
+# d'origine (Evaluation.evaluer_reference), sur un corpus de positions aléatoires reproductible (graine fixe)
+# complété par les positions du corpus des mesures de performance.
+#
+# Pour chaque position, chaque couleur et chaque difficulté, on compare au score de référence :
+#   - Evaluation.evaluer (évaluation en un seul parcours pour facile et difficile) ;
+#   - EvaluationIncrementale, synchronisée sur la position, puis tenue à jour coup par coup (jouer / annuler)
+#     pendant la construction de la position et l'annulation de ses derniers coups ;
+#   - EvaluationVectorielle.evaluer, et EvaluationVectorielle.evaluer_coups sur quelques coups candidats.
+# Les tables de motifs (motifs.py) étant partagées par toutes ces implémentations, toute modification des tables ou
+# des poids qui changerait un score est signalée ici.
+#
+# Utilisation :
+#     python -m benchmarks.equivalence
+#     python -m benchmarks.equivalence --positions 500 --graine 7
+
+import argparse
+import random
+import sys
+
+from benchmarks.corpus import charger_positions, FICHIER_POSITIONS
+from plateau.plateau import Plateau
+from strategie.evaluation import Evaluation
+from strategie.evaluation_incrementale import EvaluationIncrementale
+from strategie.evaluation_vectorielle import EvaluationVectorielle
+from strategie.motifs import POIDS
+
+TAILLE = 15
+NB_COUPS_ENFANTS = 3  # Coups candidats notés par EvaluationVectorielle.evaluer_coups à chaque position
+NB_ANNULATIONS = 3  # Derniers coups annulés pour vérifier l'évaluateur incrémental après `annuler`
+
+
+def coups_aleatoires(generateur, taille=TAILLE):
+    """
+    Tire la suite des coups d'une position aléatoire : pierres dispersées sur tout le plateau, ou groupées autour du
+    centre (longues séries, menaces et formations), une fois sur deux.
+
+    Entrées:
+        generateur (random.Random): Le générateur aléatoire.
+        taille (int): La taille du plateau.
+
+    Retourne:
+        list: Les coups (ligne, colonne, couleur), dans l'ordre où ils sont joués.
+    """
+    cases = [(x, y) for x in range(taille) for y in range(taille)]
+    if generateur.random() < 0.5:
+        generateur.shuffle(cases)
+    else:
+        centre = taille // 2
+        cases.sort(key=lambda c: abs(c[0] - centre) + abs(c[1] - centre) + generateur.random() * 4)
+    nb_pierres = generateur.randrange(taille * taille * 3 // 4)
+    return [(x, y, 'N' if generateur.random() < 0.5 else 'B') for x, y in cases[:nb_pierres]]
+
+
+def comparer(plateau, couleur, difficulte, coups=None):
+    """
+    Compare les évaluations d'une position au score de référence.
+
+    Entrées:
+        plateau (Plateau): La position (restaurée à la fin de la comparaison).
+        couleur (str): La couleur pour laquelle l'évaluation est faite.
+        difficulte (str): La difficulté de l'évaluation.
+        coups (list, optionnel): Les coups (ligne, colonne, couleur) qui mènent à la position depuis un plateau vide,
+            pour vérifier l'évaluateur incrémental tenu à jour coup par coup.
+
+    Retourne:
+        list: Les écarts trouvés, sous la forme (implémentation, score obtenu, score de référence).
+    """
+    evaluation = Evaluation(plateau, couleur, difficulte)
+    reference = evaluation.evaluer_reference(plateau)
+    ecarts = []
+
+    def verifier(nom, score, attendu=reference):
+        if score != attendu:
+            ecarts.append((nom, score, attendu))
+
+    verifier('evaluer', evaluation.evaluer(plateau))
+    verifier('incrementale', EvaluationIncrementale(plateau, couleur, difficulte).evaluer())
+    vectorielle = EvaluationVectorielle(couleur, difficulte)
+    verifier('vectorielle', vectorielle.evaluer(plateau))
+
+    if coups is not None:
+        vide = Plateau(plateau.taille)
+        incrementale = EvaluationIncrementale(vide, couleur, difficulte)
+        for ligne, colonne, couleur_coup in coups:
+            vide.jouer(ligne, colonne, couleur_coup)
+            incrementale.jouer(ligne, colonne)
+        verifier('incrementale_jouer', incrementale.evaluer())
+        for _ in range(min(NB_ANNULATIONS, len(coups))):
+            incrementale.annuler()
+            vide.annuler()
+        verifier('incrementale_annuler', incrementale.evaluer(), evaluation.evaluer_reference(vide))
+
+    enfants = sorted(plateau.coups_candidats(1))[:NB_COUPS_ENFANTS]
+    if enfants:
+        scores = vectorielle.evaluer_coups(plateau, enfants, couleur)
+        for coup, score in zip(enfants, scores):
+            plateau.jouer(coup[0], coup[1], couleur)
+            try:
+                verifier(f'vectorielle_coup {coup}', int(score), evaluation.evaluer_reference(plateau))
+            finally:
+                plateau.annuler()
+    return ecarts
+
+
+def main(arguments=None):
+    parseur = argparse.ArgumentParser(description="Vérifie que toutes les évaluations donnent les scores de référence.")
+    parseur.add_argument('--positions', type=int, default=200, help="nombre de positions aléatoires")
+    parseur.add_argument('--graine', type=int, default=0, help="graine du corpus de positions aléatoires")
+    parseur.add_argument('--corpus', default=FICHIER_POSITIONS, help="fichier du corpus de positions fixes")
+    parseur.add_argument('--difficultes', nargs='+', default=list(POIDS), choices=list(POIDS))
+    arguments = parseur.parse_args(arguments)
+
+    generateur = random.Random(arguments.graine)
+    cas = []
+    for indice in range(arguments.positions):
+        coups = coups_aleatoires(generateur)
+        plateau = Plateau(TAILLE)
+        for ligne, colonne, couleur in coups:
+            plateau.jouer(ligne, colonne, couleur)
+        cas.append((f"aleatoire_{indice}", plateau, coups))
+    for position in charger_positions(arguments.corpus):
+        cas.append((position.nom, position.plateau(), None))
+
+    nb_comparaisons = 0
+    nb_ecarts = 0
+    for nom, plateau, coups in cas:
+        for couleur in ('N', 'B'):
+            for difficulte in arguments.difficultes:
+                nb_comparaisons += 1
+                for implementation, score, attendu in comparer(plateau, couleur, difficulte, coups):
+                    nb_ecarts += 1
+                    print(f"{nom:<18} {couleur} {difficulte:<11} {implementation:<24} {score} (référence {attendu})")
+    print(f"{nb_comparaisons} comparaisons, {nb_ecarts} écart(s)")
+    return 1 if nb_ecarts else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
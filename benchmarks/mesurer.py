@@ -0,0 +1,211 @@
+# mesurer.py
+
+# Mesures de performance de la recherche et des évaluations sur le corpus de positions de référence.
+#
+# Pour chaque position et chaque difficulté, on mesure :
+#   - la recherche (MinimaxStrategy.choisir_coup, sans bibliothèque d'ouvertures ni limite de temps) : temps total,
+#     temps pour atteindre chaque profondeur, nœuds, nœuds par seconde, profondeur atteinte et coup joué ;
+#   - chaque évaluation (Evaluation.evaluer_<difficulte>, EvaluationIncrementale, EvaluationVectorielle) :
+#     évaluations par seconde.
+# Les résultats sont écrits dans un fichier JSON. Le mode comparaison relit un fichier de référence et signale les
+# mesures dégradées de plus d'un seuil relatif ; le code de sortie vaut alors 1.
+#
+# Utilisation :
+#     python -m benchmarks.mesurer --sortie resultats.json
+#     python -m benchmarks.mesurer --sortie nouveaux.json --comparer resultats.json --seuil 0.1
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+from benchmarks.corpus import charger_positions, FICHIER_POSITIONS
+from strategie.evaluation import Evaluation
+from strategie.evaluation_incrementale import EvaluationIncrementale
+from strategie.evaluation_vectorielle import EvaluationVectorielle
+from strategie.minmax import MinimaxStrategy
+
+DIFFICULTES = ('facile', 'moyen', 'difficile')
+DUREE_EVALUATION = 0.2  # Durée minimale (en secondes) de la mesure de chaque évaluation
+TEMPS_MINIMAL = 0.01  # En deçà (en secondes), les mesures de durée d'une recherche sont trop bruitées pour être comparées
+VERSION_RESULTATS = 1
+
+# Sens de chaque mesure comparée : 1 si une valeur plus grande est meilleure, -1 si une valeur plus petite l'est.
+# Les nœuds sont déterministes : toute augmentation signale un changement de l'élagage ou de l'ordre des coups.
+SENS_MESURES = {
+    'temps': -1,
+    'noeuds': -1,
+    'noeuds_par_seconde': 1,
+    'evaluations_par_seconde': 1,
+}
+MESURES_DE_DUREE = ('temps', 'noeuds_par_seconde')
+
+
+def mesurer_recherche(position, difficulte):
+    """
+    Mesure la recherche du coup d'une position.
+
+    Entrées:
+        position (Position): La position du corpus.
+        difficulte (str): La difficulté de la stratégie.
+
+    Retourne:
+        dict: Les mesures (temps, temps_profondeurs, noeuds, noeuds_par_seconde, profondeur, coup, origine).
+    """
+    plateau = position.plateau()
+    strategie = MinimaxStrategy(plateau, position.trait, difficulte, temps_limite=None, statistiques=True)
+    strategie.temps_limite = None
+    strategie.bibliotheque = None
+    coup = strategie.choisir_coup()
+    statistiques = strategie.statistiques
+    return {
+        'temps': statistiques.temps_total,
+        'temps_profondeurs': statistiques.temps_profondeurs,
+        'noeuds': statistiques.noeuds + statistiques.noeuds_menaces,
+        'noeuds_par_seconde': statistiques.noeuds_par_seconde(),
+        'profondeur': statistiques.profondeur_atteinte,
+        'coup': None if coup is None else list(coup),
+        'origine': statistiques.origine,
+    }
+
+
+def mesurer_appels(fonction):
+    """
+    Appelle une fonction sans argument pendant au moins DUREE_EVALUATION secondes.
+
+    Retourne:
+        dict: Le nombre d'appels par seconde ('evaluations_par_seconde') et la dernière valeur retournée ('score').
+    """
+    appels = 0
+    debut = time.perf_counter()
+    while True:
+        score = fonction()
+        appels += 1
+        duree = time.perf_counter() - debut
+        if duree >= DUREE_EVALUATION:
+            return {'evaluations_par_seconde': appels / duree, 'score': int(score)}
+
+
+def mesurer_evaluations(position, difficulte):
+    """
+    Mesure chaque implémentation de l'évaluation d'une difficulté sur une position.
+
+    Entrées:
+        position (Position): La position du corpus.
+        difficulte (str): La difficulté de l'évaluation.
+
+    Retourne:
+        dict: Pour chaque implémentation, ses mesures (voir `mesurer_appels`).
+    """
+    plateau = position.plateau()
+    evaluation = Evaluation(plateau, position.trait, difficulte)
+    incrementale = EvaluationIncrementale(plateau, position.trait, difficulte)
+    vectorielle = EvaluationVectorielle(position.trait, difficulte)
+    return {
+        f'evaluer_{difficulte}': mesurer_appels(lambda: getattr(evaluation, f'evaluer_{difficulte}')(plateau)),
+        'reference': mesurer_appels(lambda: evaluation.evaluer_reference(plateau)),
+        'incrementale': mesurer_appels(incrementale.evaluer),
+        'incrementale_synchroniser': mesurer_appels(lambda: (incrementale.synchroniser(plateau), incrementale.evaluer())[1]),
+        'vectorielle': mesurer_appels(lambda: vectorielle.evaluer(plateau)),
+    }
+
+
+def mesurer(positions, difficultes=DIFFICULTES, afficher=print):
+    """
+    Mesure la recherche et les évaluations sur un ensemble de positions.
+
+    Entrées:
+        positions (list): Les positions du corpus.
+        difficultes (tuple): Les difficultés mesurées.
+        afficher (function): Fonction d'affichage de la progression (None pour ne rien afficher).
+
+    Retourne:
+        dict: Les résultats, indexés par '<type>/<difficulte>/<position>[/<evaluation>]'.
+    """
+    resultats = {}
+    for position in positions:
+        for difficulte in difficultes:
+            recherche = mesurer_recherche(position, difficulte)
+            resultats[f'recherche/{difficulte}/{position.nom}'] = recherche
+            if afficher is not None:
+                afficher(f"{position.nom:<22} {difficulte:<10} recherche : {recherche['temps']:8.3f} s "
+                         f"{recherche['noeuds']:8d} nœuds {recherche['noeuds_par_seconde']:9.0f} nœuds/s "
+                         f"profondeur {recherche['profondeur']}")
+            for nom, mesures in mesurer_evaluations(position, difficulte).items():
+                resultats[f'evaluation/{difficulte}/{position.nom}/{nom}'] = mesures
+                if afficher is not None:
+                    afficher(f"{position.nom:<22} {difficulte:<10} {nom:<27} : "
+                             f"{mesures['evaluations_par_seconde']:10.0f} évaluations/s")
+    return resultats
+
+
+def comparer(resultats, reference, seuil):
+    """
+    Compare des résultats à une référence.
+
+    Entrées:
+        resultats (dict): Les résultats mesurés.
+        reference (dict): Les résultats de référence.
+        seuil (float): Dégradation relative tolérée (0.1 pour 10 %). Les durées des recherches de référence plus
+            courtes que TEMPS_MINIMAL ne sont pas comparées.
+
+    Retourne:
+        list: Les régressions, sous forme de tuples (cle, mesure, valeur de référence, valeur mesurée, variation
+        relative), la variation étant comptée positivement dans le sens de la dégradation.
+    """
+    regressions = []
+    for cle, mesures in resultats.items():
+        if cle not in reference:
+            continue
+        for mesure, sens in SENS_MESURES.items():
+            if mesure not in mesures or mesure not in reference[cle]:
+                continue
+            if mesure in MESURES_DE_DUREE and reference[cle].get('temps', TEMPS_MINIMAL) < TEMPS_MINIMAL:
+                continue
+            ancienne, nouvelle = reference[cle][mesure], mesures[mesure]
+            if not ancienne:
+                continue
+            degradation = sens * (ancienne - nouvelle) / ancienne
+            if degradation > seuil:
+                regressions.append((cle, mesure, ancienne, nouvelle, degradation))
+    return regressions
+
+
+def main(arguments=None):
+    parseur = argparse.ArgumentParser(description="Mesure les performances de la recherche et des évaluations.")
+    parseur.add_argument('--positions', default=FICHIER_POSITIONS, help="fichier du corpus de positions")
+    parseur.add_argument('--difficultes', nargs='+', default=list(DIFFICULTES), choices=DIFFICULTES)
+    parseur.add_argument('--filtre', default=None, help="ne mesure que les positions dont le nom contient ce texte")
+    parseur.add_argument('--sortie', default=None, help="fichier JSON des résultats")
+    parseur.add_argument('--comparer', default=None, help="fichier JSON de référence")
+    parseur.add_argument('--seuil', type=float, default=0.10, help="dégradation relative tolérée (défaut : 0.10)")
+    arguments = parseur.parse_args(arguments)
+
+    positions = charger_positions(arguments.positions)
+    if arguments.filtre:
+        positions = [position for position in positions if arguments.filtre in position.nom]
+    resultats = mesurer(positions, tuple(arguments.difficultes))
+
+    if arguments.sortie is not None:
+        with open(arguments.sortie, 'w', encoding='utf-8') as fichier:
+            json.dump({
+                'version': VERSION_RESULTATS,
+                'python': platform.python_version(),
+                'machine': platform.platform(),
+                'resultats': resultats,
+            }, fichier, indent=1, ensure_ascii=False)
+
+    if arguments.comparer is None:
+        return 0
+    with open(arguments.comparer, encoding='utf-8') as fichier:
+        reference = json.load(fichier)['resultats']
+    regressions = comparer(resultats, reference, arguments.seuil)
+    for cle, mesure, ancienne, nouvelle, degradation in regressions:
+        print(f"RÉGRESSION {cle} {mesure} : {ancienne:.6g} -> {nouvelle:.6g} ({100 * degradation:+.1f} %)")
+    print(f"{len(regressions)} régression(s) au-delà de {100 * arguments.seuil:.0f} %")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
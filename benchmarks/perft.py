@@ -0,0 +1,133 @@
+# perft.py
+
+# Vérification et mesure de la génération des coups et de la détection des victoires (à la manière du "perft" des
+# moteurs d'échecs).
+#
+# À partir d'une position du corpus, on énumère toutes les suites de coups jusqu'à une profondeur donnée avec
+# `generer_coups_possibles`, `placer_pierre` et `verifier_victoire`, en annulant chaque coup avec `annuler`. Une suite
+# s'arrête au premier coup gagnant (victoire) ou lorsque le plateau est plein avant la profondeur demandée (nulle) ;
+# les autres atteignent la profondeur demandée (feuilles). Les trois nombres ne dépendent que des règles du jeu :
+# toute représentation du plateau doit retrouver les nombres de référence ci-dessous, et les représentations sont
+# mesurées côte à côte.
+#
+# Utilisation :
+#     python -m benchmarks.perft
+#     python -m benchmarks.perft --plateaux bitboard --profondeur 3
+
+import argparse
+import sys
+import time
+
+from benchmarks.corpus import charger_positions, FICHIER_POSITIONS
+from plateau.bitboard import PlateauBitboard
+from plateau.compact import PlateauCompact
+from plateau.plateau import Plateau
+
+PLATEAUX = {
+    'liste': Plateau,
+    'bitboard': PlateauBitboard,
+    'compact': PlateauCompact,
+}
+
+# Nombres de référence : (position, profondeur) -> (feuilles, victoires, nulles)
+REFERENCES = {
+    ('ouverture_1', 1): (224, 0, 0),
+    ('ouverture_1', 2): (49952, 0, 0),
+    ('milieu_40', 2): (34040, 0, 0),
+    ('double_quatre', 2): (45156, 0, 0),
+    ('quatre_a_bloquer', 2): (46225, 215, 0),
+    ('presque_plein', 1): (25, 6, 0),
+    ('presque_plein', 2): (678, 78, 0),
+    ('presque_plein', 3): (15536, 4204, 0),
+    ('presque_plein', 4): (390300, 48912, 0),
+    ('cinq_vides', 3): (36, 13, 0),
+    ('cinq_vides', 5): (36, 49, 0),
+    ('cinq_vides', 6): (0, 49, 36),
+}
+
+
+def adversaire(couleur):
+    """Retourne la couleur adverse."""
+    return 'B' if couleur == 'N' else 'N'
+
+
+def perft(plateau, couleur, profondeur):
+    """
+    Énumère toutes les suites de coups à partir d'une position.
+
+    Entrées:
+        plateau (Plateau): Le plateau, restitué dans son état initial à la fin.
+        couleur (str): La couleur qui a le trait.
+        profondeur (int): Nombre de coups des suites énumérées.
+
+    Retourne:
+        tuple: (feuilles, victoires, nulles, positions) : suites atteignant la profondeur, suites terminées par un coup
+        gagnant, suites terminées par un plateau plein avant la profondeur, et nombre total de coups joués.
+    """
+    if profondeur == 0:
+        return 1, 0, 0, 0
+    coups = plateau.generer_coups_possibles()
+    if not coups:
+        return 0, 0, 1, 0
+    feuilles = victoires = nulles = 0
+    positions = len(coups)
+    suivant = adversaire(couleur)
+    for ligne, colonne in coups:
+        if not plateau.placer_pierre(ligne, colonne, couleur):
+            raise ValueError(f"coup généré invalide : {(ligne, colonne)}")
+        if plateau.verifier_victoire(ligne, colonne, couleur):
+            victoires += 1
+        else:
+            resultat = perft(plateau, suivant, profondeur - 1)
+            feuilles += resultat[0]
+            victoires += resultat[1]
+            nulles += resultat[2]
+            positions += resultat[3]
+        plateau.annuler()
+    return feuilles, victoires, nulles, positions
+
+
+def mesurer_perft(position, profondeur, classe_plateau):
+    """
+    Exécute perft sur une position avec une représentation du plateau.
+
+    Entrées:
+        position (Position): La position du corpus.
+        profondeur (int): La profondeur de l'énumération.
+        classe_plateau (type): La classe de plateau utilisée.
+
+    Retourne:
+        tuple: ((feuilles, victoires, nulles), positions par seconde).
+    """
+    plateau = position.plateau(classe_plateau)
+    debut = time.perf_counter()
+    feuilles, victoires, nulles, positions = perft(plateau, position.trait, profondeur)
+    duree = time.perf_counter() - debut
+    return (feuilles, victoires, nulles), positions / duree if duree else 0.0
+
+
+def main(arguments=None):
+    parseur = argparse.ArgumentParser(description="Vérifie et mesure la génération des coups et la détection des victoires.")
+    parseur.add_argument('--positions', default=FICHIER_POSITIONS, help="fichier du corpus de positions")
+    parseur.add_argument('--plateaux', nargs='+', default=list(PLATEAUX), choices=list(PLATEAUX))
+    parseur.add_argument('--profondeur', type=int, default=None,
+                         help="ne vérifie que les cas de référence de profondeur au plus égale (défaut : tous)")
+    arguments = parseur.parse_args(arguments)
+
+    positions = {position.nom: position for position in charger_positions(arguments.positions)}
+    erreurs = 0
+    for (nom, profondeur), attendu in REFERENCES.items():
+        if arguments.profondeur is not None and profondeur > arguments.profondeur:
+            continue
+        for plateau in arguments.plateaux:
+            obtenu, vitesse = mesurer_perft(positions[nom], profondeur, PLATEAUX[plateau])
+            correct = obtenu == attendu
+            erreurs += not correct
+            print(f"{nom:<18} {profondeur} {plateau:<10} feuilles {obtenu[0]:8d} victoires {obtenu[1]:6d} "
+                  f"nulles {obtenu[2]:4d} {vitesse:10.0f} positions/s {'ok' if correct else f'ERREUR (attendu {attendu})'}")
+    print(f"{erreurs} erreur(s)")
+    return 1 if erreurs else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,16 @@
+import os
+
 from strategie.minmax import MinimaxStrategy
+from strategie.transposition_table import TableDeTransposition
 
 class JoueurIA:
     """
     Représente un joueur IA dans le jeu.
+
+    Le joueur conserve une table de transposition par couleur d'une partie à l'autre : les scores de la table
+    dépendent de la couleur pour laquelle l'évaluation est faite.
     """
-    def __init__(self, couleur, difficulte, plateau, nom, est_ia=True):
+    def __init__(self, couleur, difficulte, plateau, nom, est_ia=True, nb_travailleurs=1):
         """
         Initialise une nouvelle instance de JoueurIA.
 
@@ -14,25 +20,83 @@ class JoueurIA:
             plateau (Plateau): Plateau de jeu sur lequel l'IA jouera.
             nom (str): Nom du joueur.
             est_ia (bool, optionnel): Spécifie si le joueur est une IA. Default à True.
+            nb_travailleurs (int, optionnel): Nombre de processus utilisés par la recherche. Default à 1.
         """
         self.couleur = couleur
         self.difficulte = difficulte
         self.nom = nom
         self.plateau = plateau  
-        self.strategie = MinimaxStrategy(plateau, couleur, difficulte)
+        self.nb_travailleurs = nb_travailleurs
+        self.strategie = MinimaxStrategy(plateau, couleur, difficulte, nb_travailleurs=nb_travailleurs)
+        self.tables = {couleur: self.strategie.transposition_table}
         self.est_ia = est_ia
 
-    def jouer_coup(self, plateau):
+    def jouer_coup(self, plateau, temps_limite=None, noeuds_limite=None):
         """
-        Détermine et joue le coup suivant basé sur la stratégie Minimax.
+        Détermine le coup suivant basé sur la stratégie Minimax. Si le plateau ou la couleur du joueur ont changé
+        depuis le coup précédent (nouvelle partie d'un tournoi), la stratégie est reconstruite pour ce plateau en
+        conservant la table de transposition de la couleur.
 
-        Entrée:
+        Entrées:
             plateau (Plateau): Le plateau de jeu actuel où le coup sera joué.
+            temps_limite (float, optionnel): Budget en secondes pour ce coup. Par défaut, celui de la difficulté.
+            noeuds_limite (int, optionnel): Nombre maximal de nœuds visités pour ce coup. Par défaut, aucun.
 
         Sortie:
             tuple: Les coordonnées du coup choisi par l'IA.
         """
-        return self.strategie.choisir_coup()
+        if plateau is not self.strategie.plateau or self.couleur != self.strategie.couleur:
+            self.strategie.fermer(liberer_table=False)
+            self.plateau = plateau
+            self.strategie = MinimaxStrategy(plateau, self.couleur, self.difficulte, nb_travailleurs=self.nb_travailleurs,
+                                             transposition_table=self.tables.get(self.couleur))
+            self.tables[self.couleur] = self.strategie.transposition_table
+        return self.strategie.choisir_coup(temps_limite, noeuds_limite)
+
+    def fichier_table(self, dossier, couleur):
+        """Retourne le chemin du fichier de la table de transposition d'une couleur dans un dossier."""
+        return os.path.join(dossier, f"{self.difficulte}_{couleur}.tt")
+
+    def enregistrer_tables(self, dossier):
+        """
+        Enregistre les tables de transposition du joueur (une par couleur jouée) dans un dossier.
+
+        Entrée:
+            dossier (str): Le dossier où écrire les fichiers, créé au besoin.
+        """
+        os.makedirs(dossier, exist_ok=True)
+        for couleur, table in self.tables.items():
+            table.enregistrer(self.fichier_table(dossier, couleur))
+
+    def charger_tables(self, dossier):
+        """
+        Charge dans les tables de transposition du joueur les fichiers d'un dossier écrits par `enregistrer_tables`
+        pour la même difficulté. Les couleurs sans fichier sont ignorées.
+
+        Entrée:
+            dossier (str): Le dossier contenant les fichiers.
+        """
+        for couleur in ('N', 'B'):
+            chemin = self.fichier_table(dossier, couleur)
+            if not os.path.exists(chemin):
+                continue
+            if couleur not in self.tables:
+                self.tables[couleur] = TableDeTransposition(self.strategie.memoire_tt, partagee=self.nb_travailleurs > 1)
+            self.tables[couleur].charger(chemin)
+
+    def noeuds_dernier_coup(self):
+        """
+        Retourne le nombre de nœuds visités pour choisir le dernier coup (recherche principale, processus
+        auxiliaires et solveur de menaces).
+
+        Sortie:
+            int: Le nombre de nœuds.
+        """
+        strategie = self.strategie
+        noeuds = strategie.noeuds + strategie.noeuds_aides
+        if strategie.solveur_menaces is not None:
+            noeuds += strategie.solveur_menaces.noeuds
+        return noeuds
 
     def __str__(self):
         """
@@ -148,9 +148,9 @@ def debuter_partie():
             print("\nL'IA réfléchit...")
             ligne, colonne = strategie_ia.choisir_coup()
             plateau_de_jeu.placer_pierre(ligne, colonne, joueur_actuel.couleur)
-            print(f"L'IA a joué en ligne {ligne + 1}, colonne {colonne + 1}.")
+            print(f"L'IA a joué en ligne {ligne + 1}, colonne {colonne + 1} (profondeur {strategie_ia.profondeur_atteinte}).")
 
-        if plateau_de_jeu.verifier_victoire(ligne, colonne, joueur_actuel.couleur):
+        if plateau_de_jeu.gagnant is not None:
             plateau_de_jeu.afficher_plateau()
             if isinstance(joueur_actuel, JoueurHumain):
                 print(Fore.GREEN + "Vous avez gagné !")
@@ -159,7 +159,7 @@ def debuter_partie():
             break
         joueur_actuel = strategie_ia if joueur_actuel == joueur_n else joueur_n
 
-    if not plateau_de_jeu.verifier_victoire(ligne, colonne, joueur_actuel.couleur):
+    if plateau_de_jeu.gagnant is None:
         print(Fore.GREEN + "Match nul ! Le plateau est plein.")
     
     post_game_options()
@@ -0,0 +1,166 @@
+from plateau.plateau import Plateau
+
+
+# Les masques dépendent uniquement de la taille du plateau : on les calcule une seule fois par taille.
+_GEOMETRIES = {}
+
+
+def _geometrie(taille):
+    """
+    Calcule (ou récupère) les constantes de bits associées à une taille de plateau.
+
+    Entrée:
+        taille (int): La taille du plateau.
+
+    Retourne:
+        tuple: (largeur, masque_plein, decalages, fenetres) où `largeur` est la longueur d'une ligne de bits
+        (taille + une colonne de rembourrage), `masque_plein` contient un bit par case valide, `decalages` les
+        quatre décalages de direction et `fenetres[idx]` les masques des cinq positions de départ d'un alignement
+        passant par la case `idx`, pour chaque direction.
+    """
+    if taille not in _GEOMETRIES:
+        largeur = taille + 1  # La colonne de rembourrage empêche les décalages de déborder d'une ligne sur l'autre
+        masque_plein = 0
+        for ligne in range(taille):
+            masque_plein |= ((1 << taille) - 1) << (ligne * largeur)
+        decalages = (1, largeur, largeur + 1, largeur - 1)  # Horizontal, vertical et deux diagonales
+        fenetres = []
+        for idx in range(taille * largeur):
+            fenetres.append(tuple(
+                sum(1 << (idx - k * d) for k in range(5) if idx - k * d >= 0) for d in decalages
+            ))
+        _GEOMETRIES[taille] = (largeur, masque_plein, decalages, fenetres)
+    return _GEOMETRIES[taille]
+
+
+class PlateauBitboard(Plateau):
+    """
+    Variante du plateau qui maintient, en plus de la matrice héritée de Plateau, un masque de bits par couleur.
+    Les questions "y a-t-il cinq pierres alignées ?", "quelles cases sont vides ?" et "quelles cases touchent une
+    pierre ?" se résolvent alors en quelques décalages et ET logiques.
+
+    La recherche n'en tire aucun profit : elle ne vérifie pas la victoire aux nœuds internes (l'évaluation la
+    détecte), le solveur de menaces lit les fenêtres de motifs et les coups candidats viennent des frontières tenues
+    à jour par Plateau. Le jeu et les tournois utilisent donc Plateau ; cette variante reste vérifiée et mesurée
+    par benchmarks/perft.py.
+
+    Chaque case (ligne, colonne) correspond au bit ligne * largeur + colonne, où largeur = taille + 1 : la colonne
+    supplémentaire reste toujours à zéro et sert de rembourrage pour que les décalages ne passent pas d'une ligne
+    à la suivante.
+
+    Attributs:
+        masques (dict): Masque de bits des pierres posées pour chaque couleur ('N' et 'B').
+        largeur (int): Nombre de bits réservés par ligne du plateau.
+        masque_plein (int): Masque contenant un bit pour chaque case valide du plateau.
+        decalages (tuple): Décalages de bits correspondant aux quatre directions d'alignement.
+    """
+
+    def __init__(self, taille=15):
+        super().__init__(taille)
+        self.largeur, self.masque_plein, self.decalages, self._fenetres = _geometrie(taille)
+        self.masques = {'N': 0, 'B': 0}
+
+    def indice(self, ligne, colonne):
+        """
+        Convertit des coordonnées en position de bit.
+
+        Entrée:
+            ligne (int): L'indice de la ligne.
+            colonne (int): L'indice de la colonne.
+
+        Retourne:
+            int: La position du bit représentant la case.
+        """
+        return ligne * self.largeur + colonne
+
+    def coordonnees(self, masque):
+        """
+        Convertit un masque de bits en liste de coordonnées.
+
+        Entrée:
+            masque (int): Masque de bits de cases du plateau.
+
+        Retourne:
+            list: Liste de tuples (ligne, colonne) des cases présentes dans le masque.
+        """
+        coups = []
+        while masque:
+            bit = masque & -masque
+            ligne, colonne = divmod(bit.bit_length() - 1, self.largeur)
+            coups.append((ligne, colonne))
+            masque ^= bit
+        return coups
+
+    def jouer(self, ligne, colonne, couleur):
+        super().jouer(ligne, colonne, couleur)
+        self.masques[couleur] = self.masques.get(couleur, 0) | (1 << self.indice(ligne, colonne))
+
+    def annuler(self):
+        ligne, colonne, couleur = super().annuler()
+        self.masques[couleur] &= ~(1 << self.indice(ligne, colonne))
+        return ligne, colonne, couleur
+
+    def masque_occupe(self):
+        """Retourne le masque des cases occupées par une pierre, quelle que soit sa couleur."""
+        occupe = 0
+        for masque in self.masques.values():
+            occupe |= masque
+        return occupe
+
+    def masque_vides(self):
+        """Retourne le masque des cases vides du plateau."""
+        return self.masque_plein & ~self.masque_occupe()
+
+    def masque_voisins(self):
+        """
+        Calcule le masque des cases vides adjacentes (8 directions) à au moins une pierre.
+
+        Retourne:
+            int: Masque des cases vides voisines d'une pierre.
+        """
+        occupe = self.masque_occupe()
+        voisins = occupe
+        for d in self.decalages:
+            voisins |= (occupe << d) | (occupe >> d)
+        return voisins & self.masque_plein & ~occupe
+
+    def masque_cinq(self, couleur, decalage):
+        """
+        Calcule les positions de départ des alignements de cinq pierres dans une direction.
+
+        Entrée:
+            couleur (str): Couleur des pierres à tester.
+            decalage (int): Décalage de bits de la direction.
+
+        Retourne:
+            int: Masque dont chaque bit marque le début d'un alignement de cinq pierres.
+        """
+        x = self.masques.get(couleur, 0)
+        return x & (x >> decalage) & (x >> 2 * decalage) & (x >> 3 * decalage) & (x >> 4 * decalage)
+
+    def contient_cinq(self, couleur):
+        """
+        Indique si la couleur possède au moins un alignement de cinq pierres n'importe où sur le plateau.
+
+        Entrée:
+            couleur (str): Couleur des pierres à tester.
+
+        Retourne:
+            bool: True si un alignement de cinq pierres existe.
+        """
+        return any(self.masque_cinq(couleur, d) for d in self.decalages)
+
+    def verifier_victoire(self, ligne, colonne, couleur):
+        fenetres = self._fenetres[self.indice(ligne, colonne)]
+        for d, fenetre in zip(self.decalages, fenetres):
+            if self.masque_cinq(couleur, d) & fenetre:
+                return True
+        return False
+
+    def generer_coups_possibles(self):
+        return self.coordonnees(self.masque_vides())
+
+    def copier(self):
+        new_plateau = super().copier()
+        new_plateau.masques = dict(self.masques)
+        return new_plateau
@@ -0,0 +1,352 @@
+# compact.py
+
+# Plateau compact : les cases sont rangées dans un seul bytearray (un octet par case) au lieu d'une liste de listes de
+# chaînes, et l'instance n'a pas de dictionnaire d'attributs (__slots__). Le tableau est bordé de cases sentinelles :
+# les parcours de lignes s'arrêtent sur le bord sans test de limites.
+# Réservé à la vérification et aux mesures de benchmarks/perft.py : la recherche est plus lente sur ce plateau
+# que sur Plateau (voir PlateauCompact).
+
+from array import array
+
+from colorama import Fore
+
+from plateau.plateau import Plateau
+from plateau.zobrist import cles_zobrist, hash_plateau
+
+MARGE = 4  # Cases sentinelles de chaque côté : un alignement de cinq ne s'étend pas à plus de 4 cases d'une pierre
+
+# Codes des cases
+VIDE = 0
+CODES = {'N': 1, 'B': 2}
+BORD = 3
+SYMBOLES = ('.', 'N', 'B', '#')
+
+# Les géométries dépendent uniquement de la taille du plateau : on les calcule une seule fois par taille.
+_GEOMETRIES = {}
+
+
+def _geometrie(taille):
+    """
+    Calcule (ou récupère) la disposition du tableau bordé associée à une taille de plateau.
+
+    Entrée:
+        taille (int): La taille du plateau.
+
+    Retourne:
+        tuple: (largeur, cases, directions, voisinages) où `largeur` est la longueur d'une ligne du tableau (taille et
+        MARGE sentinelles, partagées avec la ligne suivante), `cases` le tableau d'un plateau vide, `directions` les
+        quatre décalages d'alignement et `voisinages[rayon]` les décalages des cases situées à une distance au plus
+        `rayon` d'une case (pour les rayons 1 et 2).
+    """
+    if taille not in _GEOMETRIES:
+        largeur = taille + MARGE
+        cases = bytearray([BORD]) * ((taille + 2 * MARGE) * largeur)
+        for ligne in range(taille):
+            debut = (ligne + MARGE) * largeur
+            cases[debut:debut + taille] = bytes(taille)
+        directions = (1, largeur, largeur + 1, largeur - 1)  # Horizontal, vertical et deux diagonales
+        voisinages = {
+            rayon: tuple(dx * largeur + dy for dx in range(-rayon, rayon + 1) for dy in range(-rayon, rayon + 1)
+                         if (dx, dy) != (0, 0))
+            for rayon in (1, 2)
+        }
+        _GEOMETRIES[taille] = (largeur, bytes(cases), directions, voisinages)
+    return _GEOMETRIES[taille]
+
+
+class LigneCompacte:
+    """
+    Vue sur une ligne d'un PlateauCompact, qui se lit comme une ligne de la matrice de Plateau ('.', 'N' ou 'B').
+
+    Attributs:
+        cases (bytearray): Le tableau des cases du plateau.
+        debut (int): L'indice dans le tableau de la première case de la ligne.
+        taille (int): Le nombre de cases de la ligne.
+    """
+
+    __slots__ = ('cases', 'debut', 'taille')
+
+    def __init__(self, cases, debut, taille):
+        self.cases = cases
+        self.debut = debut
+        self.taille = taille
+
+    def __getitem__(self, colonne):
+        if isinstance(colonne, slice):
+            return list(self)[colonne]
+        if not 0 <= colonne < self.taille:
+            raise IndexError(colonne)
+        return SYMBOLES[self.cases[self.debut + colonne]]
+
+    def __setitem__(self, colonne, valeur):
+        if not 0 <= colonne < self.taille:
+            raise IndexError(colonne)
+        self.cases[self.debut + colonne] = CODES.get(valeur, VIDE)
+
+    def __len__(self):
+        return self.taille
+
+    def __iter__(self):
+        return (SYMBOLES[code] for code in self.cases[self.debut:self.debut + self.taille])
+
+
+class PlateauCompact:
+    """
+    Variante compacte de Plateau, de même interface : une instance occupe quelques centaines d'octets au lieu de
+    plusieurs kilo-octets, et sa copie se réduit à celle de deux tableaux d'octets.
+
+    La case (ligne, colonne) correspond à l'indice (ligne + MARGE) * largeur + colonne du tableau `cases`, bordé de
+    MARGE lignes sentinelles en haut et en bas et de MARGE colonnes sentinelles entre deux lignes. L'accès par ligne
+    (`plateau[ligne][colonne]`, `plateau.plateau[ligne][colonne]`) passe par des vues LigneCompacte. Les coups
+    candidats ne sont pas tenus à jour comme les frontières de Plateau : ils sont recalculés à la demande à partir
+    des pierres posées.
+
+    Ce plateau ne sert qu'à la vérification et aux mesures de benchmarks/perft.py ; le jeu, les tournois et la
+    recherche utilisent Plateau. La recherche y est environ deux fois plus lente (coups candidats recalculés à
+    chaque nœud, accès aux cases par les vues LigneCompacte), et rien dans le moteur ne tire parti de sa faible
+    empreinte mémoire.
+
+    Attributs:
+        taille (int): La taille du plateau.
+        largeur (int): Longueur d'une ligne du tableau bordé.
+        cases (bytearray): Le contenu des cases : VIDE, CODES['N'], CODES['B'] ou BORD.
+        coups (array): Indices dans `cases` des pierres posées, dans l'ordre, utilisés pour annuler les coups.
+        hash (int): Hash de Zobrist de 64 bits de la position, mis à jour à chaque coup joué ou annulé.
+        nb_pierres (int): Nombre de pierres sur le plateau.
+        gagnant (str): Couleur du joueur qui a aligné cinq pierres, établie par `placer_pierre` (None sinon).
+        coup_gagnant (int): Indice dans l'historique du coup qui a établi le gagnant (None sinon).
+        hashes_symetriques (list): Les hash des 8 transformées symétriques de la position une fois
+            `activer_symetries` appelée (None sinon).
+    """
+
+    __slots__ = ('taille', 'largeur', 'cases', 'coups', 'hash', 'zobrist', 'directions', 'voisinages', 'nb_pierres',
+                 'gagnant', 'coup_gagnant', 'cles_symetriques', 'hashes_symetriques')
+
+    def __init__(self, taille=15):
+        self.taille = taille
+        self.largeur, cases, self.directions, self.voisinages = _geometrie(taille)
+        self.cases = bytearray(cases)
+        self.coups = array('H')
+        self.zobrist = cles_zobrist(taille)
+        self.hash = 0
+        self.nb_pierres = 0
+        self.gagnant = None
+        self.coup_gagnant = None
+        self.cles_symetriques = None
+        self.hashes_symetriques = None
+
+    # Méthodes qui ne dépendent que de l'interface commune
+    afficher_plateau = Plateau.afficher_plateau
+    simuler_coup = Plateau.simuler_coup
+    est_jeu_termine = Plateau.est_jeu_termine
+    est_plein = Plateau.est_plein
+    activer_symetries = Plateau.activer_symetries
+    cle_canonique = Plateau.cle_canonique
+    coups_voisins = Plateau.coups_voisins
+
+    def __getitem__(self, ligne):
+        """
+        Retourne une vue sur une ligne du plateau.
+
+        Entrée:
+            ligne (int): L'index de la ligne à accéder.
+
+        Retourne:
+            LigneCompacte: La ligne, indexable par colonne.
+        """
+        if not 0 <= ligne < self.taille:
+            raise IndexError(ligne)
+        return LigneCompacte(self.cases, (ligne + MARGE) * self.largeur, self.taille)
+
+    def __len__(self):
+        return self.taille
+
+    def __iter__(self):
+        return (self[ligne] for ligne in range(self.taille))
+
+    @property
+    def plateau(self):
+        """Le plateau lui-même, qui se lit ligne par ligne comme la matrice de Plateau."""
+        return self
+
+    @property
+    def historique(self):
+        """Les coups joués sous la forme (ligne, colonne, couleur), dans l'ordre."""
+        return [self.coordonnees(idx) + (SYMBOLES[self.cases[idx]],) for idx in self.coups]
+
+    def indice(self, ligne, colonne):
+        """
+        Convertit des coordonnées en indice du tableau bordé.
+
+        Entrée:
+            ligne (int): L'indice de la ligne.
+            colonne (int): L'indice de la colonne.
+
+        Retourne:
+            int: L'indice de la case dans `cases`.
+        """
+        return (ligne + MARGE) * self.largeur + colonne
+
+    def coordonnees(self, idx):
+        """
+        Convertit un indice du tableau bordé en coordonnées.
+
+        Entrée:
+            idx (int): L'indice d'une case (non sentinelle) dans `cases`.
+
+        Retourne:
+            tuple: Les coordonnées (ligne, colonne) de la case.
+        """
+        ligne, colonne = divmod(idx, self.largeur)
+        return ligne - MARGE, colonne
+
+    def placer_pierre(self, ligne, colonne, couleur):
+        """
+        Place une pierre si la case est vide et si les indices sont valides, puis établit le gagnant si le coup aligne
+        cinq pierres (voir Plateau.placer_pierre).
+
+        Retourne:
+            bool: True si la pierre a été placée avec succès, sinon False.
+        """
+        if 0 <= ligne < self.taille and 0 <= colonne < self.taille:
+            if self.cases[(ligne + MARGE) * self.largeur + colonne] == VIDE:
+                self.jouer(ligne, colonne, couleur)
+                if self.gagnant is None and self.verifier_victoire(ligne, colonne, couleur):
+                    self.gagnant = couleur
+                    self.coup_gagnant = len(self.coups) - 1
+                return True
+            else:
+                print(Fore.RED + "Erreur: La case est déjà occupée.")
+        else:
+            print(Fore.RED + "Erreur: Les indices sont hors des limites du plateau.")
+        return False
+
+    def jouer(self, ligne, colonne, couleur):
+        """
+        Pose une pierre sur le plateau sans vérification et empile le coup pour pouvoir l'annuler.
+
+        Entrée:
+            ligne (int): L'indice de la ligne où placer la pierre.
+            colonne (int): L'indice de la colonne où placer la pierre.
+            couleur (str): La couleur de la pierre à placer.
+        """
+        idx = (ligne + MARGE) * self.largeur + colonne
+        self.cases[idx] = CODES[couleur]
+        self.coups.append(idx)
+        self.nb_pierres += 1
+        case = ligne * self.taille + colonne
+        self.hash ^= self.zobrist[couleur][case]
+        if self.hashes_symetriques is not None:
+            self.hashes_symetriques = [h ^ k for h, k in zip(self.hashes_symetriques, self.cles_symetriques[couleur][case])]
+
+    def annuler(self):
+        """
+        Annule le dernier coup joué et vide la case correspondante.
+
+        Retourne:
+            tuple: Le coup annulé sous la forme (ligne, colonne, couleur).
+        """
+        idx = self.coups.pop()
+        couleur = SYMBOLES[self.cases[idx]]
+        self.cases[idx] = VIDE
+        self.nb_pierres -= 1
+        if self.coup_gagnant == len(self.coups):
+            self.gagnant = None
+            self.coup_gagnant = None
+        ligne, colonne = self.coordonnees(idx)
+        case = ligne * self.taille + colonne
+        self.hash ^= self.zobrist[couleur][case]
+        if self.hashes_symetriques is not None:
+            self.hashes_symetriques = [h ^ k for h, k in zip(self.hashes_symetriques, self.cles_symetriques[couleur][case])]
+        return ligne, colonne, couleur
+
+    def recalculer_hash(self):
+        """
+        Recalcule le hash de Zobrist à partir du contenu du plateau.
+        Nécessaire uniquement si les cases ont été modifiées directement, sans passer par `jouer`.
+        """
+        self.hash = hash_plateau(self)
+        if self.hashes_symetriques is not None:
+            self.activer_symetries()
+
+    def recalculer_pierres(self):
+        """
+        Recompte les pierres du plateau.
+        Nécessaire uniquement si les cases ont été modifiées directement, sans passer par `jouer`.
+        """
+        self.nb_pierres = sum(1 for code in self.cases if code == CODES['N'] or code == CODES['B'])
+
+    def verifier_victoire(self, ligne, colonne, couleur):
+        """
+        Vérifie si la pierre posée à l'emplacement donné fait partie d'un alignement d'au moins cinq pierres.
+        Les sentinelles arrêtent chaque parcours au bord du plateau.
+
+        Entrée:
+            ligne (int): L'indice de la ligne où la pierre a été placée.
+            colonne (int): L'indice de la colonne où la pierre a été placée.
+            couleur (str): La couleur de la pierre placée.
+
+        Retourne:
+            bool: True si le coup est gagnant, sinon False.
+        """
+        cases = self.cases
+        code = CODES[couleur]
+        idx = (ligne + MARGE) * self.largeur + colonne
+        for d in self.directions:
+            compteur = 1
+            p = idx + d
+            while cases[p] == code:
+                compteur += 1
+                p += d
+            p = idx - d
+            while cases[p] == code:
+                compteur += 1
+                p -= d
+            if compteur >= 5:
+                return True
+        return False
+
+    def generer_coups_possibles(self):
+        """
+        Génère la liste des cases vides, ligne par ligne.
+
+        Retourne:
+            list: Liste de tuples (ligne, colonne) des cases vides.
+        """
+        cases = self.cases
+        coups = []
+        for ligne in range(self.taille):
+            debut = (ligne + MARGE) * self.largeur
+            coups.extend((ligne, colonne) for colonne in range(self.taille) if cases[debut + colonne] == VIDE)
+        return coups
+
+    def coups_candidats(self, rayon=1):
+        """
+        Retourne les cases vides situées à une distance au plus `rayon` (en lignes et en colonnes) d'une pierre,
+        calculées à partir des pierres posées.
+
+        Entrée:
+            rayon (int): Rayon du voisinage (1 ou 2).
+
+        Retourne:
+            list: Liste de tuples (ligne, colonne) sans doublons, dans l'ordre des lignes.
+        """
+        cases = self.cases
+        candidats = set()
+        for idx in self.coups:
+            for decalage in self.voisinages[rayon]:
+                if cases[idx + decalage] == VIDE:
+                    candidats.add(idx + decalage)
+        return [self.coordonnees(idx) for idx in sorted(candidats)]
+
+    def copier(self):
+        new_plateau = PlateauCompact(self.taille)
+        new_plateau.cases[:] = self.cases
+        new_plateau.coups = array('H', self.coups)
+        new_plateau.hash = self.hash
+        new_plateau.nb_pierres = self.nb_pierres
+        new_plateau.gagnant = self.gagnant
+        new_plateau.coup_gagnant = self.coup_gagnant
+        new_plateau.cles_symetriques = self.cles_symetriques
+        new_plateau.hashes_symetriques = None if self.hashes_symetriques is None else self.hashes_symetriques[:]
+        return new_plateau
@@ -1,9 +1,42 @@
-import copy
 from colorama import Fore, Style, init
+from plateau.symetries import NB_SYMETRIES, cles_symetriques
+from plateau.zobrist import cles_zobrist, hash_plateau
 
 
 init(autoreset=True)
 
+RAYONS_FRONTIERE = (1, 2)  # Rayons pour lesquels la frontière des coups candidats est tenue à jour
+
+# Les voisinages dépendent uniquement de la taille du plateau et du rayon : on les calcule une seule fois.
+_VOISINAGES = {}
+
+
+def _voisinage(taille, rayon):
+    """
+    Calcule (ou récupère) le voisinage de chaque case pour un rayon donné.
+
+    Entrées:
+        taille (int): La taille du plateau.
+        rayon (int): Distance maximale (en lignes et en colonnes) à la case.
+
+    Retourne:
+        list: Pour chaque case d'indice ligne * taille + colonne, la liste des (indice, (ligne, colonne)) des cases
+        situées à une distance au plus `rayon`, la case elle-même exclue.
+    """
+    if (taille, rayon) not in _VOISINAGES:
+        voisinages = []
+        for x in range(taille):
+            for y in range(taille):
+                voisinages.append([
+                    (nx * taille + ny, (nx, ny))
+                    for nx in range(max(0, x - rayon), min(taille, x + rayon + 1))
+                    for ny in range(max(0, y - rayon), min(taille, y + rayon + 1))
+                    if (nx, ny) != (x, y)
+                ])
+        _VOISINAGES[(taille, rayon)] = voisinages
+    return _VOISINAGES[(taille, rayon)]
+
+
 class Plateau:
     """
     Représente le plateau de jeu pour un jeu de plateau du GOMOKU
@@ -12,6 +45,17 @@ class Plateau:
     Attributs:
         taille (int): La taille du plateau, typiquement 15 pour un jeu de Gomoku.
         plateau (list): Une matrice 2D représentant l'état actuel du plateau avec des pierres placées.
+        historique (list): Pile des coups joués (ligne, colonne, couleur), utilisée pour annuler les coups.
+        hash (int): Hash de Zobrist de 64 bits de la position, mis à jour à chaque coup joué ou annulé.
+        frontieres (dict): Pour chaque rayon de RAYONS_FRONTIERE, l'ensemble des cases vides situées à une distance
+            au plus égale au rayon d'une pierre, mis à jour à chaque coup joué ou annulé.
+        compteurs_voisins (dict): Pour chaque rayon, le nombre de pierres dans le voisinage de chaque case.
+        hashes_symetriques (list): Les hash de Zobrist des 8 transformées symétriques de la position, mis à jour à
+            chaque coup une fois `activer_symetries` appelée (None sinon).
+        nb_pierres (int): Nombre de pierres sur le plateau, mis à jour à chaque coup joué ou annulé.
+        gagnant (str): Couleur du joueur qui a aligné cinq pierres, établie par `placer_pierre` (None sinon).
+        coup_gagnant (int): Indice dans l'historique du coup qui a établi le gagnant (None sinon) ; l'annuler efface
+            le gagnant.
     """
 
     def __init__(self, taille=15):
@@ -23,6 +67,17 @@ class Plateau:
         """
         self.taille = taille
         self.plateau = self.initialiser_plateau()
+        self.historique = []
+        self.zobrist = cles_zobrist(taille)
+        self.hash = 0
+        self.voisinages = {rayon: _voisinage(taille, rayon) for rayon in RAYONS_FRONTIERE}
+        self.compteurs_voisins = {rayon: [0] * (taille * taille) for rayon in RAYONS_FRONTIERE}
+        self.frontieres = {rayon: set() for rayon in RAYONS_FRONTIERE}
+        self.cles_symetriques = None
+        self.hashes_symetriques = None
+        self.nb_pierres = 0
+        self.gagnant = None
+        self.coup_gagnant = None
 
     def __getitem__(self, idx):
         """
@@ -79,6 +134,7 @@ class Plateau:
     def placer_pierre(self, ligne, colonne, couleur):
         """
         Place une pierre de la couleur spécifiée à l'emplacement donné si la case est vide et si les indices sont valides.
+        Le coup est ensuite vérifié : s'il aligne cinq pierres, sa couleur devient le gagnant de la partie.
 
         Entrée:
             ligne (int): L'indice de la ligne où placer la pierre.
@@ -90,7 +146,10 @@ class Plateau:
         """
         if 0 <= ligne < self.taille and 0 <= colonne < self.taille:  # Vérifie si les indices sont dans les limites
             if self.plateau[ligne][colonne] == '.':
-                self.plateau[ligne][colonne] = couleur
+                self.jouer(ligne, colonne, couleur)
+                if self.gagnant is None and self.verifier_victoire(ligne, colonne, couleur):
+                    self.gagnant = couleur
+                    self.coup_gagnant = len(self.historique) - 1
                 return True
             else:
                 print(Fore.RED + "Erreur: La case est déjà occupée.")
@@ -98,6 +157,122 @@ class Plateau:
             print(Fore.RED + "Erreur: Les indices sont hors des limites du plateau.")
         return False
 
+    def jouer(self, ligne, colonne, couleur):
+        """
+        Pose une pierre sur le plateau sans vérification et empile le coup pour pouvoir l'annuler.
+        Utilisé par la recherche, qui ne génère que des coups valides, pour éviter de copier le plateau à chaque nœud.
+        La victoire n'est pas vérifiée : la recherche la détecte par l'évaluation.
+
+        Entrée:
+            ligne (int): L'indice de la ligne où placer la pierre.
+            colonne (int): L'indice de la colonne où placer la pierre.
+            couleur (str): La couleur de la pierre à placer.
+        """
+        self.plateau[ligne][colonne] = couleur
+        self.historique.append((ligne, colonne, couleur))
+        self.nb_pierres += 1
+        idx = ligne * self.taille + colonne
+        self.hash ^= self.zobrist[couleur][idx]
+        if self.hashes_symetriques is not None:
+            self.hashes_symetriques = [h ^ k for h, k in zip(self.hashes_symetriques, self.cles_symetriques[couleur][idx])]
+        grille = self.plateau
+        for rayon in RAYONS_FRONTIERE:
+            compteurs = self.compteurs_voisins[rayon]
+            frontiere = self.frontieres[rayon]
+            frontiere.discard((ligne, colonne))
+            for voisin, case in self.voisinages[rayon][idx]:
+                compteurs[voisin] += 1
+                if compteurs[voisin] == 1 and grille[case[0]][case[1]] == '.':
+                    frontiere.add(case)
+
+    def annuler(self):
+        """
+        Annule le dernier coup joué et vide la case correspondante.
+
+        Retourne:
+            tuple: Le coup annulé sous la forme (ligne, colonne, couleur).
+        """
+        ligne, colonne, couleur = self.historique.pop()
+        self.plateau[ligne][colonne] = '.'
+        self.nb_pierres -= 1
+        if self.coup_gagnant == len(self.historique):
+            self.gagnant = None
+            self.coup_gagnant = None
+        idx = ligne * self.taille + colonne
+        self.hash ^= self.zobrist[couleur][idx]
+        if self.hashes_symetriques is not None:
+            self.hashes_symetriques = [h ^ k for h, k in zip(self.hashes_symetriques, self.cles_symetriques[couleur][idx])]
+        for rayon in RAYONS_FRONTIERE:
+            compteurs = self.compteurs_voisins[rayon]
+            frontiere = self.frontieres[rayon]
+            for voisin, case in self.voisinages[rayon][idx]:
+                compteurs[voisin] -= 1
+                if compteurs[voisin] == 0:
+                    frontiere.discard(case)
+            if compteurs[idx]:
+                frontiere.add((ligne, colonne))
+        return ligne, colonne, couleur
+
+    def recalculer_hash(self):
+        """
+        Recalcule le hash de Zobrist à partir du contenu du plateau.
+        Nécessaire uniquement si la matrice `plateau` a été modifiée directement, sans passer par `jouer`.
+        """
+        self.hash = hash_plateau(self)
+        if self.hashes_symetriques is not None:
+            self.activer_symetries()
+
+    def activer_symetries(self):
+        """
+        Active (ou recalcule) le suivi des hash des 8 transformées symétriques de la position, nécessaires à
+        `cle_canonique`. Le suivi coûte 8 XOR par coup joué ou annulé.
+        """
+        self.cles_symetriques = cles_symetriques(self.taille)
+        hashes = [0] * NB_SYMETRIES
+        for ligne in range(self.taille):
+            for colonne in range(self.taille):
+                cellule = self.plateau[ligne][colonne]
+                if cellule != '.':
+                    hashes = [h ^ k for h, k in zip(hashes, self.cles_symetriques[cellule][ligne * self.taille + colonne])]
+        self.hashes_symetriques = hashes
+
+    def cle_canonique(self):
+        """
+        Retourne la clé canonique de la position : le plus petit des hash de ses 8 transformées symétriques,
+        identique pour toutes les positions symétriques les unes des autres. Nécessite `activer_symetries`.
+
+        Retourne:
+            tuple: (hash, symetrie) où `symetrie` est l'indice de la transformation qui mène à la position
+            canonique (voir plateau/symetries.py).
+        """
+        cle = min(self.hashes_symetriques)
+        return cle, self.hashes_symetriques.index(cle)
+
+    def recalculer_pierres(self):
+        """
+        Recompte les pierres du plateau.
+        Nécessaire uniquement si la matrice `plateau` a été modifiée directement, sans passer par `jouer`.
+        """
+        self.nb_pierres = sum(1 for ligne in self.plateau for cellule in ligne if cellule != '.')
+
+    def recalculer_frontiere(self):
+        """
+        Recalcule les frontières des coups candidats à partir du contenu du plateau.
+        Nécessaire uniquement si la matrice `plateau` a été modifiée directement, sans passer par `jouer`.
+        """
+        for rayon in RAYONS_FRONTIERE:
+            compteurs = [0] * (self.taille * self.taille)
+            for x in range(self.taille):
+                for y in range(self.taille):
+                    if self.plateau[x][y] != '.':
+                        for voisin, _ in self.voisinages[rayon][x * self.taille + y]:
+                            compteurs[voisin] += 1
+            self.compteurs_voisins[rayon] = compteurs
+            self.frontieres[rayon] = {
+                (x, y) for x in range(self.taille) for y in range(self.taille)
+                if compteurs[x * self.taille + y] and self.plateau[x][y] == '.'
+            }
+
     def verifier_victoire(self, ligne, colonne, couleur):
         """
         Vérifie si placer une pierre à l'emplacement donné entraîne une victoire pour le joueur de cette couleur.
@@ -151,16 +326,14 @@ class Plateau:
     
     def est_jeu_termine(self):
         """
-        Vérifie si le plateau est complet. Note : Cette méthode ne vérifie pas les conditions de victoire.
-        Les conditions de victoire doivent être vérifiées séparément après chaque coup.
+        Vérifie si la partie est terminée : un gagnant a été établi par `placer_pierre` ou le plateau est complet.
+        Les coups joués par `jouer` (recherche) ne sont pas vérifiés : pour eux, seul le plateau complet compte.
+        Le nombre de pierres et le gagnant étant tenus à jour, le test se fait en temps constant.
 
         Retourne :
-            bool : True si le plateau est complet, False sinon.
+            bool : True si la partie est terminée, False sinon.
         """
-        for ligne in self.plateau:
-            if '.' in ligne:
-                return False  # Le jeu continue s'il reste des espaces vides
-        return True  # Le jeu est terminé si le plateau est complet
+        return self.gagnant is not None or self.nb_pierres == self.taille * self.taille
 
     def generer_coups_possibles(self):
         """
@@ -175,11 +348,34 @@ class Plateau:
                 if self.plateau[i][j] == '.':
                     coups.append((i, j))
         return coups
-    
+
+    def coups_voisins(self):
+        """
+        Génère la liste des cases vides adjacentes (8 directions) à au moins une pierre déjà placée.
+
+        Retourne:
+            list: Liste de tuples (ligne, colonne) sans doublons.
+        """
+        return self.coups_candidats(1)
+
+    def coups_candidats(self, rayon=1):
+        """
+        Retourne les cases vides situées à une distance au plus `rayon` (en lignes et en colonnes) d'une pierre.
+        La frontière étant tenue à jour par `jouer` et `annuler`, il suffit d'en copier le contenu : le coût ne
+        dépend pas de la taille du plateau.
+
+        Entrée:
+            rayon (int): Rayon du voisinage, parmi RAYONS_FRONTIERE.
+
+        Retourne:
+            list: Liste de tuples (ligne, colonne) sans doublons.
+        """
+        return list(self.frontieres[rayon])
+
     def simuler_coup(self, coup, couleur):
         """
         Simule un coup sur le plateau sans modifier l'état actuel du plateau.
-        Utilise `deepcopy` pour une copie complète du plateau, permettant la manipulation sans affecter l'état original.
+        Travaille sur une copie du plateau ; la recherche préfère `jouer`/`annuler`, qui évitent toute copie.
 
         Paramètres:
             coup (tuple): Tuple de (ligne, colonne) indiquant où la pierre est placée.
@@ -188,23 +384,25 @@ class Plateau:
         Retourne:
             Plateau: Une nouvelle instance de Plateau représentant l'état après le coup.
         """
-        # Crée une copie du plateau
-        nouveau_plateau = copy.deepcopy(self.plateau)
-        ligne, colonne = coup
-        nouveau_plateau[ligne][colonne] = couleur
-        
-        # Crée une nouvelle instance de Plateau avec la copie modifiée
-        plateau_temp = Plateau(self.taille)
-        plateau_temp.plateau = nouveau_plateau
-        
+        plateau_temp = self.copier()
+        plateau_temp.jouer(coup[0], coup[1], couleur)
         return plateau_temp
     
    
     def est_plein(self):
         """Retourne True si toutes les cases du plateau sont remplies."""
-        return all(cell != '.' for row in self.plateau for cell in row)
+        return self.nb_pierres == self.taille * self.taille
 
     def copier(self):
-        new_plateau = Plateau(self.taille)
+        new_plateau = type(self)(self.taille)
         new_plateau.plateau = [row[:] for row in self.plateau]
+        new_plateau.historique = self.historique[:]
+        new_plateau.hash = self.hash
+        new_plateau.compteurs_voisins = {rayon: compteurs[:] for rayon, compteurs in self.compteurs_voisins.items()}
+        new_plateau.frontieres = {rayon: set(frontiere) for rayon, frontiere in self.frontieres.items()}
+        new_plateau.cles_symetriques = self.cles_symetriques
+        new_plateau.hashes_symetriques = None if self.hashes_symetriques is None else self.hashes_symetriques[:]
+        new_plateau.nb_pierres = self.nb_pierres
+        new_plateau.gagnant = self.gagnant
+        new_plateau.coup_gagnant = self.coup_gagnant
         return new_plateau
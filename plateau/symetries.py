@@ -0,0 +1,73 @@
+# symetries.py
+
+# Le plateau carré a 8 symétries (4 rotations et 4 réflexions). Deux positions symétriques l'une de l'autre ont la
+# même valeur ; pour qu'elles partagent une entrée de la table de transposition, leur clé est la plus petite des
+# 8 clés de Zobrist des positions transformées (clé canonique). Le hash de la transformée d'une position s'obtient
+# sans la construire : c'est le XOR, pour chaque pierre, du nombre de Zobrist de la case image.
+
+from plateau.zobrist import cles_zobrist
+
+NB_SYMETRIES = 8
+
+# Indice de la symétrie inverse de chaque symétrie (seules les rotations d'un quart de tour ne sont pas involutives)
+INVERSES = (0, 3, 2, 1, 4, 5, 6, 7)
+
+_CLES_SYMETRIQUES = {}
+
+
+def transformer(ligne, colonne, symetrie, taille):
+    """
+    Retourne l'image d'une case par une symétrie du plateau.
+
+    Entrées:
+        ligne (int): L'indice de la ligne de la case.
+        colonne (int): L'indice de la colonne de la case.
+        symetrie (int): L'indice de la symétrie : 0 identité, 1 à 3 rotations d'un, deux et trois quarts de tour,
+            4 et 5 réflexions verticale et horizontale, 6 et 7 réflexions selon les deux diagonales.
+        taille (int): La taille du plateau.
+
+    Retourne:
+        tuple: Les coordonnées (ligne, colonne) de l'image de la case.
+    """
+    n = taille - 1
+    if symetrie == 0:
+        return ligne, colonne
+    if symetrie == 1:
+        return colonne, n - ligne
+    if symetrie == 2:
+        return n - ligne, n - colonne
+    if symetrie == 3:
+        return n - colonne, ligne
+    if symetrie == 4:
+        return ligne, n - colonne
+    if symetrie == 5:
+        return n - ligne, colonne
+    if symetrie == 6:
+        return colonne, ligne
+    return n - colonne, n - ligne
+
+
+def cles_symetriques(taille):
+    """
+    Calcule (ou récupère) les nombres de Zobrist à combiner aux 8 hash symétriques lorsqu'une pierre est posée.
+
+    Entrée:
+        taille (int): La taille du plateau.
+
+    Retourne:
+        dict: Pour chaque couleur ('N' et 'B'), une liste indexée par ligne * taille + colonne de tuples de
+        8 entiers : le nombre de Zobrist de l'image de la case par chaque symétrie.
+    """
+    if taille not in _CLES_SYMETRIQUES:
+        cles = cles_zobrist(taille)
+        _CLES_SYMETRIQUES[taille] = {
+            couleur: [
+                tuple(
+                    cles[couleur][ligne * taille + colonne]
+                    for ligne, colonne in (transformer(x, y, s, taille) for s in range(NB_SYMETRIES))
+                )
+                for x in range(taille) for y in range(taille)
+            ]
+            for couleur in ('N', 'B')
+        }
+    return _CLES_SYMETRIQUES[taille]
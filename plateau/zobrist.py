@@ -0,0 +1,55 @@
+# zobrist.py
+
+# Le hachage de Zobrist associe un nombre aléatoire de 64 bits à chaque couple (case, couleur).
+# Le hash d'une position est le XOR des nombres de ses pierres : poser ou retirer une pierre ne coûte qu'un XOR.
+
+import random
+
+# Graine fixe : les hash doivent être identiques d'une exécution à l'autre (fichiers sauvegardés, tournois reproductibles).
+GRAINE_ZOBRIST = 0x5EED_601C
+
+# Nombre combiné au hash lorsque c'est au joueur maximisant de jouer : une même disposition de pierres
+# avec un trait différent correspond à deux nœuds distincts de la recherche.
+CLE_TRAIT = random.Random(GRAINE_ZOBRIST).getrandbits(64)
+
+_CLES = {}
+
+
+def cles_zobrist(taille):
+    """
+    Retourne les nombres de Zobrist d'un plateau de taille donnée, générés une seule fois par taille.
+
+    Entrée:
+        taille (int): La taille du plateau.
+
+    Retourne:
+        dict: Pour chaque couleur ('N' et 'B'), une liste de taille * taille entiers de 64 bits
+        indexée par ligne * taille + colonne.
+    """
+    if taille not in _CLES:
+        generateur = random.Random(GRAINE_ZOBRIST + taille)
+        _CLES[taille] = {
+            couleur: [generateur.getrandbits(64) for _ in range(taille * taille)]
+            for couleur in ('N', 'B')
+        }
+    return _CLES[taille]
+
+
+def hash_plateau(plateau):
+    """
+    Calcule le hash de Zobrist d'un plateau en parcourant toutes ses cases.
+
+    Entrée:
+        plateau (Plateau): Le plateau à hacher.
+
+    Retourne:
+        int: Le hash de Zobrist de la position.
+    """
+    cles = cles_zobrist(plateau.taille)
+    h = 0
+    for ligne in range(plateau.taille):
+        for colonne in range(plateau.taille):
+            cellule = plateau.plateau[ligne][colonne]
+            if cellule != '.':
+                h ^= cles[cellule][ligne * plateau.taille + colonne]
+    return h
@@ -0,0 +1,221 @@
+# bibliotheque_ouvertures.py
+
+# Bibliothèque d'ouvertures persistante, lue par projection en mémoire (mmap).
+#
+# Les premiers coups d'une partie sont les plus coûteux à chercher (beaucoup de candidats, table de transposition
+# vide) et les plus répétitifs d'une partie à l'autre. La bibliothèque est construite hors ligne par des recherches
+# profondes sur les premiers plis, puis enregistrée dans un fichier binaire compact :
+#   - un en-tête ENTETE : signature, version, taille du plateau, nombre d'entrées ;
+#   - des enregistrements ENREGISTREMENT triés par clé : clé de la position (64 bits) et coup (ligne * taille + colonne).
+# À l'exécution, le fichier est projeté en mémoire sans être lu ni décodé : une recherche est une dichotomie sur les
+# enregistrements, et seules les pages consultées sont chargées par le système.
+
+import mmap
+import os
+import struct
+
+from plateau.zobrist import CLE_TRAIT
+
+SIGNATURE = b'GMKO'
+VERSION = 1
+ENTETE = struct.Struct('<4sHHI')  # Signature, version, taille du plateau, nombre d'entrées
+ENREGISTREMENT = struct.Struct('<QH')  # Clé de la position, coup
+
+# Fichier chargé par défaut par MinimaxStrategy, pour les difficultés qui utilisent la bibliothèque
+FICHIER_BIBLIOTHEQUE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ouvertures.bin')
+
+_OUVERTES = {}
+
+
+def cle_position(plateau, couleur):
+    """
+    Retourne la clé d'une position dans la bibliothèque : le hash de Zobrist des pierres, combiné au camp qui a le
+    trait (une même disposition de pierres n'a pas le même meilleur coup selon le camp qui joue).
+
+    Entrées:
+        plateau (Plateau): Le plateau de jeu.
+        couleur (str): La couleur qui a le trait.
+
+    Retourne:
+        int: La clé de 64 bits de la position.
+    """
+    return plateau.hash ^ CLE_TRAIT if couleur == 'N' else plateau.hash
+
+
+def ecrire_bibliotheque(chemin, taille, entrees):
+    """
+    Enregistre une bibliothèque d'ouvertures dans un fichier binaire.
+
+    Entrées:
+        chemin (str): Le chemin du fichier à écrire.
+        taille (int): La taille du plateau.
+        entrees (dict): Pour chaque clé de position (voir `cle_position`), le coup (ligne, colonne) à jouer.
+    """
+    with open(chemin, 'wb') as fichier:
+        fichier.write(ENTETE.pack(SIGNATURE, VERSION, taille, len(entrees)))
+        for cle in sorted(entrees):
+            ligne, colonne = entrees[cle]
+            fichier.write(ENREGISTREMENT.pack(cle, ligne * taille + colonne))
+
+
+def ouvrir_bibliotheque(chemin=FICHIER_BIBLIOTHEQUE):
+    """
+    Ouvre une bibliothèque d'ouvertures ; le fichier n'est projeté qu'une fois par processus.
+
+    Entrée:
+        chemin (str, optionnel): Le chemin du fichier. Par défaut, la bibliothèque fournie avec le jeu.
+
+    Retourne:
+        BibliothequeOuvertures: La bibliothèque, ou None si le fichier n'existe pas.
+    """
+    chemin = os.path.abspath(chemin)
+    if chemin not in _OUVERTES:
+        _OUVERTES[chemin] = BibliothequeOuvertures(chemin) if os.path.exists(chemin) else None
+    return _OUVERTES[chemin]
+
+
+class BibliothequeOuvertures:
+    """
+    Bibliothèque d'ouvertures en lecture seule, projetée en mémoire.
+
+    Attributs:
+        chemin (str): Le chemin du fichier.
+        taille (int): La taille du plateau pour laquelle la bibliothèque a été construite.
+        nb_entrees (int): Le nombre de positions de la bibliothèque.
+        consultations (int): Nombre de recherches effectuées.
+        trouvees (int): Nombre de recherches ayant retourné un coup.
+    """
+
+    def __init__(self, chemin):
+        self.chemin = chemin
+        with open(chemin, 'rb') as fichier:
+            self.memoire = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.memoire) < ENTETE.size:
+            raise ValueError(f"Bibliothèque d'ouvertures invalide: {chemin}")
+        signature, version, self.taille, self.nb_entrees = ENTETE.unpack_from(self.memoire, 0)
+        if signature != SIGNATURE or version != VERSION:
+            raise ValueError(f"Bibliothèque d'ouvertures invalide ou de version non prise en charge: {chemin}")
+        if len(self.memoire) < ENTETE.size + self.nb_entrees * ENREGISTREMENT.size:
+            raise ValueError(f"Bibliothèque d'ouvertures tronquée: {chemin}")
+        self.consultations = 0
+        self.trouvees = 0
+
+    def __len__(self):
+        return self.nb_entrees
+
+    def cle(self, indice):
+        """Retourne la clé de l'enregistrement d'indice donné."""
+        return ENREGISTREMENT.unpack_from(self.memoire, ENTETE.size + indice * ENREGISTREMENT.size)[0]
+
+    def chercher(self, plateau, couleur):
+        """
+        Cherche le coup de la bibliothèque pour une position.
+
+        Entrées:
+            plateau (Plateau): Le plateau de jeu.
+            couleur (str): La couleur qui a le trait.
+
+        Retourne:
+            tuple: Le coup (ligne, colonne) à jouer, ou None si la position n'est pas dans la bibliothèque (ou si
+            le coup enregistré n'est pas jouable, en cas de collision de clés).
+        """
+        self.consultations += 1
+        if plateau.taille != self.taille:
+            return None
+        cle = cle_position(plateau, couleur)
+        debut, fin = 0, self.nb_entrees
+        while debut < fin:
+            milieu = (debut + fin) // 2
+            if self.cle(milieu) < cle:
+                debut = milieu + 1
+            else:
+                fin = milieu
+        if debut == self.nb_entrees:
+            return None
+        cle_trouvee, indice_case = ENREGISTREMENT.unpack_from(self.memoire, ENTETE.size + debut * ENREGISTREMENT.size)
+        if cle_trouvee != cle:
+            return None
+        ligne, colonne = divmod(indice_case, self.taille)
+        if plateau.plateau[ligne][colonne] != '.':
+            return None
+        self.trouvees += 1
+        return ligne, colonne
+
+
+def construire_bibliotheque(chemin, nb_plis=4, nb_variantes=3, difficulte='difficile', profondeur=None,
+                            temps_par_position=None, taille=15):
+    """
+    Construit une bibliothèque d'ouvertures par des recherches profondes sur les premiers plis, et l'enregistre.
+    Chaque position est cherchée pour le camp qui a le trait ; l'arbre est développé par le meilleur coup trouvé et
+    par les `nb_variantes - 1` coups suivants de l'ordre de la racine, pour les deux camps.
+
+    Entrées:
+        chemin (str): Le chemin du fichier à écrire.
+        nb_plis (int): Nombre de plis couverts par la bibliothèque.
+        nb_variantes (int): Nombre de coups développés à chaque position.
+        difficulte (str): Difficulté dont l'évaluation et le solveur de menaces sont utilisés.
+        profondeur (int, optionnel): Profondeur de recherche. Par défaut, celle de la difficulté.
+        temps_par_position (float, optionnel): Budget en secondes de chaque recherche. Par défaut, aucun.
+        taille (int): La taille du plateau.
+
+    Retourne:
+        int: Le nombre de positions enregistrées.
+    """
+    from plateau.plateau import Plateau
+    from strategie.minmax import MinimaxStrategy
+
+    plateau = Plateau(taille)
+    strategies = {}
+    for couleur in ('N', 'B'):
+        strategie = MinimaxStrategy(plateau, couleur, difficulte, temps_limite=temps_par_position)
+        strategie.temps_limite = temps_par_position
+        strategie.bibliotheque = None
+        if profondeur is not None:
+            strategie.profondeur = profondeur
+        strategies[couleur] = strategie
+    entrees = {}
+
+    def developper(pli):
+        couleur = 'N' if pli % 2 == 0 else 'B'
+        cle = cle_position(plateau, couleur)
+        if pli >= nb_plis or cle in entrees:
+            return
+        if pli == 0:
+            meilleur = (taille // 2, taille // 2)
+            variantes = [meilleur]
+        else:
+            strategie = strategies[couleur]
+            meilleur = strategie.choisir_coup()
+            if meilleur is None:
+                return
+            strategie.evaluateur.synchroniser(plateau)
+            classement = strategie.ordonner_racine(strategie.generer_coups_possibles(plateau))
+            variantes = [meilleur] + [coup for coup in classement if coup != meilleur][:nb_variantes - 1]
+        entrees[cle] = meilleur
+        for coup in variantes:
+            plateau.jouer(coup[0], coup[1], couleur)
+            try:
+                if not plateau.verifier_victoire(coup[0], coup[1], couleur):
+                    developper(pli + 1)
+            finally:
+                plateau.annuler()
+
+    developper(0)
+    ecrire_bibliotheque(chemin, taille, entrees)
+    return len(entrees)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parseur = argparse.ArgumentParser(description="Construit la bibliothèque d'ouvertures.")
+    parseur.add_argument('chemin', nargs='?', default=FICHIER_BIBLIOTHEQUE)
+    parseur.add_argument('--plis', type=int, default=4)
+    parseur.add_argument('--variantes', type=int, default=3)
+    parseur.add_argument('--difficulte', default='difficile')
+    parseur.add_argument('--profondeur', type=int, default=None)
+    parseur.add_argument('--temps', type=float, default=None)
+    arguments = parseur.parse_args()
+    nb = construire_bibliotheque(arguments.chemin, arguments.plis, arguments.variantes, arguments.difficulte,
+                                 arguments.profondeur, arguments.temps)
+    print(f"{nb} positions enregistrées dans {arguments.chemin}")
@@ -2,6 +2,46 @@
 #from plateau.plateau import Plateau
 #import numpy as np
 
+# Les difficultés facile et difficile sont évaluées en un seul parcours : chaque ligne du plateau (rangée, colonne
+# ou diagonale) est lue une fois, et les fenêtres rencontrées alimentent un vecteur de caractéristiques (séries,
+# menaces, besoins défensifs, formations ouvertes ; voir motifs.py) auquel les poids de la difficulté sont appliqués
+# à la fin. Les difficultés très facile et moyen gardent leur parcours des seules pierres, plus rapide sur les
+# plateaux peu remplis. L'implémentation d'origine, en plusieurs parcours du plateau, est conservée
+# (`evaluer_reference`) pour vérifier que les scores sont identiques (voir benchmarks/equivalence.py).
+
+import heapq
+
+from strategie.evaluation_incrementale import DIRECTIONS, lignes_du_plateau
+from strategie.motifs import (BORD, CARACTERISTIQUES, CENTRE, CLASSES, DECALAGE_ENTREE, INDICES, LUI, MOI, TABLES,
+                              VECTEURS, VIDE, ponderer)
+
+_LIGNES_PLATES = {}
+
+
+def _lignes_plates(taille):
+    """
+    Récupère les lignes de lignes_du_plateau sous forme d'indices de cases ligne * taille + colonne.
+
+    Entrée:
+        taille (int): La taille du plateau.
+
+    Retourne:
+        tuple: (lignes, positions) où `lignes` contient, pour chaque ligne, le tuple de ses indices suivi de 5 fois
+        l'indice taille * taille, qui désigne une case de bord : la fenêtre glissante n'a pas à tester la fin de la
+        ligne. `positions[indice]` donne les couples (numéro de ligne, rang dans la ligne) des 4 lignes qui passent
+        par la case.
+    """
+    if taille not in _LIGNES_PLATES:
+        bord = taille * taille
+        lignes = [tuple(x * taille + y for x, y in ligne) + (bord,) * 5 for ligne in lignes_du_plateau(taille)[0]]
+        positions = [[] for _ in range(bord)]
+        for numero, ligne in enumerate(lignes):
+            for rang, indice in enumerate(ligne[:-5]):
+                positions[indice].append((numero, rang))
+        _LIGNES_PLATES[taille] = (lignes, [tuple(cases) for cases in positions])
+    return _LIGNES_PLATES[taille]
+
+
 class Evaluation:    
     """
     Classe d'évaluation pour une stratégie de jeu.
@@ -42,6 +82,117 @@ class Evaluation:
         }[difficulte]
         self.evaluer = getattr(self, f'evaluer_{difficulte}')
 
+    def caracteristiques(self, plateau):
+        """
+        Lit une seule fois chaque ligne du plateau en y faisant glisser la fenêtre de 9 cases, et compte les classes
+        de fenêtres rencontrées (voir motifs.py). Hors du niveau facile, dont les potentiels concernent toutes les
+        cases vides, une fenêtre sans pierre n'a aucune caractéristique : seule la portion de chaque ligne située à
+        moins de 5 cases d'une pierre est lue.
+
+        Entrée:
+            plateau (Plateau): L'état actuel du plateau de jeu.
+
+        Sortie:
+            tuple: (vecteur, potentiels) où `vecteur` donne la valeur de chaque caractéristique de CARACTERISTIQUES
+            pour le plateau, et `potentiels` le potentiel d'attaque de chaque case vide (niveau facile uniquement,
+            None sinon).
+        """
+        etats = {'.': VIDE, self.couleur: MOI, self.couleur_adverse: LUI}
+        cases = [etats[cellule] for rangee in plateau.plateau for cellule in rangee]
+        cases.append(BORD)
+        classes = CLASSES
+        comptes = [0] * len(VECTEURS)
+        table_potentiel = TABLES['facile'][2]
+        potentiels = [0] * len(cases) if self.difficulte == 'facile' else None
+        lignes, positions = _lignes_plates(plateau.taille)
+
+        if potentiels is not None:
+            for ligne in lignes:
+                code = 0x55 * BORD  # Les 4 cases qui précèdent la ligne
+                for j in range(5):
+                    code |= cases[ligne[j]] << (2 * (CENTRE + j))
+                for p in range(len(ligne) - 5):
+                    comptes[classes[code]] += 1
+                    potentiels[ligne[p]] += table_potentiel[code]
+                    code = (code >> 2) | (cases[ligne[p + 5]] << DECALAGE_ENTREE)
+        else:
+            # Portion de chaque ligne à lire, [debut, fin[ : les cases à moins de 5 cases d'une pierre
+            debuts = {}
+            fins = {}
+            for indice, etat in enumerate(cases):
+                if etat == MOI or etat == LUI:
+                    for numero, rang in positions[indice]:
+                        if numero not in debuts:
+                            debuts[numero] = fins[numero] = rang
+                        elif rang < debuts[numero]:
+                            debuts[numero] = rang
+                        elif rang > fins[numero]:
+                            fins[numero] = rang
+            for numero, debut in debuts.items():
+                ligne = lignes[numero]
+                debut = max(debut - 4, 0)
+                fin = min(fins[numero] + 5, len(ligne) - 5)
+                code = 0
+                for j in range(9):  # Fenêtre centrée sur la première case lue
+                    code |= (cases[ligne[debut + j - 4]] if debut + j >= 4 else BORD) << (2 * j)
+                for p in range(debut, fin):
+                    comptes[classes[code]] += 1
+                    code = (code >> 2) | (cases[ligne[p + 5]] << DECALAGE_ENTREE)
+
+        vecteur = [0] * len(CARACTERISTIQUES)
+        for classe, nombre in enumerate(comptes):
+            if nombre:
+                for indice, valeur in VECTEURS[classe]:
+                    vecteur[indice] += nombre * valeur
+        if potentiels is not None:
+            potentiels = [potentiel for potentiel, etat in zip(potentiels, cases) if etat == VIDE]
+        return vecteur, potentiels
+
+    def nb_pierres(self, vecteur):
+        """Retourne le nombre de pierres du plateau à partir de son vecteur de caractéristiques."""
+        return vecteur[INDICES['pierre']] // len(DIRECTIONS)  # Chaque pierre est lue dans les 4 directions
+
+    def evaluer_reference(self, plateau):
+        """
+        Évalue le plateau avec l'implémentation d'origine de la difficulté, en plusieurs parcours du plateau.
+        Bien plus lente, elle sert uniquement à vérifier que l'évaluation en un seul parcours donne les mêmes scores
+        (les difficultés très facile et moyen utilisent toujours leur implémentation d'origine).
+
+        Entrée:
+            plateau (Plateau): L'état actuel du plateau de jeu.
+
+        Sortie:
+            int: Le score de la position, identique à celui de `evaluer`.
+        """
+        if self.difficulte in ('tres_facile', 'moyen'):
+            return self.evaluer(plateau)
+
+        if self.difficulte == 'facile':
+            score = 0
+            nb_coups_joues = len([p for row in plateau for p in row if p != '.'])  # Compte les coups déjà joués
+            # Évaluation défensive seulement pour les douze premiers coups de chaque joueur
+            if nb_coups_joues <= 24:
+                score_defensif = self.evaluer_defense_simple(plateau, self.couleur_adverse)
+                if score_defensif < 0:  # Appliquer la défense seulement si elle est nécessaire
+                    score += score_defensif
+            # Évaluation offensive constante, indépendamment du nombre de coups
+            return score + self.evaluer_attaques_potentielles(plateau, self.couleur)
+
+        score = 0
+        menaces_potentielles = self.analyser_menaces_multiples(plateau, self.couleur_adverse)
+        if menaces_potentielles:
+            # Applique une pénalité si des menaces adverses sont détectées.
+            score -= 1000 * len(menaces_potentielles)
+        # Parcourt chaque case du plateau pour calculer le score basé sur les positions actuelles.
+        for ligne in range(plateau.taille):
+            for colonne in range(plateau.taille):
+                if plateau.plateau[ligne][colonne] == self.couleur:
+                    score += self.evaluer_alignement_potentiel(plateau, ligne, colonne, self.couleur)
+                elif plateau.plateau[ligne][colonne] == self.couleur_adverse:
+                    score -= self.evaluer_alignement_potentiel(plateau, ligne, colonne, self.couleur_adverse)
+        # Ajoute des points pour les configurations offensives qui permettent des extensions multiples.
+        score += self.evaluer_formations_ouvertes(plateau, self.couleur)
+        return score
 
     # POUR UN NIVEAU FACILE
     def evaluer_facile(self, plateau):
@@ -55,19 +206,17 @@ class Evaluation:
             score (int): Score basé sur le nombre de pierres alignées directement.
 
        """
+        vecteur, potentiels = self.caracteristiques(plateau)
         score = 0
-        nb_coups_joues = len([p for row in plateau for p in row if p != '.'])  # Compte les coups déjà joués
 
-        # Évaluation défensive seulement pour les six premiers coups de chaque joueur
-        if nb_coups_joues <= 24:  # Chaque joueur a joué
-            score_defensif = self.evaluer_defense_simple(plateau, self.couleur_adverse)
+        # Évaluation défensive seulement pour les douze premiers coups de chaque joueur
+        if self.nb_pierres(vecteur) <= 24:
+            _, score_defensif = ponderer(vecteur, 'facile')
             if score_defensif < 0:  # Appliquer la défense seulement si elle est nécessaire
                 score += score_defensif
 
-        # Évaluation offensive constante, indépendamment du nombre de coups
-        score += self.evaluer_attaques_potentielles(plateau, self.couleur)
-
-        return score
+        # Évaluation offensive constante : les trois meilleurs potentiels d'attaque
+        return score + sum(heapq.nlargest(3, potentiels))
     
     def evaluer_defense_simple(self, plateau, couleur_adverse):
         """
@@ -316,23 +465,10 @@ class Evaluation:
         Sortie:
             int: Score global basé sur la détection des menaces adverses et l'optimisation des configurations offensives.
         """
-        score = 0
-        menaces_potentielles = self.analyser_menaces_multiples(plateau, self.couleur_adverse)
-        if menaces_potentielles:
-            # Applique une pénalité si des menaces adverses sont détectées.
-            score -= 1000 * len(menaces_potentielles)
-
-        # Parcourt chaque case du plateau pour calculer le score basé sur les positions actuelles.
-        for ligne in range(plateau.taille):
-            for colonne in range(plateau.taille):
-                if plateau.plateau[ligne][colonne] == self.couleur:
-                    score += self.evaluer_alignement_potentiel(plateau, ligne, colonne, self.couleur)
-                elif plateau.plateau[ligne][colonne] == self.couleur_adverse:
-                    score -= self.evaluer_alignement_potentiel(plateau, ligne, colonne, self.couleur_adverse)
-
-        # Ajoute des points pour les configurations offensives qui permettent des extensions multiples.
-        score += self.evaluer_formations_ouvertes(plateau, self.couleur)
-        return score
+        vecteur, _ = self.caracteristiques(plateau)
+        # Pénalité pour chaque menace adverse (case vide et direction), séries des deux joueurs, puis points pour les
+        # configurations offensives qui permettent des extensions multiples (voir motifs.ponderer).
+        return ponderer(vecteur, 'difficile')[0]
 
     def analyser_menaces_multiples(self, plateau, couleur):
         """
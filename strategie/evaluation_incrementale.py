@@ -0,0 +1,153 @@
+# evaluation_incrementale.py
+
+# Toutes les fonctions d'évaluation de Evaluation se décomposent en contributions par ligne (rangée, colonne ou
+# diagonale) : chaque motif examiné ne regarde que des cases alignées dans une même direction. Un coup ne modifie
+# donc que les 4 lignes qui passent par sa case. L'évaluateur incrémental garde la contribution de chaque ligne et,
+# à chaque coup joué ou annulé, ne recalcule que ces 4 lignes ; l'évaluation d'une feuille devient une simple somme.
+# La contribution d'une ligne est lue dans les tables de motifs précalculées (voir motifs.py).
+
+import heapq
+
+from strategie.motifs import VIDE, MOI, LUI, scorer_ligne
+
+DIRECTIONS = [(0, 1), (1, 0), (1, 1), (-1, 1)]
+
+_LIGNES = {}
+
+
+def lignes_du_plateau(taille):
+    """
+    Énumère toutes les lignes du plateau, chacune parcourue dans le sens de sa direction.
+
+    Entrée:
+        taille (int): La taille du plateau.
+
+    Retourne:
+        tuple: (lignes, lignes_par_case) où `lignes` est la liste des lignes (listes de coordonnées) et
+        `lignes_par_case[(x, y)]` la liste des indices des 4 lignes passant par la case.
+    """
+    if taille not in _LIGNES:
+        lignes = []
+        lignes_par_case = {(x, y): [] for x in range(taille) for y in range(taille)}
+        for dx, dy in DIRECTIONS:
+            for x in range(taille):
+                for y in range(taille):
+                    # Une ligne commence sur une case dont la précédente (dans la direction) est hors du plateau
+                    px, py = x - dx, y - dy
+                    if 0 <= px < taille and 0 <= py < taille:
+                        continue
+                    cases = []
+                    cx, cy = x, y
+                    while 0 <= cx < taille and 0 <= cy < taille:
+                        cases.append((cx, cy))
+                        cx, cy = cx + dx, cy + dy
+                    for case in cases:
+                        lignes_par_case[case].append(len(lignes))
+                    lignes.append(cases)
+        _LIGNES[taille] = (lignes, lignes_par_case)
+    return _LIGNES[taille]
+
+
+class EvaluationIncrementale:
+    """
+    Évaluateur incrémental, équivalent à Evaluation.evaluer pour une couleur et une difficulté données.
+
+    Il mémorise la contribution de chaque ligne du plateau et leurs totaux. Après chaque coup joué sur le plateau,
+    `jouer` recalcule les 4 lignes passant par la case ; `annuler` restaure les valeurs précédentes depuis une pile.
+
+    Attributs:
+        plateau (Plateau): Le plateau suivi.
+        couleur (str): Couleur pour laquelle l'évaluation est faite.
+        couleur_adverse (str): Couleur adverse.
+        difficulte (str): Niveau de difficulté reproduit.
+        principal (int): Somme des contributions principales des lignes.
+        defensif (int): Somme des contributions défensives des lignes.
+        nb_pierres (int): Nombre de pierres sur le plateau.
+    """
+
+    def __init__(self, plateau, couleur, difficulte='moyen'):
+        self.couleur = couleur
+        self.couleur_adverse = 'N' if couleur == 'B' else 'B'
+        self.difficulte = difficulte
+        self.etats = {'.': VIDE, couleur: MOI, self.couleur_adverse: LUI}
+        self.synchroniser(plateau)
+
+    def synchroniser(self, plateau=None):
+        """
+        Recalcule toutes les lignes à partir du contenu du plateau. À appeler avant une recherche, le plateau
+        ayant pu être modifié par d'autres joueurs depuis la précédente.
+
+        Entrée:
+            plateau (Plateau, optionnel): Nouveau plateau à suivre ; par défaut, le plateau actuel.
+        """
+        if plateau is not None:
+            self.plateau = plateau
+        self.lignes, self.lignes_par_case = lignes_du_plateau(self.plateau.taille)
+        self.scores = [self.scorer(i) for i in range(len(self.lignes))]
+        self.principal = sum(s[0] for s in self.scores)
+        self.defensif = sum(s[1] for s in self.scores)
+        self.potentiels = {}
+        if self.difficulte == 'facile':
+            for i, (_, _, potentiels) in enumerate(self.scores):
+                for case, valeur in zip(self.lignes[i], potentiels):
+                    self.potentiels[case] = self.potentiels.get(case, 0) + valeur
+        self.nb_pierres = self.plateau.nb_pierres
+        self.pile = []
+
+    def scorer(self, indice):
+        """Calcule la contribution de la ligne d'indice donné à partir du plateau."""
+        grille = self.plateau.plateau
+        etats = self.etats
+        return scorer_ligne([etats[grille[x][y]] for x, y in self.lignes[indice]], self.difficulte)
+
+    def jouer(self, ligne, colonne):
+        """
+        Met à jour l'évaluation après qu'une pierre a été posée sur le plateau en (ligne, colonne).
+
+        Entrée:
+            ligne (int): L'indice de la ligne du coup joué.
+            colonne (int): L'indice de la colonne du coup joué.
+        """
+        anciens = []
+        for i in self.lignes_par_case[(ligne, colonne)]:
+            ancien = self.scores[i]
+            nouveau = self.scorer(i)
+            self.remplacer(i, ancien, nouveau)
+            anciens.append((i, ancien))
+        self.pile.append(anciens)
+        self.nb_pierres += 1
+
+    def annuler(self):
+        """Restaure l'évaluation d'avant le dernier appel à `jouer` (le coup doit aussi être annulé sur le plateau)."""
+        for i, ancien in reversed(self.pile.pop()):
+            self.remplacer(i, self.scores[i], ancien)
+        self.nb_pierres -= 1
+
+    def remplacer(self, indice, ancien, nouveau):
+        """Remplace la contribution d'une ligne et répercute la différence sur les totaux."""
+        self.scores[indice] = nouveau
+        self.principal += nouveau[0] - ancien[0]
+        self.defensif += nouveau[1] - ancien[1]
+        if nouveau[2] is not None:
+            potentiels = self.potentiels
+            for case, a, n in zip(self.lignes[indice], ancien[2], nouveau[2]):
+                if a != n:
+                    potentiels[case] += n - a
+
+    def evaluer(self):
+        """
+        Retourne le score de la position courante, identique à celui de Evaluation.evaluer.
+
+        Sortie:
+            int: Le score de la position pour la couleur et la difficulté de l'évaluateur.
+        """
+        if self.difficulte == 'facile':
+            score = 0
+            if self.nb_pierres <= 24 and self.defensif < 0:
+                score += self.defensif
+            grille = self.plateau.plateau
+            vides = [valeur for (x, y), valeur in self.potentiels.items() if grille[x][y] == '.']
+            return score + sum(heapq.nlargest(3, vides))
+        if self.difficulte == 'moyen' and self.nb_pierres <= 30:
+            return self.principal + self.defensif
+        return self.principal
@@ -0,0 +1,173 @@
+# evaluation_vectorielle.py
+
+# Évaluation vectorisée de tous les coups candidats d'une position en un seul lot.
+#
+# Le plateau est représenté par un tableau NumPy int8 (VIDE, MOI, LUI), bordé de 4 cases BORD de chaque côté.
+# Les codes de fenêtre de toutes les cases, dans les 4 directions, sont obtenus par 9 sommes de tranches décalées ;
+# l'évaluation de la position est alors la somme des lectures des tables de motifs (voir motifs.py).
+# Poser une pierre en c ne modifie que les codes des cases situées à 4 cases au plus de c dans chaque direction :
+# pour K coups candidats, les K x 4 x 9 codes modifiés sont lus en une seule indexation et la différence de score de
+# chaque enfant s'en déduit sans jamais recopier le plateau.
+
+import numpy as np
+
+from strategie.evaluation_incrementale import DIRECTIONS
+from strategie.motifs import TABLES, VIDE, MOI, LUI, BORD, CENTRE, LARGEUR_FENETRE
+
+_MARGE = CENTRE  # Nombre de cases BORD ajoutées de chaque côté du plateau
+_DECALAGES = np.arange(-CENTRE, LARGEUR_FENETRE - CENTRE)  # Position des cases de la fenêtre par rapport au centre
+_TABLES_NP = {}
+
+
+def _tables(difficulte):
+    """Retourne les tables de motifs d'une difficulté sous forme de tableaux NumPy (vues, sans copie)."""
+    if difficulte not in _TABLES_NP:
+        _TABLES_NP[difficulte] = tuple(np.frombuffer(table, dtype=np.intc) for table in TABLES[difficulte])
+    return _TABLES_NP[difficulte]
+
+
+class EvaluationVectorielle:
+    """
+    Évaluation équivalente à Evaluation.evaluer, capable de noter tous les coups candidats d'une position en un lot.
+
+    Attributs:
+        couleur (str): Couleur pour laquelle l'évaluation est faite.
+        couleur_adverse (str): Couleur adverse.
+        difficulte (str): Niveau de difficulté reproduit.
+    """
+
+    def __init__(self, couleur, difficulte='moyen'):
+        if difficulte not in TABLES:
+            raise ValueError(f"Difficulté non reconnue: {difficulte}")
+        self.couleur = couleur
+        self.couleur_adverse = 'N' if couleur == 'B' else 'B'
+        self.difficulte = difficulte
+        self.table_principale, self.table_defensive, self.table_potentiel = _tables(difficulte)
+
+    def etats(self, plateau):
+        """
+        Convertit le plateau en tableau d'états bordé.
+
+        Entrée:
+            plateau (Plateau): Le plateau à convertir.
+
+        Retourne:
+            numpy.ndarray: Tableau int8 de taille (taille + 8, taille + 8) contenant VIDE, MOI, LUI ou BORD.
+        """
+        grille = np.array(plateau.plateau)
+        etats = np.full((plateau.taille + 2 * _MARGE,) * 2, BORD, dtype=np.int8)
+        interieur = etats[_MARGE:-_MARGE, _MARGE:-_MARGE]
+        interieur[:] = VIDE
+        interieur[grille == self.couleur] = MOI
+        interieur[grille == self.couleur_adverse] = LUI
+        return etats
+
+    @staticmethod
+    def codes(etats):
+        """
+        Calcule le code de fenêtre de chaque case du plateau dans les 4 directions.
+
+        Entrée:
+            etats (numpy.ndarray): Tableau d'états bordé retourné par `etats`.
+
+        Retourne:
+            numpy.ndarray: Tableau int32 de forme (4, taille + 8, taille + 8) ; les codes des cases de la bordure
+            valent 0 et ne doivent pas être lus dans les tables.
+        """
+        taille = etats.shape[0] - 2 * _MARGE
+        codes = np.zeros((len(DIRECTIONS),) + etats.shape, dtype=np.int32)
+        for d, (dx, dy) in enumerate(DIRECTIONS):
+            code = codes[d, _MARGE:-_MARGE, _MARGE:-_MARGE]
+            for j, o in enumerate(_DECALAGES):
+                x, y = _MARGE + o * dx, _MARGE + o * dy
+                code |= etats[x:x + taille, y:y + taille].astype(np.int32) << (2 * j)
+        return codes
+
+    def evaluer(self, plateau):
+        """
+        Retourne le score de la position, identique à celui de Evaluation.evaluer.
+
+        Entrée:
+            plateau (Plateau): Le plateau à évaluer.
+
+        Retourne:
+            int: Le score de la position.
+        """
+        etats = self.etats(plateau)
+        interieur = (slice(None), slice(_MARGE, -_MARGE), slice(_MARGE, -_MARGE))
+        codes = self.codes(etats)[interieur]
+        principal = self.table_principale[codes].sum(dtype=np.int64, keepdims=True).ravel()
+        defensif = self.table_defensive[codes].sum(dtype=np.int64, keepdims=True).ravel()
+        nb_pierres = int(np.count_nonzero(etats[interieur[1:]]))
+        potentiels = self.table_potentiel[codes].sum(axis=0, dtype=np.int64)
+        potentiels[etats[interieur[1:]] != VIDE] = 0
+        return int(self._combiner(principal, defensif, nb_pierres, potentiels.reshape(1, -1))[0])
+
+    def _combiner(self, principal, defensif, nb_pierres, potentiels):
+        """
+        Combine les sommes partielles comme EvaluationIncrementale.evaluer, pour une ou plusieurs positions.
+        `potentiels` contient une ligne par position, les cases non vides valant 0 (le potentiel d'une case vide
+        est toujours strictement positif).
+        """
+        if self.difficulte == 'facile':
+            scores = np.partition(potentiels, -3, axis=1)[:, -3:].sum(axis=1)
+            if nb_pierres <= 24:
+                scores += np.minimum(defensif, 0)
+            return scores
+        if self.difficulte == 'moyen' and nb_pierres <= 30:
+            return principal + defensif
+        return principal
+
+    def evaluer_coups(self, plateau, coups, couleur=None):
+        """
+        Évalue en un lot les positions obtenues en jouant chacun des coups candidats.
+
+        Entrées:
+            plateau (Plateau): La position de départ (non modifiée).
+            coups (list): Les coups candidats (ligne, colonne), sur des cases vides.
+            couleur (str, optionnel): Couleur de la pierre jouée ; par défaut, celle de l'évaluation.
+
+        Retourne:
+            numpy.ndarray: Le score (int64) de la position obtenue après chaque coup, dans l'ordre de `coups`.
+        """
+        if not coups:
+            return np.zeros(0, dtype=np.int64)
+        etats = self.etats(plateau)
+        codes = self.codes(etats)
+        valides = np.zeros(etats.shape, dtype=bool)
+        valides[_MARGE:-_MARGE, _MARGE:-_MARGE] = True
+        pierre = MOI if couleur is None or couleur == self.couleur else LUI
+
+        coups = np.asarray(coups, dtype=np.intp) + _MARGE
+        # Cases dont la fenêtre contient le coup : (direction, coup, position du coup dans la fenêtre)
+        directions = np.array(DIRECTIONS, dtype=np.intp)
+        xs = coups[None, :, 0, None] - _DECALAGES[None, None, :] * directions[:, 0, None, None]
+        ys = coups[None, :, 1, None] - _DECALAGES[None, None, :] * directions[:, 1, None, None]
+        indices_direction = np.arange(len(DIRECTIONS))[:, None, None]
+        anciens = codes[indices_direction, xs, ys]
+        nouveaux = anciens | (pierre << (2 * (_DECALAGES + CENTRE))).astype(np.int32)
+        touches = valides[xs, ys]
+
+        def variation(table):
+            return np.where(touches, table[nouveaux].astype(np.int64) - table[anciens], 0)
+
+        interieur = (slice(_MARGE, -_MARGE), slice(_MARGE, -_MARGE))
+        principal = int(self.table_principale[codes[(slice(None),) + interieur]].sum(dtype=np.int64))
+        defensif = int(self.table_defensive[codes[(slice(None),) + interieur]].sum(dtype=np.int64))
+        nb_pierres = int(np.count_nonzero(etats[interieur])) + 1
+        principaux = principal + variation(self.table_principale).sum(axis=(0, 2))
+        defensifs = defensif + variation(self.table_defensive).sum(axis=(0, 2))
+
+        potentiels = np.zeros((len(coups), 0), dtype=np.int64)
+        if self.difficulte == 'facile':
+            # Potentiel d'attaque de chaque case vide de chaque enfant : base commune + variations dispersées
+            k = len(coups)
+            cote = etats.shape[0]
+            base = np.where(valides, self.table_potentiel[codes].sum(axis=0, dtype=np.int64), 0)
+            potentiels = np.repeat(base.reshape(1, -1), k, axis=0)
+            cibles = np.arange(k)[None, :, None] * (cote * cote) + xs * cote + ys
+            np.add.at(potentiels.reshape(-1), cibles.ravel(), variation(self.table_potentiel).ravel())
+            occupees = np.repeat((etats != VIDE).reshape(1, -1), k, axis=0)
+            occupees[np.arange(k), coups[:, 0] * cote + coups[:, 1]] = True
+            potentiels[occupees] = 0
+        return self._combiner(principaux, defensifs, nb_pierres, potentiels)
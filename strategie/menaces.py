@@ -0,0 +1,329 @@
+# menaces.py
+
+# Recherche dans l'espace des menaces, lancée avant la recherche principale.
+#
+# Une partie de Gomoku est souvent décidée par une suite de "quatre" (alignements qui menacent de faire cinq au coup
+# suivant) : l'adversaire n'a alors qu'une seule réponse possible à chaque coup. Cette suite, appelée VCF (victoire
+# par quatres continus), est invisible pour un minimax de profondeur 4 dès qu'elle compte plus de deux quatres.
+# Le solveur n'explore que ces coups forcés : à chaque quatre de l'attaquant correspond l'unique case de blocage du
+# défenseur, ce qui permet de prouver un gain forcé sur une dizaine de coups en quelques centaines de nœuds.
+# Les motifs (cinq, quatre, quatre ouvert) sont lus dans la table MOTIFS de motifs.py.
+
+import time
+
+from strategie.evaluation_incrementale import DIRECTIONS
+from strategie.motifs import MOTIFS, VIDE, MOI, LUI, BORD, CENTRE, LARGEUR_FENETRE, CINQ, QUATRE, QUATRE_OUVERT
+
+NOEUDS_PAR_DEFAUT = 2000
+PROFONDEUR_VCF = 10  # Nombre maximal de quatres consécutifs de l'attaquant
+
+# Nature du coup retourné par SolveurMenaces.analyser
+VICTOIRE = 'victoire'  # Le coup fait cinq
+BLOCAGE = 'blocage'  # Le coup empêche l'adversaire de faire cinq au coup suivant
+VCF = 'vcf'  # Premier coup d'une suite de quatres gagnante
+DEFENSE = 'defense'  # Seul coup trouvé qui réfute la suite de quatres gagnante de l'adversaire
+
+_FENETRES = {}
+
+
+def _fenetres(taille):
+    """
+    Calcule (ou récupère) les cases des fenêtres de 9 cases centrées sur chaque case, dans les 4 directions.
+
+    Entrée:
+        taille (int): La taille du plateau.
+
+    Retourne:
+        list: Pour chaque case d'indice ligne * taille + colonne, 4 tuples (un par direction) de 9 coordonnées
+        (ligne, colonne), None pour les cases hors du plateau.
+    """
+    if taille not in _FENETRES:
+        fenetres = []
+        for x in range(taille):
+            for y in range(taille):
+                fenetres.append([
+                    tuple(
+                        (x + o * dx, y + o * dy) if 0 <= x + o * dx < taille and 0 <= y + o * dy < taille else None
+                        for o in range(-CENTRE, LARGEUR_FENETRE - CENTRE)
+                    )
+                    for dx, dy in DIRECTIONS
+                ])
+        _FENETRES[taille] = fenetres
+    return _FENETRES[taille]
+
+
+class BudgetEpuise(Exception):
+    """Levée lorsque le solveur a épuisé le budget de nœuds ou de temps d'une analyse."""
+
+
+class SolveurMenaces:
+    """
+    Cherche les coups forcés d'une position : cinq immédiat, blocage d'un quatre adverse, suite de quatres gagnante
+    (VCF) pour le joueur ou défense contre celle de l'adversaire.
+
+    Un gain trouvé est prouvé : chaque réponse du défenseur est la seule qui ne perde pas immédiatement. Une suite
+    non trouvée dans le budget de nœuds ne prouve rien, et la recherche principale prend alors le relais.
+
+    Attributs:
+        noeuds_limite (int): Nombre maximal de nœuds par analyse.
+        profondeur_max (int): Nombre maximal de quatres consécutifs explorés.
+        noeuds (int): Nombre de nœuds visités lors de la dernière analyse.
+        limite (int): Nombre maximal de nœuds de l'analyse en cours.
+        echeance (float): Instant (time.perf_counter) auquel l'analyse en cours est interrompue, ou None.
+        analyses (int): Nombre d'analyses effectuées.
+        courts_circuits (dict): Pour chaque nature de coup, nombre d'analyses ayant retourné un coup forcé.
+        restrictions (int): Nombre d'analyses ayant trouvé plusieurs défenses, explorées en premier à la racine.
+        budgets_epuises (int): Nombre d'analyses interrompues faute de budget.
+    """
+
+    def __init__(self, noeuds_limite=NOEUDS_PAR_DEFAUT, profondeur_max=PROFONDEUR_VCF):
+        self.noeuds_limite = noeuds_limite
+        self.profondeur_max = profondeur_max
+        self.noeuds = 0
+        self.limite = noeuds_limite
+        self.echeance = None
+        self.reinitialiser_statistiques()
+
+    def reinitialiser_statistiques(self):
+        """Remet à zéro les compteurs d'analyses."""
+        self.analyses = 0
+        self.courts_circuits = {VICTOIRE: 0, BLOCAGE: 0, VCF: 0, DEFENSE: 0}
+        self.restrictions = 0
+        self.budgets_epuises = 0
+
+    def taux_court_circuit(self):
+        """Retourne la proportion des analyses ayant évité la recherche principale (entre 0 et 1)."""
+        return sum(self.courts_circuits.values()) / self.analyses if self.analyses else 0.0
+
+    def motifs_case(self, plateau, ligne, colonne, couleur):
+        """
+        Classe, dans chaque direction, le motif obtenu en jouant `couleur` sur une case vide.
+
+        Entrées:
+            plateau (Plateau): Le plateau de jeu.
+            ligne (int): L'indice de la ligne de la case.
+            colonne (int): L'indice de la colonne de la case.
+            couleur (str): La couleur qui jouerait sur la case.
+
+        Retourne:
+            list: Les 4 motifs (AUCUN, DEUX, ..., CINQ de motifs.py), un par direction.
+        """
+        grille = plateau.plateau
+        motifs = []
+        for fenetre in _fenetres(plateau.taille)[ligne * plateau.taille + colonne]:
+            code = 0
+            for j, case in enumerate(fenetre):
+                if case is None:
+                    etat = BORD
+                else:
+                    valeur = grille[case[0]][case[1]]
+                    etat = VIDE if valeur == '.' else MOI if valeur == couleur else LUI
+                code |= etat << (2 * j)
+            motifs.append(MOTIFS[code])
+        return motifs
+
+    def cases_gagnantes(self, plateau, couleur, autour=None):
+        """
+        Retourne les cases vides sur lesquelles `couleur` ferait cinq.
+
+        Entrées:
+            plateau (Plateau): Le plateau de jeu.
+            couleur (str): La couleur testée.
+            autour (tuple, optionnel): Si fourni, seules les cases alignées avec cette case à 4 cases au plus sont
+                examinées (suffisant juste après un coup joué sur cette case).
+
+        Retourne:
+            list: Les coordonnées (ligne, colonne) des cases gagnantes.
+        """
+        if autour is None:
+            cases = plateau.coups_candidats(1)  # Une case qui complète cinq touche forcément une pierre
+        else:
+            cases = set()
+            for fenetre in _fenetres(plateau.taille)[autour[0] * plateau.taille + autour[1]]:
+                cases.update(case for case in fenetre if case is not None and plateau.plateau[case[0]][case[1]] == '.')
+        return [case for case in cases if CINQ in self.motifs_case(plateau, case[0], case[1], couleur)]
+
+    def coups_quatre(self, plateau, couleur):
+        """
+        Retourne les coups qui forment un quatre (sans faire cinq), les quatres ouverts en premier.
+
+        Entrées:
+            plateau (Plateau): Le plateau de jeu.
+            couleur (str): La couleur qui joue.
+
+        Retourne:
+            list: Les coordonnées (ligne, colonne) des coups formant un quatre.
+        """
+        ouverts, simples = [], []
+        for case in plateau.coups_candidats(2):  # Un quatre complète une fenêtre de 5 contenant déjà 3 pierres
+            meilleur = max(self.motifs_case(plateau, case[0], case[1], couleur))
+            if meilleur == QUATRE_OUVERT:
+                ouverts.append(case)
+            elif meilleur == QUATRE:
+                simples.append(case)
+        return sorted(ouverts) + sorted(simples)
+
+    def compter_noeud(self):
+        """Compte un nœud visité et interrompt l'analyse si le budget est épuisé."""
+        self.noeuds += 1
+        if self.noeuds > self.limite:
+            raise BudgetEpuise()
+        if self.echeance is not None and self.noeuds % 16 == 0 and time.perf_counter() >= self.echeance:
+            raise BudgetEpuise()
+
+    def chercher_vcf(self, plateau, couleur):
+        """
+        Cherche une suite de quatres gagnante pour `couleur`, qui a le trait.
+
+        Entrées:
+            plateau (Plateau): Le plateau de jeu (modifié pendant la recherche puis restauré).
+            couleur (str): La couleur de l'attaquant.
+
+        Retourne:
+            list: La suite de coups (attaquant, défenseur, attaquant, ...) menant au gain, ou None.
+        """
+        adverse = 'N' if couleur == 'B' else 'B'
+        if self.cases_gagnantes(plateau, adverse):
+            return None  # Un quatre du défenseur doit d'abord être bloqué : la suite n'est plus forcée
+        return self._vcf(plateau, couleur, adverse, self.profondeur_max)
+
+    def _vcf(self, plateau, couleur, adverse, profondeur):
+        """Explore les quatres de l'attaquant ; retourne la suite gagnante ou None."""
+        self.compter_noeud()
+        if profondeur == 0:
+            return None
+        for coup in self.coups_quatre(plateau, couleur):
+            plateau.jouer(coup[0], coup[1], couleur)
+            try:
+                gagnantes = self.cases_gagnantes(plateau, couleur, coup)
+                if len(gagnantes) >= 2:
+                    return [coup]  # Deux façons de faire cinq : le défenseur ne peut en bloquer qu'une
+                if not gagnantes:
+                    continue
+                blocage = gagnantes[0]
+                plateau.jouer(blocage[0], blocage[1], adverse)
+                try:
+                    # Si le blocage forme un quatre pour le défenseur, la suite n'est plus forcée
+                    if self.cases_gagnantes(plateau, adverse, blocage):
+                        continue
+                    suite = self._vcf(plateau, couleur, adverse, profondeur - 1)
+                finally:
+                    plateau.annuler()
+                if suite is not None:
+                    return [coup, blocage] + suite
+            finally:
+                plateau.annuler()
+        return None
+
+    def analyser(self, plateau, couleur, noeuds_limite=None, echeance=None):
+        """
+        Analyse les coups forcés de la position pour `couleur`, qui a le trait.
+
+        Entrées:
+            plateau (Plateau): Le plateau de jeu (restauré à la fin de l'analyse).
+            couleur (str): La couleur qui joue.
+            noeuds_limite (int, optionnel): Budget de nœuds de cette analyse, s'il est inférieur à celui du solveur.
+            echeance (float, optionnel): Instant (time.perf_counter) au-delà duquel l'analyse est abandonnée.
+
+        Retourne:
+            tuple: (coup, nature, defenses) où `coup` est le coup forcé trouvé (ou None), `nature` sa nature
+            (VICTOIRE, BLOCAGE, VCF ou DEFENSE, None si aucun coup forcé) et `defenses` la liste des coups qui
+            réfutent la suite de quatres gagnante de l'adversaire, lorsqu'il en existe une et que plusieurs coups
+            la réfutent (liste vide sinon).
+        """
+        self.analyses += 1
+        self.noeuds = 0
+        self.limite = self.noeuds_limite if noeuds_limite is None else min(noeuds_limite, self.noeuds_limite)
+        self.echeance = echeance
+        adverse = 'N' if couleur == 'B' else 'B'
+        coup, nature, defenses = None, None, []
+        try:
+            gagnantes = sorted(self.cases_gagnantes(plateau, couleur))
+            menaces = sorted(self.cases_gagnantes(plateau, adverse))
+            if gagnantes:
+                coup, nature = gagnantes[0], VICTOIRE
+            elif menaces:
+                coup, nature = menaces[0], BLOCAGE
+            else:
+                suite = self.chercher_vcf(plateau, couleur)
+                if suite is not None:
+                    coup, nature = suite[0], VCF
+                else:
+                    suite_adverse = self.chercher_vcf(plateau, adverse)
+                    if suite_adverse is not None:
+                        defenses = self.chercher_defenses(plateau, couleur, suite_adverse)
+                        if len(defenses) == 1:
+                            coup, nature, defenses = defenses[0], DEFENSE, []
+        except BudgetEpuise:
+            self.budgets_epuises += 1
+            coup, nature, defenses = None, None, []
+        if nature is not None:
+            self.courts_circuits[nature] += 1
+        elif defenses:
+            self.restrictions += 1
+        return coup, nature, defenses
+
+    def chercher_defenses(self, plateau, couleur, suite_adverse):
+        """
+        Cherche les coups qui réfutent la suite de quatres gagnante de l'adversaire. Les candidats sont les cases de
+        cette suite, les cases de toutes les menaces de l'adversaire (cases où il ferait cinq ou quatre, et cases où
+        il ferait cinq après chacun de ses quatres) et les quatres du défenseur, qui obligent l'adversaire à bloquer.
+
+        Entrées:
+            plateau (Plateau): Le plateau de jeu (restauré à la fin de la recherche).
+            couleur (str): La couleur du défenseur, qui a le trait.
+            suite_adverse (list): La suite de coups gagnante de l'adversaire.
+
+        Retourne:
+            list: Les coups après lesquels l'adversaire n'a plus de suite de quatres gagnante.
+        """
+        adverse = 'N' if couleur == 'B' else 'B'
+        candidats = set(suite_adverse) | set(self.cases_gagnantes(plateau, adverse))
+        for coup in self.coups_quatre(plateau, adverse):
+            candidats.add(coup)
+            plateau.jouer(coup[0], coup[1], adverse)
+            try:
+                candidats.update(self.cases_gagnantes(plateau, adverse, coup))
+            finally:
+                plateau.annuler()
+        quatres = set(self.coups_quatre(plateau, couleur))
+        candidats |= quatres
+
+        defenses = []
+        for coup in sorted(candidats):
+            plateau.jouer(coup[0], coup[1], couleur)
+            try:
+                if coup in quatres:
+                    refute = self.refute_par_quatre(plateau, couleur, coup)
+                else:
+                    refute = self.chercher_vcf(plateau, adverse) is None
+            finally:
+                plateau.annuler()
+            if refute:
+                defenses.append(coup)
+        return defenses
+
+    def refute_par_quatre(self, plateau, couleur, coup):
+        """
+        Vérifie qu'un quatre du défenseur, qui vient d'être joué, réfute les suites de quatres de l'adversaire.
+        L'adversaire doit bloquer ; le quatre réfute ses suites si, après ce blocage, il n'en a plus aucune même en
+        ayant le trait (en réalité, le défenseur rejoue).
+
+        Entrées:
+            plateau (Plateau): Le plateau de jeu, le quatre joué (restauré à la fin de la vérification).
+            couleur (str): La couleur du défenseur.
+            coup (tuple): Les coordonnées (ligne, colonne) du quatre.
+
+        Retourne:
+            bool: True si le quatre réfute les suites de quatres de l'adversaire.
+        """
+        adverse = 'N' if couleur == 'B' else 'B'
+        gagnantes = self.cases_gagnantes(plateau, couleur, coup)
+        if len(gagnantes) >= 2:
+            return True  # Quatre ouvert : l'adversaire, sans cinq à faire, ne peut bloquer les deux cases
+        blocage = gagnantes[0]
+        plateau.jouer(blocage[0], blocage[1], adverse)
+        try:
+            return self.chercher_vcf(plateau, adverse) is None
+        finally:
+            plateau.annuler()
@@ -1,7 +1,110 @@
+import multiprocessing
 import numpy as np
 import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from strategie.bibliotheque_ouvertures import ouvrir_bibliotheque
 from strategie.evaluation import Evaluation  
-from strategie.transposition_table import TableDeTransposition
+from strategie.evaluation_incrementale import EvaluationIncrementale
+from strategie.evaluation_vectorielle import EvaluationVectorielle
+from strategie.menaces import SolveurMenaces
+from strategie.ordonnancement import OrdonnanceurCoups
+from strategie.statistiques import StatistiquesRecherche, ALEATOIRE, BIBLIOTHEQUE, MENACES, RECHERCHE
+from strategie.transposition_table import TableDeTransposition, MEMOIRE_PAR_DEFAUT, EXACTE, BORNE_INFERIEURE, BORNE_SUPERIEURE
+from plateau.plateau import RAYONS_FRONTIERE
+from plateau.symetries import INVERSES, transformer
+from plateau.zobrist import CLE_TRAIT
+
+# Profondeur maximale et budget de temps par coup (en secondes) de chaque difficulté
+LIMITES_DIFFICULTE = {
+    'tres_facile': (1, None),
+    'facile': (2, 1.0),
+    'moyen': (3, 2.0),
+    'difficile': (4, 3.0),
+}
+
+# Rayon du voisinage des pierres dans lequel les coups candidats sont cherchés (voir Plateau.coups_candidats)
+RAYONS_DIFFICULTE = {
+    'tres_facile': 1,
+    'facile': 1,
+    'moyen': 1,
+    'difficile': 2,
+}
+
+# Budget de nœuds du solveur de menaces lancé avant la recherche principale (0 pour ne pas le lancer)
+NOEUDS_MENACES_DIFFICULTE = {
+    'tres_facile': 0,
+    'facile': 0,
+    'moyen': 1000,
+    'difficile': 3000,
+}
+
+# Difficultés qui jouent les coups de la bibliothèque d'ouvertures lorsque la position y figure. La bibliothèque est
+# construite par des recherches de la difficulté 'difficile' : l'activer pour une autre difficulté lui ferait jouer
+# les coups de 'difficile' en ouverture.
+BIBLIOTHEQUE_DIFFICULTE = {
+    'tres_facile': False,
+    'facile': False,
+    'moyen': False,
+    'difficile': True,
+}
+
+# Demi-largeur de la fenêtre d'aspiration de la racine, dans l'unité des scores de chaque difficulté
+FENETRES_ASPIRATION = {
+    'tres_facile': 2,
+    'facile': 100,
+    'moyen': 10000,
+    'difficile': 3000,
+}
+
+
+class TempsEcoule(Exception):
+    """Levée pendant la recherche lorsque le budget de temps ou de nœuds du coup est épuisé."""
+
+
+# État des processus auxiliaires de la recherche parallèle, initialisé une fois par processus
+_ETAT_AIDE = {}
+
+
+def _initialiser_aide(arret):
+    """Initialise un processus auxiliaire : mémorise le signal d'arrêt partagé avec le processus principal."""
+    _ETAT_AIDE['arret'] = arret
+    _ETAT_AIDE['tables'] = {}
+
+
+def _rechercher_en_aide(spec):
+    """
+    Recherche lancée dans un processus auxiliaire : la même position est explorée avec son propre ordre des coups
+    de la racine, en remplissant la table de transposition partagée avec le processus principal.
+
+    Entrée:
+        spec (dict): Description sérialisable de la recherche (position, joueur, budget, table partagée, indice).
+
+    Retourne:
+        int: Le nombre de nœuds visités.
+    """
+    tables = _ETAT_AIDE['tables']
+    if spec['nom_memoire'] not in tables:
+        tables[spec['nom_memoire']] = TableDeTransposition(spec['memoire_tt'], nom_memoire=spec['nom_memoire'])
+    table = tables[spec['nom_memoire']]
+    table.age = spec['age']
+
+    plateau = spec['classe_plateau'](spec['taille'])
+    for ligne, colonne, couleur in spec['historique']:
+        plateau.jouer(ligne, colonne, couleur)
+    strategie = MinimaxStrategy(plateau, spec['couleur'], spec['difficulte'], rayon=spec['rayon'],
+                                transposition_table=table, symetries=spec['symetries'])
+    strategie.profondeur = spec['profondeur']
+    strategie.arret = _ETAT_AIDE['arret']
+
+    # Chaque processus explore les coups de la racine (hormis le premier) dans un ordre décalé différent
+    coups = spec['coups']
+    indice = spec['indice']
+    if len(coups) > 2:
+        decalage = indice % (len(coups) - 1)
+        coups = coups[:1] + coups[1 + decalage:] + coups[1:1 + decalage]
+    strategie.approfondir(coups, time.perf_counter(), spec['temps_limite'], spec['noeuds_limite'], indice % 2, True)
+    return strategie.noeuds
 
 
 class MinimaxStrategy:
@@ -14,38 +117,100 @@ class MinimaxStrategy:
         plateau (Plateau): L'objet représentant l'état actuel du jeu.
         couleur (str): Couleur des pièces de l'IA ('B' pour blanc, 'N' pour noir).
         couleur_adverse (str): Couleur des pièces de l'adversaire.
-        profondeur (int): Niveau de profondeur de l'algorithme Minimax, déterminé par la difficulté du jeu.
+        profondeur (int): Profondeur maximale de l'approfondissement itératif, déterminée par la difficulté du jeu.
+        temps_limite (float): Budget de temps par coup en secondes (None pour ne pas limiter le temps).
+        noeuds_limite (int): Nombre maximal de nœuds par coup (None pour ne pas limiter).
+        rayon (int): Rayon autour des pierres dans lequel les coups candidats sont cherchés (1 ou 2).
+        profondeur_atteinte (int): Dernière profondeur entièrement explorée lors du dernier coup.
+        noeuds (int): Nombre de nœuds visités lors du dernier coup.
+        re_recherches (int): Nombre de coups réexplorés avec une fenêtre complète après l'échec (fail-high) de leur
+            recherche à fenêtre nulle, lors du dernier coup.
+        echecs_aspiration (int): Nombre d'itérations de la racine relancées parce que le score est sorti de la fenêtre
+            d'aspiration, lors du dernier coup.
+        fenetre_aspiration (int): Demi-largeur de la fenêtre d'aspiration de la racine.
+        nb_travailleurs (int): Nombre de processus qui explorent la position (1 : recherche séquentielle et
+            déterministe). Au-delà, les processus auxiliaires partagent la table de transposition en mémoire
+            partagée ("Lazy SMP") et le coup joué reste celui de la recherche du processus principal.
+        noeuds_aides (int): Nombre de nœuds visités par les processus auxiliaires lors du dernier coup.
+        arret (Event): Signal d'arrêt de la recherche, utilisé dans les processus auxiliaires (None sinon).
         evaluation (Evaluation): Objet d'évaluation qui permet de calculer les scores des configurations de plateau.
+        evaluateur (EvaluationIncrementale): Évaluation équivalente, tenue à jour coup par coup pendant la recherche.
+        evaluation_vectorielle (EvaluationVectorielle): Évaluation équivalente, notant tous les coups de la racine en un lot.
+        solveur_menaces (SolveurMenaces): Recherche des coups forcés lancée avant la recherche principale (None si désactivée).
+        symetries (bool): Si True, la table de transposition est indexée par la clé canonique des positions (la plus
+            petite des clés de leurs 8 transformées symétriques) : les positions symétriques partagent leurs entrées.
+            Les évaluations héritées ne sont pas exactement symétriques (certains motifs sont lus dans un seul sens),
+            si bien qu'une entrée peut provenir d'une position dont le score diffère légèrement ; désactivé par défaut.
+        statistiques (StatistiquesRecherche): Statistiques du dernier coup, si leur collecte est activée (None sinon).
+        fichier_statistiques (str): Fichier JSON Lines auquel les statistiques de chaque coup sont ajoutées, ou None.
+        bibliotheque (BibliothequeOuvertures): Bibliothèque d'ouvertures consultée avant toute recherche (None si
+            la difficulté ne l'utilise pas ou si aucune bibliothèque n'a été construite).
 
     Méthodes:
         generer_coups_possibles(plateau): Génère tous les coups possibles à partir de la position actuelle des pièces.
-        choisir_coup(): Sélectionne le meilleur coup possible en utilisant l'algorithme Minimax.
-        minmax(plateau, profondeur, maximisant, alpha, beta): Implémentation récursive de l'algorithme Minimax avec élagage alpha-beta.
+        choisir_coup(temps_limite, noeuds_limite): Sélectionne le meilleur coup par approfondissement itératif sous un budget.
+        negamax(plateau, profondeur, maximisant, alpha, beta): Recherche récursive négamax à variation principale (PVS).
         choisir_coup_aleatoire(plateau): Choix d'un coup aléatoire si aucun coup optimal n'est trouvé ou pour diversifier le jeu.
     """
     
-    def __init__(self, plateau, couleur, difficulte='moyen'):
+    def __init__(self, plateau, couleur, difficulte='moyen', verifier_collisions=False, memoire_tt=MEMOIRE_PAR_DEFAUT,
+                 temps_limite=None, noeuds_limite=None, rayon=None, nb_travailleurs=1, transposition_table=None,
+                 bibliotheque=None, symetries=False, statistiques=False, fichier_statistiques=None):
         self.plateau = plateau
         self.couleur = couleur
         self.difficulte = difficulte
         self.couleur_adverse = 'N' if couleur == 'B' else 'B'
-        if difficulte == 'difficile':
-            self.profondeur = 4
-        elif difficulte == 'moyen':
-            self.profondeur = 3
-        elif difficulte == 'facile':
-            self.profondeur = 2
-        elif difficulte == 'tres_facile':
-            self.profondeur = 1
-        else:
+        if difficulte not in LIMITES_DIFFICULTE:
             raise ValueError(f"Difficulté non reconnue: {difficulte}")
+        self.profondeur, temps_par_defaut = LIMITES_DIFFICULTE[difficulte]
+        self.temps_limite = temps_par_defaut if temps_limite is None else temps_limite
+        self.noeuds_limite = noeuds_limite
+        self.rayon = RAYONS_DIFFICULTE[difficulte] if rayon is None else rayon
+        if self.rayon not in RAYONS_FRONTIERE:
+            raise ValueError(f"Rayon non pris en charge: {self.rayon}. Choix valides: {RAYONS_FRONTIERE}")
+        self.echeance = None
+        self.limite_noeuds_recherche = None
+        self.noeuds = 0
+        self.re_recherches = 0
+        self.echecs_aspiration = 0
+        self.fenetre_aspiration = FENETRES_ASPIRATION[difficulte]
+        self.profondeur_atteinte = 0
+        if nb_travailleurs < 1:
+            raise ValueError(f"Le nombre de travailleurs doit être au moins 1: {nb_travailleurs}")
+        self.nb_travailleurs = nb_travailleurs
+        self.noeuds_aides = 0
+        self.arret = None
+        self.executeur = None
+        self.arret_aides = None
+        self.memoire_tt = memoire_tt
 
         self.evaluation = Evaluation(plateau, couleur, difficulte)
-        self.transposition_table = TableDeTransposition()
+        self.evaluateur = EvaluationIncrementale(plateau, couleur, difficulte)
+        self.evaluation_vectorielle = EvaluationVectorielle(couleur, difficulte)
+        if transposition_table is None:
+            transposition_table = TableDeTransposition(memoire_tt, verifier_collisions, partagee=nb_travailleurs > 1)
+        self.transposition_table = transposition_table
+        self.ordonnanceur = OrdonnanceurCoups(plateau.taille)
+        noeuds_menaces = NOEUDS_MENACES_DIFFICULTE[difficulte]
+        self.solveur_menaces = SolveurMenaces(noeuds_menaces) if noeuds_menaces else None
+        if bibliotheque is None and BIBLIOTHEQUE_DIFFICULTE[difficulte]:
+            bibliotheque = ouvrir_bibliotheque()
+        self.bibliotheque = bibliotheque
+        self.symetries = symetries
+        if symetries:
+            plateau.activer_symetries()
+        # La collecte des statistiques n'ajoute qu'un test par nœud lorsqu'elle est désactivée
+        self.collecter_statistiques = statistiques or fichier_statistiques is not None
+        self.fichier_statistiques = fichier_statistiques
+        self.statistiques = None
+        self.statistiques_en_cours = None
+        self.origine_coup = None
+        self.profondeur_iteration = 0
 
     def generer_coups_possibles(self, plateau):
         """
         Génère et retourne une liste des coups possibles en se basant sur les espaces vides autour des pierres déjà placées sur le plateau.
+        Le plateau tient à jour la frontière des cases vides proches des pierres : la génération n'en est qu'une copie.
     
         Entrée:
             plateau (Plateau): L'objet représentant l'état actuel du jeu.
@@ -54,79 +219,449 @@ class MinimaxStrategy:
             list: Liste des tuples (x, y) représentant les coordonnées des coups possibles.
 
         """
-        coords = []
         try:
-            for x in range(plateau.taille):
-                for y in range(plateau.taille):
-                    if plateau.plateau[x][y] != '.':
-                        for dx in [-1, 0, 1]:
-                            for dy in [-1, 0, 1]:
-                                nx, ny = x + dx, y + dy
-                                if 0 <= nx < plateau.taille and 0 <= ny < plateau.taille and plateau.plateau[nx][ny] == '.':
-                                    coords.append((nx, ny))
+            return plateau.coups_candidats(self.rayon)
         except IndexError as e:
             print(f"Erreur d'index hors limite : {e}")
-        return list(set(coords))
+        return []
 
-    def choisir_coup(self):
+    def choisir_coup(self, temps_limite=None, noeuds_limite=None):
         """
-        Sélectionne le meilleur coup possible en utilisant l'algorithme Minimax avec élagage alpha-beta.
-    
+        Sélectionne le meilleur coup possible (voir `chercher_coup`) et, si leur collecte est activée, remplit les
+        statistiques de la recherche (`statistiques`) et les ajoute au fichier de statistiques.
+
+        Entrées:
+            temps_limite (float, optionnel): Budget en secondes pour ce coup. Par défaut, celui de la stratégie.
+            noeuds_limite (int, optionnel): Nombre maximal de nœuds visités. Par défaut, celui de la stratégie.
+
         Sortie:
-            tuple: Coordonnées (x, y) du meilleur coup détecté, ou None si aucun coup n'est possible.
+            tuple: Coordonnées (x, y) du coup choisi, ou None si aucun coup n'est possible.
+        """
+        if not self.collecter_statistiques:
+            return self.chercher_coup(temps_limite, noeuds_limite)
+
+        statistiques = StatistiquesRecherche(self.couleur, self.difficulte, self.plateau.nb_pierres)
+        table = self.transposition_table
+        sondages, succes, sauvegardes = table.sondages, table.succes, table.sauvegardes
+        self.statistiques_en_cours = statistiques
+        debut = time.perf_counter()
+        try:
+            coup = self.chercher_coup(temps_limite, noeuds_limite)
+        finally:
+            self.statistiques_en_cours = None
+        statistiques.temps_total = time.perf_counter() - debut
+        statistiques.coup = coup
+        statistiques.origine = self.origine_coup
+        statistiques.profondeur_atteinte = self.profondeur_atteinte
+        statistiques.noeuds = self.noeuds
+        statistiques.noeuds_aides = self.noeuds_aides
+        statistiques.noeuds_menaces = 0 if self.solveur_menaces is None else self.solveur_menaces.noeuds
+        statistiques.sondages_tt = table.sondages - sondages
+        statistiques.succes_tt = table.succes - succes
+        statistiques.sauvegardes_tt = table.sauvegardes - sauvegardes
+        statistiques.re_recherches = self.re_recherches
+        statistiques.echecs_aspiration = self.echecs_aspiration
+        self.statistiques = statistiques
+        if self.fichier_statistiques is not None:
+            statistiques.exporter(self.fichier_statistiques)
+        return coup
+
+    def chercher_coup(self, temps_limite=None, noeuds_limite=None):
+        """
+        Sélectionne le meilleur coup possible par approfondissement itératif : la recherche négamax à variation
+        principale est lancée à la profondeur 1, puis 2, 3... jusqu'à la profondeur maximale de la difficulté ou
+        jusqu'à épuisement du budget. Le meilleur coup d'une itération est exploré en premier à l'itération suivante.
+        À partir de la profondeur 3, la racine est explorée dans une fenêtre d'aspiration centrée sur le score de
+        l'itération de même parité (profondeur - 2) : les scores oscillent fortement entre profondeurs paires et
+        impaires, selon le camp qui joue le dernier coup. Si le score sort de la fenêtre, l'itération est relancée
+        avec la fenêtre ouverte du côté de l'échec.
+        Un coup de la bibliothèque d'ouvertures est joué sans recherche.
+        Le solveur de menaces est consulté ensuite, sous le même budget : un gain ou une défense forcés sont joués
+        sans autre recherche ; lorsque plusieurs coups réfutent la suite de quatres de l'adversaire, ils sont explorés
+        en premier.
+        Avec plusieurs travailleurs, les processus auxiliaires explorent la même position en parallèle.
+
+        Entrées:
+            temps_limite (float, optionnel): Budget en secondes pour ce coup. Par défaut, celui de la stratégie.
+            noeuds_limite (int, optionnel): Nombre maximal de nœuds visités. Par défaut, celui de la stratégie.
+
+        Sortie:
+            tuple: Coordonnées (x, y) du meilleur coup de la dernière profondeur terminée, ou None si aucun coup n'est possible.
         """
-        alpha, beta = float('-inf'), float('inf')
-        meilleur_score = float('-inf')
         meilleur_coup = None
+        self.profondeur_atteinte = 0
+        self.noeuds = 0
+        self.noeuds_aides = 0
+        self.re_recherches = 0
+        self.echecs_aspiration = 0
+        if self.solveur_menaces is not None:
+            self.solveur_menaces.noeuds = 0
+
+        self.origine_coup = ALEATOIRE
 
         # Retourne un coup aléatoire directement pour la difficulté très facile
         if self.difficulte == 'tres_facile':
             return self.choisir_coup_aleatoire(self.plateau)
-        
-        try:
-            coups_possibles = self.generer_coups_possibles(self.plateau)
 
-            for coup in coups_possibles:
-                plateau_temp = self.plateau.simuler_coup(coup, self.couleur)
-                score, _ = self.minmax(plateau_temp, self.profondeur - 1, False, alpha, beta)
+        if self.bibliotheque is not None:
+            coup = self.bibliotheque.chercher(self.plateau, self.couleur)
+            if coup is not None:
+                self.origine_coup = BIBLIOTHEQUE
+                return coup
 
-                if score > meilleur_score:
-                    meilleur_score = score
-                    meilleur_coup = coup
-                alpha = max(alpha, score)
-                if beta <= alpha:
-                    break
+        temps_limite = self.temps_limite if temps_limite is None else temps_limite
+        noeuds_limite = self.noeuds_limite if noeuds_limite is None else noeuds_limite
+        debut = time.perf_counter()
+        self.transposition_table.nouvelle_recherche()
+        self.ordonnanceur.nouvelle_recherche()
+        self.ordonnanceur.reinitialiser_statistiques()
+        try:
+            coups_possibles = self.generer_coups_possibles(self.plateau)
+            defenses = []
+            if self.solveur_menaces is not None:
+                echeance = None if temps_limite is None else debut + temps_limite
+                coup_force, _, defenses = self.solveur_menaces.analyser(self.plateau, self.couleur, noeuds_limite,
+                                                                        echeance)
+                if coup_force is not None:
+                    self.origine_coup = MENACES
+                    return coup_force
+                coups_possibles += [coup for coup in defenses if coup not in coups_possibles]
+            self.evaluateur.synchroniser(self.plateau)
+            coups_possibles = self.ordonner_racine(coups_possibles)
+            if defenses:
+                # Les défenses contre la suite de quatres gagnante de l'adversaire sont explorées en premier ; les
+                # autres coups restent à la racine (défense que le solveur ne voit pas, ou menace plus forte)
+                coups_possibles = ([coup for coup in coups_possibles if coup in defenses]
+                                   + [coup for coup in coups_possibles if coup not in defenses])
+            aides = self.lancer_aides(coups_possibles, temps_limite, noeuds_limite)
+            try:
+                meilleur_coup = self.approfondir(coups_possibles, debut, temps_limite, noeuds_limite)
+            finally:
+                self.arreter_aides(aides)
+            if meilleur_coup is not None:
+                self.origine_coup = RECHERCHE
         except Exception as e:
             print(f"Erreur inattendue lors du choix du coup : {e}")
+            self.origine_coup = ALEATOIRE
             meilleur_coup = self.choisir_coup_aleatoire(self.plateau) 
             if meilleur_coup is None:
                 print("Aucun coup possible trouvé après erreur.")
                 return None
+        finally:
+            self.echeance = None
+            self.limite_noeuds_recherche = None
 
         return meilleur_coup if meilleur_coup is not None else self.choisir_coup_aleatoire(self.plateau)
 
-    def minmax(self, plateau, profondeur, maximisant, alpha, beta):
+    def approfondir(self, coups_possibles, debut, temps_limite, noeuds_limite, decalage=0, aide=False):
+        """
+        Boucle d'approfondissement itératif : explore la racine à la profondeur 1, 2, ... jusqu'à la profondeur
+        maximale ou jusqu'à épuisement du budget.
+
+        Entrées:
+            coups_possibles (list): Coups de la racine, dans l'ordre où ils doivent être explorés (modifiée sur place).
+            debut (float): Instant de début du coup (time.perf_counter).
+            temps_limite (float): Budget en secondes, ou None.
+            noeuds_limite (int): Nombre maximal de nœuds, ou None.
+            decalage (int): Profondeur ajoutée à chaque itération (processus auxiliaires).
+            aide (bool): True dans un processus auxiliaire : toutes les itérations sont alors soumises au budget.
+
+        Sortie:
+            tuple: Le meilleur coup de la dernière profondeur terminée, ou None.
+        """
+        meilleur_coup = None
+        scores = {}
+        for profondeur in range(1 + decalage, self.profondeur + decalage + 1):
+            # La première itération du processus principal n'est jamais interrompue, afin de toujours disposer d'un coup
+            if profondeur > 1 or aide:
+                self.echeance = None if temps_limite is None else debut + temps_limite
+                self.limite_noeuds_recherche = noeuds_limite
+            try:
+                coup, scores[profondeur] = self.rechercher_aspiration(coups_possibles, profondeur, scores.get(profondeur - 2))
+            except TempsEcoule:
+                break
+            if coup is not None:
+                meilleur_coup = coup
+                self.profondeur_atteinte = profondeur
+                coups_possibles.remove(coup)
+                coups_possibles.insert(0, coup)
+            if self.statistiques_en_cours is not None:
+                self.statistiques_en_cours.temps_profondeurs.append(time.perf_counter() - debut)
+        return meilleur_coup
+
+    def lancer_aides(self, coups_possibles, temps_limite, noeuds_limite):
+        """
+        Lance la recherche de la position courante dans les processus auxiliaires (nb_travailleurs - 1).
+
+        Entrées:
+            coups_possibles (list): Coups de la racine, déjà ordonnés.
+            temps_limite (float): Budget en secondes du coup, ou None.
+            noeuds_limite (int): Nombre maximal de nœuds par processus, ou None.
+
+        Sortie:
+            list: Les tâches lancées (vide en recherche séquentielle).
+        """
+        if self.nb_travailleurs <= 1 or len(coups_possibles) < 2:
+            return []
+        if self.executeur is None:
+            contexte = multiprocessing.get_context()
+            self.arret_aides = contexte.Event()
+            self.executeur = ProcessPoolExecutor(self.nb_travailleurs - 1, mp_context=contexte,
+                                                 initializer=_initialiser_aide, initargs=(self.arret_aides,))
+        self.arret_aides.clear()
+        spec = {
+            'classe_plateau': type(self.plateau),
+            'taille': self.plateau.taille,
+            'historique': list(self.plateau.historique),
+            'couleur': self.couleur,
+            'difficulte': self.difficulte,
+            'rayon': self.rayon,
+            'symetries': self.symetries,
+            'profondeur': self.profondeur,
+            'temps_limite': temps_limite,
+            'noeuds_limite': noeuds_limite,
+            'coups': list(coups_possibles),
+            'nom_memoire': self.transposition_table.nom_memoire,
+            'memoire_tt': self.memoire_tt,
+            'age': self.transposition_table.age,
+        }
+        return [self.executeur.submit(_rechercher_en_aide, dict(spec, indice=indice))
+                for indice in range(1, self.nb_travailleurs)]
+
+    def arreter_aides(self, aides):
+        """
+        Interrompt les processus auxiliaires et attend la fin de leur recherche.
+
+        Entrée:
+            aides (list): Les tâches retournées par `lancer_aides`.
+        """
+        if not aides:
+            return
+        self.arret_aides.set()
+        for aide in aides:
+            try:
+                self.noeuds_aides += aide.result()
+            except Exception as e:
+                print(f"Erreur dans un processus de recherche auxiliaire : {e}")
+
+    def fermer(self, liberer_table=True):
+        """
+        Arrête les processus auxiliaires et libère la table de transposition partagée.
+
+        Entrée:
+            liberer_table (bool): False pour conserver la table, réutilisée par une autre stratégie.
+        """
+        if self.executeur is not None:
+            self.executeur.shutdown(cancel_futures=True)
+            self.executeur = None
+        if liberer_table:
+            self.transposition_table.fermer()
+
+    def ordonner_racine(self, coups_possibles):
+        """
+        Trie les coups de la racine selon l'évaluation de la position obtenue après chacun d'eux, calculée pour
+        tous les coups en un seul lot vectorisé. À égalité, l'ordre de l'ordonnanceur est conservé.
+
+        Entrée:
+            coups_possibles (list): Les coups de la racine.
+
+        Sortie:
+            list: Les coups triés du plus prometteur au moins prometteur.
+        """
+        coups = self.ordonnanceur.ordonner(self.plateau, coups_possibles, 0)
+        if len(coups) < 2:
+            return coups
+        scores = self.evaluation_vectorielle.evaluer_coups(self.plateau, coups, self.couleur)
+        return [coups[i] for i in np.argsort(-scores, kind='stable')]
+
+    def rechercher_aspiration(self, coups_possibles, profondeur, score_attendu=None):
+        """
+        Explore la racine dans une fenêtre d'aspiration centrée sur le score attendu, puis relance la recherche
+        avec la fenêtre ouverte du côté de l'échec si le score en sort.
+
+        Entrées:
+            coups_possibles (list): Coups de la racine, dans l'ordre où ils doivent être explorés.
+            profondeur (int): Profondeur de recherche totale de l'itération.
+            score_attendu (float, optionnel): Centre de la fenêtre ; sans lui, la fenêtre est complète.
+
+        Sorties:
+            tuple: Le meilleur coup trouvé (ou None) et son score.
+        """
+        alpha, beta = float('-inf'), float('inf')
+        if score_attendu is not None and abs(score_attendu) != float('inf'):
+            alpha, beta = score_attendu - self.fenetre_aspiration, score_attendu + self.fenetre_aspiration
+        while True:
+            coup, score = self.rechercher_racine(coups_possibles, profondeur, alpha, beta)
+            if score <= alpha and alpha != float('-inf'):
+                alpha = float('-inf')
+            elif score >= beta and beta != float('inf'):
+                beta = float('inf')
+            else:
+                return coup, score
+            self.echecs_aspiration += 1
+
+    def rechercher_racine(self, coups_possibles, profondeur, alpha=float('-inf'), beta=float('inf')):
+        """
+        Explore les coups de la racine à une profondeur donnée : le premier coup avec la fenêtre (alpha, beta),
+        les suivants avec une fenêtre nulle, réexplorés seulement s'ils dépassent alpha.
+
+        Entrées:
+            coups_possibles (list): Coups de la racine, dans l'ordre où ils doivent être explorés.
+            profondeur (int): Profondeur de recherche totale de l'itération.
+            alpha (float): Borne inférieure de la fenêtre de la racine.
+            beta (float): Borne supérieure de la fenêtre de la racine.
+
+        Sorties:
+            tuple: Le meilleur coup trouvé (ou None) et son score. Un score hors de la fenêtre n'est qu'une borne.
+        """
+        meilleur_score = float('-inf')
+        meilleur_coup = None
+        self.profondeur_iteration = profondeur
+        statistiques = self.statistiques_en_cours
+        if statistiques is not None:
+            statistiques.enregistrer_noeud(0)
+            statistiques.enregistrer_developpement(0, len(coups_possibles), 0.0)
+        for indice, coup in enumerate(coups_possibles):
+            self.jouer_coup(self.plateau, coup, self.couleur)
+            try:
+                score = self.explorer_enfant(self.plateau, profondeur - 1, False, alpha, beta, indice)
+            finally:
+                self.annuler_coup(self.plateau)  # Le plateau de jeu doit être restauré même en cas d'erreur
+
+            if score > meilleur_score:
+                meilleur_score = score
+                meilleur_coup = coup
+            alpha = max(alpha, score)
+            if beta <= alpha:
+                if statistiques is not None:
+                    statistiques.enregistrer_coupure(indice)
+                break
+        return meilleur_coup, meilleur_score
+
+    def explorer_enfant(self, plateau, profondeur, maximisant, alpha, beta, indice):
+        """
+        Explore la position obtenue après un coup, du point de vue du joueur qui vient de jouer : le premier coup
+        d'un nœud avec la fenêtre complète, les suivants avec une fenêtre nulle (alpha, alpha + 1), qui prouve à
+        moindre coût qu'ils ne font pas mieux que le premier. Seul un coup qui la dépasse est réexploré.
+
+        Entrées:
+            plateau (Plateau): Le plateau de recherche, le coup déjà joué.
+            profondeur (int): La profondeur de recherche restante de l'enfant.
+            maximisant (bool): True si c'est au tour de l'IA dans la position de l'enfant.
+            alpha (float): Borne inférieure de la fenêtre du parent.
+            beta (float): Borne supérieure de la fenêtre du parent.
+            indice (int): Rang du coup dans l'ordre d'exploration du parent.
+
+        Sorties:
+            float: Le score de l'enfant pour le joueur qui vient de jouer.
+        """
+        if indice == 0 or alpha == float('-inf'):
+            return -self.negamax(plateau, profondeur, maximisant, -beta, -alpha)[0]
+        score = -self.negamax(plateau, profondeur, maximisant, -alpha - 1, -alpha)[0]
+        if alpha < score < beta:
+            self.re_recherches += 1
+            score = -self.negamax(plateau, profondeur, maximisant, -beta, -alpha)[0]
+        return score
+
+    def jouer_coup(self, plateau, coup, couleur):
         """
-        Fonction récursive de l'algorithme Minimax qui évalue les meilleurs coups possibles jusqu'à une certaine profondeur,
-        avec l'élagage alpha-beta pour optimiser la recherche.
+        Joue un coup sur le plateau de recherche et met à jour l'évaluation incrémentale.
 
         Entrées:
-            plateau (Plateau): L'état du plateau après un coup simulé.
+            plateau (Plateau): Le plateau de recherche.
+            coup (tuple): Les coordonnées (ligne, colonne) du coup.
+            couleur (str): La couleur de la pierre jouée.
+        """
+        plateau.jouer(coup[0], coup[1], couleur)
+        if plateau is self.evaluateur.plateau:
+            self.evaluateur.jouer(coup[0], coup[1])
+
+    def annuler_coup(self, plateau):
+        """
+        Annule le dernier coup joué par `jouer_coup`.
+
+        Entrée:
+            plateau (Plateau): Le plateau de recherche.
+        """
+        if plateau is self.evaluateur.plateau:
+            self.evaluateur.annuler()
+        plateau.annuler()
+
+    def evaluer_feuille(self, plateau):
+        """
+        Évalue une feuille de l'arbre : lecture du total incrémental si le plateau est celui suivi par l'évaluateur,
+        évaluation complète sinon.
+
+        Entrée:
+            plateau (Plateau): Le plateau à évaluer.
+
+        Sortie:
+            int: Le score de la position.
+        """
+        if plateau is self.evaluateur.plateau:
+            return self.evaluateur.evaluer()
+        return self.evaluation.evaluer(plateau)
+
+    def verifier_budget(self):
+        """
+        Compte un nœud visité et interrompt la recherche si le budget de temps ou de nœuds est épuisé.
+        L'horloge et le signal d'arrêt ne sont consultés que tous les 64 nœuds pour que la vérification reste négligeable.
+        """
+        self.noeuds += 1
+        if self.limite_noeuds_recherche is not None and self.noeuds > self.limite_noeuds_recherche:
+            raise TempsEcoule()
+        if self.noeuds & 0x3F == 0:
+            if self.echeance is not None and time.perf_counter() > self.echeance:
+                raise TempsEcoule()
+            if self.arret is not None and self.arret.is_set():
+                raise TempsEcoule()
+
+    def negamax(self, plateau, profondeur, maximisant, alpha, beta):
+        """
+        Recherche négamax à variation principale (PVS) avec élagage alpha-beta : les scores sont toujours exprimés
+        du point de vue du joueur qui a le trait, ce qui réunit les nœuds maximisants et minimisants.
+
+        Entrées:
+            plateau (Plateau): Le plateau de recherche, modifié sur place par `jouer`/`annuler` puis restauré.
             profondeur (int): La profondeur de recherche restante.
-            maximisant (bool): Booléen indiquant si l'agent maximise ou minimise le score.
-            alpha (float): La meilleure valeur maximale trouvée dans l'arbre au-dessus du nœud courant.
-            beta (float): La meilleure valeur minimale trouvée dans l'arbre au-dessus du nœud courant.
+            maximisant (bool): True si c'est au tour de l'IA, False si c'est au tour de l'adversaire.
+            alpha (float): Score minimal déjà garanti au joueur qui a le trait.
+            beta (float): Score au-delà duquel l'adversaire évitera cette position.
 
         Sorties:
-            float: La valeur du meilleur score trouvé.
+            float: La valeur du meilleur score trouvé, pour le joueur qui a le trait.
             tuple: Coordonnées du meilleur coup associé à ce score, ou None si aucun coup n'est trouvé.
         """
 
-        position_key = (str(plateau.plateau), profondeur, maximisant)
+        self.verifier_budget()
+        statistiques = self.statistiques_en_cours
+        if statistiques is not None:
+            statistiques.enregistrer_noeud(self.profondeur_iteration - profondeur)
+
+        # Le trait fait partie de la clé : la profondeur, elle, est stockée dans l'entrée
+        if self.symetries:
+            cle, symetrie = plateau.cle_canonique()
+        else:
+            cle, symetrie = plateau.hash, 0
+        position_key = cle ^ CLE_TRAIT if maximisant else cle
+        coup_tt = None
         try:
-            result = self.transposition_table.rechercher(position_key)
-            if result is not None:
-                return result
+            entree = self.transposition_table.rechercher(position_key, plateau, symetrie)
+            if entree is not None:
+                score_tt, profondeur_tt, drapeau, coup_tt = entree
+                if symetrie and coup_tt is not None:
+                    # Le coup est stocké dans le repère de la position canonique
+                    coup_tt = transformer(coup_tt[0], coup_tt[1], INVERSES[symetrie], plateau.taille)
+                if profondeur_tt >= profondeur:
+                    # Un score issu d'une coupure n'est qu'une borne : il resserre la fenêtre au lieu d'être renvoyé tel quel
+                    if drapeau == EXACTE:
+                        return score_tt, coup_tt
+                    elif drapeau == BORNE_INFERIEURE:
+                        alpha = max(alpha, score_tt)
+                    elif drapeau == BORNE_SUPERIEURE:
+                        beta = min(beta, score_tt)
+                    if alpha >= beta:
+                        return score_tt, coup_tt
         except KeyError as e:
             print(f"Erreur de clé dans la table de transposition: {e}")
         except Exception as e:
@@ -134,45 +669,75 @@ class MinimaxStrategy:
 
         if profondeur == 0 or plateau.est_jeu_termine():
             try:
-                score = self.evaluation.evaluer(plateau)
+                if statistiques is None:
+                    score = self.evaluer_feuille(plateau)
+                else:
+                    debut = time.perf_counter()
+                    score = self.evaluer_feuille(plateau)
+                    statistiques.temps_evaluation += time.perf_counter() - debut
+                    statistiques.evaluations += 1
             except ValueError as e:
                 print(f"Erreur lors de l'évaluation du plateau: {e}")
                 return float('-inf'), None  # Ou une autre valeur par défaut selon la logique du jeu
-            self.transposition_table.sauvegarder(position_key, (score, None))
+            score = score if maximisant else -score  # L'évaluation est faite du point de vue de l'IA
+            self.transposition_table.sauvegarder(position_key, score, profondeur, EXACTE, None, plateau, symetrie)
             return score, None
 
+        alpha_initial = alpha
+        ply = self.profondeur_iteration - profondeur
+        if statistiques is not None:
+            debut = time.perf_counter()
+        coups = self.ordonnanceur.ordonner(plateau, self.generer_coups_possibles(plateau), ply, coup_tt, maximisant)
+        if statistiques is not None:
+            statistiques.enregistrer_developpement(ply, len(coups), time.perf_counter() - debut)
+        couleur = self.couleur if maximisant else self.couleur_adverse
 
-        if maximisant:
-            meilleur_score = float('-inf')
-            meilleur_coup = None
-            for coup in self.generer_coups_possibles(plateau):
-                plateau_temp = plateau.simuler_coup(coup, self.couleur)
-                score, _ = self.minmax(plateau_temp, profondeur - 1, False, alpha, beta)
-                score = score[0] if isinstance(score, tuple) else score  # Modification ici
-                if score > meilleur_score:
-                    meilleur_score = score
-                    meilleur_coup = coup
-                alpha = max(alpha, score)
-                if beta <= alpha:
-                    break
-            self.transposition_table.sauvegarder(position_key, (meilleur_score, meilleur_coup))
-            return meilleur_score, meilleur_coup
-        else:
-            meilleur_score = float('inf')
-            meilleur_coup = None
-            for coup in self.generer_coups_possibles(plateau):
-                plateau_temp = plateau.simuler_coup(coup, self.couleur_adverse)
-                score, _ = self.minmax(plateau_temp, profondeur - 1, True, alpha, beta)
-                score = score[0] if isinstance(score, tuple) else score  # Modification ici
-                if score < meilleur_score:
-                    meilleur_score = score
-                    meilleur_coup = coup
-                beta = min(beta, score)
-                if alpha >= beta:
-                    break
-            self.transposition_table.sauvegarder(position_key, (meilleur_score, meilleur_coup))
-            return meilleur_score, meilleur_coup
+        meilleur_score = float('-inf')
+        meilleur_coup = None
+        for indice, coup in enumerate(coups):
+            self.jouer_coup(plateau, coup, couleur)
+            try:
+                score = self.explorer_enfant(plateau, profondeur - 1, not maximisant, alpha, beta, indice)
+            finally:
+                self.annuler_coup(plateau)
+            if score > meilleur_score:
+                meilleur_score = score
+                meilleur_coup = coup
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                self.ordonnanceur.enregistrer_coupure(coup, ply, profondeur, indice, maximisant)
+                if statistiques is not None:
+                    statistiques.enregistrer_coupure(indice)
+                break
+        self.sauvegarder_resultat(position_key, meilleur_score, profondeur, alpha_initial, beta, meilleur_coup, plateau,
+                                  symetrie)
+        return meilleur_score, meilleur_coup
+
+    def sauvegarder_resultat(self, cle, score, profondeur, alpha, beta, coup, plateau, symetrie=0):
+        """
+        Sauvegarde le résultat d'un nœud dans la table de transposition avec le type de borne correspondant
+        à la fenêtre alpha-beta dans laquelle il a été calculé.
 
+        Entrées:
+            cle (int): Clé de la position (hash et trait).
+            score (float): Meilleur score trouvé pour le nœud.
+            profondeur (int): Profondeur de recherche restante du nœud.
+            alpha (float): Borne alpha avec laquelle les coups du nœud ont été explorés.
+            beta (float): Borne beta avec laquelle les coups du nœud ont été explorés.
+            coup (tuple): Meilleur coup trouvé, ou None.
+            plateau (Plateau): La position, utilisée en mode vérification des collisions.
+            symetrie (int): Symétrie menant à la position canonique si la clé est canonique (0 sinon) : le coup
+                est alors stocké dans le repère de la position canonique.
+        """
+        if symetrie and coup is not None:
+            coup = transformer(coup[0], coup[1], symetrie, plateau.taille)
+        if score <= alpha:
+            drapeau = BORNE_SUPERIEURE
+        elif score >= beta:
+            drapeau = BORNE_INFERIEURE
+        else:
+            drapeau = EXACTE
+        self.transposition_table.sauvegarder(cle, score, profondeur, drapeau, coup, plateau, symetrie)
 
     def choisir_coup_aleatoire(self, plateau):
         """
@@ -0,0 +1,314 @@
+# motifs.py
+
+# Table de motifs précalculée pour l'évaluation des lignes.
+#
+# Toutes les fonctions d'évaluation examinent, pour une case et une direction, au plus les 4 cases de part et
+# d'autre de la case dans cette direction. Cette fenêtre de 9 cases est codée sur 2 bits par case :
+#   VIDE = 0, MOI = 1 (couleur évaluée), LUI = 2 (couleur adverse), BORD = 3 (hors du plateau)
+# soit un entier de 18 bits : code = somme(etat[j] << 2 * j) pour j = 0..8, la case examinée étant j = 4.
+#
+# Les scores de chaque fenêtre possible sont calculés une seule fois, à l'import, pour chaque difficulté à partir de
+# sa table de poids (POIDS). Évaluer une ligne revient ensuite à faire glisser le code le long de la ligne et à
+# additionner des lectures de tables. La table MOTIFS classe en plus chaque fenêtre selon le motif (cinq, quatre
+# ouvert, quatre, trois ouvert...) que MOI obtient en jouant sur la case examinée.
+#
+# Indépendamment des poids, chaque fenêtre est aussi décrite par ses caractéristiques (CARACTERISTIQUES : pierre
+# examinée, longueur de série, menaces, besoin défensif, formations ouvertes). Les fenêtres de mêmes
+# caractéristiques forment une classe (CLASSES) : compter les classes rencontrées le long des lignes donne le
+# vecteur de caractéristiques du plateau, auquel Evaluation applique ensuite les poids de sa difficulté.
+
+from array import array
+from itertools import product
+
+VIDE, MOI, LUI, BORD = 0, 1, 2, 3
+LARGEUR_FENETRE = 9
+CENTRE = 4
+NB_CODES = 1 << (2 * LARGEUR_FENETRE)
+DECALAGE_ENTREE = 2 * (LARGEUR_FENETRE - 1)  # Position des bits de la case qui entre dans la fenêtre
+
+# Motifs obtenus par MOI en jouant sur la case centrale d'une fenêtre, du plus faible au plus fort
+AUCUN, DEUX, TROIS, TROIS_OUVERT, QUATRE, QUATRE_OUVERT, CINQ = range(7)
+
+# Poids de chaque difficulté : ce sont eux qui donnent leur caractère aux quatre niveaux.
+POIDS = {
+    'tres_facile': {'serie': 1},  # Score = longueur de l'alignement
+    'facile': {'menace_3': -50, 'menace_4': -100},
+    'moyen': {'base_serie': 10, 'besoin_defensif': -50},  # Score = 10 ** longueur de l'alignement
+    'difficile': {'base_serie': 10, 'menace_4': -1000, 'formation_2': 20, 'formation_3': 50},
+}
+
+
+# Caractéristiques d'une fenêtre, toutes relatives à sa case centrale
+CARACTERISTIQUES = (
+    'pierre',  # La case est occupée (chaque pierre est comptée une fois par direction)
+    'serie_moi_1', 'serie_moi_2', 'serie_moi_3', 'serie_moi_4', 'serie_moi_5',  # Série de MOI commençant sur la case
+    'serie_lui_1', 'serie_lui_2', 'serie_lui_3', 'serie_lui_4', 'serie_lui_5',  # Série de LUI commençant sur la case
+    'besoin_1', 'besoin_2', 'besoin_3', 'besoin_4',  # Pierre de LUI extensible à 5, selon les pierres qui la suivent
+    'menace_3', 'menace_4',  # Menaces de LUI autour de la case, quel que soit son contenu
+    'menace_4_vide',  # Menace de 4 de LUI autour d'une case vide
+    'formation_2', 'formation_3',  # Formations ouvertes de MOI lues depuis la case (dans chaque sens)
+)
+INDICES = {nom: i for i, nom in enumerate(CARACTERISTIQUES)}
+
+
+def _menace(w, k, couleur, longueur):
+    """Équivalent de Evaluation.detecter_menace dans la fenêtre `w`, autour de l'indice `k`."""
+    alignement = 0
+    espaces_vides = 0
+    for i in range(k - longueur + 1, k + longueur):
+        v = w[i]
+        if v == couleur:
+            alignement += 1
+        elif v == VIDE:
+            espaces_vides += 1
+        else:
+            break
+    return alignement >= longueur and espaces_vides > 0
+
+
+def _serie(w, k, couleur):
+    """Nombre de pierres consécutives de `couleur` à partir de l'indice `k` inclus, vers l'avant (5 au plus)."""
+    alignement = 1
+    for i in range(k + 1, k + 5):
+        if w[i] == couleur:
+            alignement += 1
+        else:
+            break
+    return alignement
+
+
+def _besoin_defensif(w, k, couleur):
+    """Équivalent de la boucle interne de Evaluation.evaluer_besoins_defensifs : (alignement, espaces) vers l'avant."""
+    alignement, espaces = 0, 0
+    for i in range(k + 1, k + 5):
+        v = w[i]
+        if v == couleur:
+            alignement += 1
+        elif v == VIDE:
+            espaces += 1
+        else:
+            break
+    return alignement, espaces
+
+
+def _potentiel(w, k, couleur):
+    """Équivalent de Evaluation.compter_potentiel combiné comme dans evaluer_attaque_potentielle."""
+    alignement = 1
+    potentiel = 0
+    for d in (1, -1):
+        for i in range(1, 5):
+            v = w[k + i * d]
+            if v == couleur:
+                alignement += 1
+            elif v == VIDE:
+                potentiel += 1
+            else:
+                break
+    if alignement > 2:
+        return (alignement ** 2) + potentiel
+    return alignement + potentiel
+
+
+def _formation(sequence, couleur):
+    """Longueur d'une formation ouverte lue dans un sens (Evaluation.compter_formations_ouvertes), 0 si fermée."""
+    n = 0
+    while n < len(sequence) and sequence[n] == couleur:
+        n += 1
+    if n >= 2 and n < len(sequence) and sequence[n] == VIDE:
+        return n
+    return 0
+
+
+def _motif(w):
+    """Classe le motif obtenu par MOI en jouant sur la case centrale (vide) de la fenêtre."""
+    w = list(w)
+    w[CENTRE] = MOI
+    gagnantes = set()
+    trois = 0
+    deux = False
+    for debut in range(CENTRE - 4, CENTRE + 1):  # Les 5 segments de 5 cases contenant la case centrale
+        segment = w[debut:debut + 5]
+        if LUI in segment or BORD in segment:
+            continue
+        pierres = segment.count(MOI)
+        if pierres == 5:
+            return CINQ
+        if pierres == 4:
+            gagnantes.add(debut + segment.index(VIDE))
+        elif pierres == 3:
+            trois += 1
+        elif pierres == 2:
+            deux = True
+    if len(gagnantes) >= 2:
+        return QUATRE_OUVERT
+    if gagnantes:
+        return QUATRE
+    if trois >= 2:
+        return TROIS_OUVERT
+    if trois:
+        return TROIS
+    return DEUX if deux else AUCUN
+
+
+def coder(fenetre):
+    """
+    Code une fenêtre de 9 états en entier.
+
+    Entrée:
+        fenetre (sequence): Les 9 états (VIDE, MOI, LUI ou BORD) de la fenêtre.
+
+    Retourne:
+        int: Le code de la fenêtre.
+    """
+    code = 0
+    for j, etat in enumerate(fenetre):
+        code |= etat << (2 * j)
+    return code
+
+
+def _fenetres_valides():
+    """Énumère les fenêtres possibles : des cases BORD seulement aux extrémités, jamais au centre."""
+    for gauche in range(CENTRE + 1):
+        for droite in range(CENTRE + 1):
+            for milieu in product((VIDE, MOI, LUI), repeat=LARGEUR_FENETRE - gauche - droite):
+                yield (BORD,) * gauche + milieu + (BORD,) * droite
+
+
+_SERIES = {couleur: (None,) + tuple(INDICES[f'serie_{nom}_{k}'] for k in range(1, 6))
+           for couleur, nom in ((MOI, 'moi'), (LUI, 'lui'))}
+_BESOINS = (None,) + tuple(INDICES[f'besoin_{a}'] for a in range(1, 5))
+
+
+def _caracteristiques(w):
+    """
+    Calcule les caractéristiques d'une fenêtre.
+
+    Retourne:
+        tuple: Les couples (indice dans CARACTERISTIQUES, valeur) des caractéristiques non nulles, par indice croissant.
+    """
+    k = CENTRE
+    centre = w[k]
+    menaces = []
+    if _menace(w, k, LUI, 3):
+        menaces.append((INDICES['menace_3'], 1))
+    if _menace(w, k, LUI, 4):
+        menaces.append((INDICES['menace_4'], 1))
+        if centre == VIDE:
+            menaces.append((INDICES['menace_4_vide'], 1))
+    if centre == VIDE:
+        return tuple(menaces)
+
+    vecteur = [(INDICES['pierre'], 1), (_SERIES[centre][_serie(w, k, centre)], 1)]
+    if centre == LUI:
+        alignement, espaces = _besoin_defensif(w, k, LUI)
+        if alignement + espaces >= 4 and alignement:
+            vecteur.append((_BESOINS[alignement], 1))
+        return tuple(vecteur + menaces)
+
+    longueurs = (_formation(w, MOI), _formation(w[::-1], MOI))
+    formations = [(INDICES['formation_2'], longueurs.count(2)),
+                  (INDICES['formation_3'], sum(1 for n in longueurs if n >= 3))]
+    return tuple(vecteur + menaces + [(indice, valeur) for indice, valeur in formations if valeur])
+
+
+def ponderer(vecteur, difficulte):
+    """
+    Applique les poids d'une difficulté à un vecteur de caractéristiques, celui d'une fenêtre comme celui d'un
+    plateau entier (somme des vecteurs de ses fenêtres) : les scores sont linéaires en les caractéristiques.
+
+    Entrées:
+        vecteur (list): La valeur de chaque caractéristique de CARACTERISTIQUES.
+        difficulte (str): Niveau de difficulté.
+
+    Retourne:
+        tuple: (principal, defensif), les deux sommes partielles de la difficulté (voir scorer_ligne).
+    """
+    poids = POIDS[difficulte]
+    if difficulte == 'tres_facile':
+        return poids['serie'] * sum(k * vecteur[INDICES[f'serie_moi_{k}']] for k in range(1, 6)), 0
+    if difficulte == 'facile':
+        return 0, poids['menace_3'] * vecteur[INDICES['menace_3']] + poids['menace_4'] * vecteur[INDICES['menace_4']]
+    series = sum(poids['base_serie'] ** k * (vecteur[INDICES[f'serie_moi_{k}']] - vecteur[INDICES[f'serie_lui_{k}']])
+                 for k in range(1, 6))
+    if difficulte == 'moyen':
+        return series, sum(poids['besoin_defensif'] * a ** 2 * vecteur[INDICES[f'besoin_{a}']] for a in range(1, 5))
+    return (series + poids['menace_4'] * vecteur[INDICES['menace_4_vide']]
+            + poids['formation_2'] * vecteur[INDICES['formation_2']]
+            + poids['formation_3'] * vecteur[INDICES['formation_3']]), 0
+
+
+def _construire_tables():
+    """
+    Construit la table des classes de caractéristiques, les caractéristiques de chaque classe et la table des
+    motifs, puis en déduit, pour chaque difficulté, les tables (principal, defensif, potentiel) indexées par code
+    de fenêtre : le score d'une fenêtre est celui de sa classe.
+    """
+    tables = {difficulte: (array('i', bytes(4 * NB_CODES)), array('i', bytes(4 * NB_CODES)), array('i', bytes(4 * NB_CODES)))
+              for difficulte in POIDS}
+    motifs = array('b', bytes(NB_CODES))
+    classes = array('H', bytes(2 * NB_CODES))
+    vecteurs = [()]  # La classe 0 (fenêtre sans caractéristique) est aussi celle des codes impossibles
+    indices_classes = {(): 0}
+    codes_par_classe = [[]]
+    potentiel = tables['facile'][2]
+    for w in _fenetres_valides():
+        code = coder(w)
+        vecteur = _caracteristiques(w)
+        if vecteur not in indices_classes:
+            indices_classes[vecteur] = len(vecteurs)
+            vecteurs.append(vecteur)
+            codes_par_classe.append([])
+        classes[code] = indices_classes[vecteur]
+        codes_par_classe[classes[code]].append(code)
+        if w[CENTRE] == VIDE:
+            potentiel[code] = _potentiel(w, CENTRE, MOI)
+            motifs[code] = _motif(w)
+
+    for classe, vecteur in enumerate(vecteurs):
+        dense = [0] * len(CARACTERISTIQUES)
+        for indice, valeur in vecteur:
+            dense[indice] = valeur
+        for difficulte, (principal, defensif, _) in tables.items():
+            score_principal, score_defensif = ponderer(dense, difficulte)
+            if score_principal:
+                for code in codes_par_classe[classe]:
+                    principal[code] = score_principal
+            if score_defensif:
+                for code in codes_par_classe[classe]:
+                    defensif[code] = score_defensif
+    return tables, motifs, classes, vecteurs
+
+
+TABLES, MOTIFS, CLASSES, VECTEURS = _construire_tables()
+
+
+def scorer_ligne(etats, difficulte):
+    """
+    Calcule la contribution d'une ligne à l'évaluation d'une difficulté par lecture des tables de motifs.
+
+    Entrées:
+        etats (list): États (VIDE, MOI ou LUI) des cases de la ligne, dans le sens de sa direction.
+        difficulte (str): Niveau de difficulté de l'évaluation.
+
+    Retourne:
+        tuple: (principal, defensif, potentiels) où `principal` et `defensif` sont les deux sommes partielles
+        de la difficulté, et `potentiels` la contribution de la ligne au potentiel d'attaque de chaque case
+        (niveau facile uniquement, None sinon).
+    """
+    table_principale, table_defensive, table_potentiel = TABLES[difficulte]
+    n = len(etats)
+    # Fenêtre initiale : 4 cases de bord puis les 5 premières cases de la ligne
+    code = 0x55 * BORD
+    for j in range(5):
+        code |= (etats[j] if j < n else BORD) << (2 * (CENTRE + j))
+    principal = 0
+    defensif = 0
+    potentiels = [0] * n if difficulte == 'facile' else None
+    for p in range(n):
+        principal += table_principale[code]
+        defensif += table_defensive[code]
+        if potentiels is not None:
+            potentiels[p] = table_potentiel[code]
+        entrant = etats[p + 5] if p + 5 < n else BORD
+        code = (code >> 2) | (entrant << DECALAGE_ENTREE)
+    return principal, defensif, potentiels
@@ -0,0 +1,121 @@
+# ordonnancement.py
+
+# L'élagage alpha-beta coupe d'autant plus tôt que les bons coups sont explorés en premier.
+# Cet ordonnanceur trie les coups d'un nœud selon, par priorité décroissante :
+#   1. le meilleur coup mémorisé dans la table de transposition pour cette position ;
+#   2. les coups "tueurs" : coups ayant provoqué une coupure à la même distance de la racine ;
+#   3. l'heuristique de l'historique : bonus cumulé des coups ayant provoqué des coupures ailleurs dans l'arbre ;
+#   4. un score statique bon marché : nombre de pierres voisines de la case.
+
+PROFONDEUR_MAX = 64
+NB_TUEURS = 2
+
+_VOISINAGE = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+class OrdonnanceurCoups:
+    """
+    Ordonne les coups explorés par la recherche et mesure la qualité de cet ordre.
+
+    Attributs:
+        taille (int): La taille du plateau.
+        tueurs (list): Pour chaque distance à la racine, les derniers coups ayant provoqué une coupure.
+        historique (dict): Pour chaque camp (True pour le joueur maximisant), le bonus de chaque case.
+        coupures (int): Nombre de coupures beta observées.
+        coupures_premier_coup (int): Nombre de coupures obtenues dès le premier coup exploré.
+    """
+
+    def __init__(self, taille=15):
+        self.taille = taille
+        self.tueurs = [[None] * NB_TUEURS for _ in range(PROFONDEUR_MAX)]
+        self.historique = {True: [0] * (taille * taille), False: [0] * (taille * taille)}
+        self.reinitialiser_statistiques()
+
+    def reinitialiser_statistiques(self):
+        """Remet à zéro les compteurs de coupures."""
+        self.coupures = 0
+        self.coupures_premier_coup = 0
+
+    def taux_coupure_premier_coup(self):
+        """Retourne la proportion des coupures obtenues dès le premier coup exploré (entre 0 et 1)."""
+        return self.coupures_premier_coup / self.coupures if self.coupures else 0.0
+
+    def nouvelle_recherche(self):
+        """
+        Prépare une nouvelle recherche : les tueurs, propres à une position de départ, sont oubliés et
+        l'historique est divisé par deux pour que les informations récentes dominent.
+        """
+        for tueurs in self.tueurs:
+            for i in range(NB_TUEURS):
+                tueurs[i] = None
+        for bonus in self.historique.values():
+            for i in range(len(bonus)):
+                bonus[i] >>= 1
+
+    def score_statique(self, plateau, coup):
+        """
+        Score bon marché d'un coup : nombre de pierres (des deux couleurs) dans les 8 cases voisines.
+
+        Entrée:
+            plateau (Plateau): Le plateau de jeu actuel.
+            coup (tuple): Les coordonnées (ligne, colonne) du coup.
+
+        Retourne:
+            int: Le nombre de pierres voisines.
+        """
+        x, y = coup
+        grille = plateau.plateau
+        score = 0
+        for dx, dy in _VOISINAGE:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.taille and 0 <= ny < self.taille and grille[nx][ny] != '.':
+                score += 1
+        return score
+
+    def ordonner(self, plateau, coups, ply, coup_tt=None, maximisant=True):
+        """
+        Trie les coups d'un nœud du plus prometteur au moins prometteur.
+
+        Entrées:
+            plateau (Plateau): Le plateau du nœud.
+            coups (list): Les coups possibles du nœud.
+            ply (int): Distance du nœud à la racine.
+            coup_tt (tuple, optionnel): Meilleur coup mémorisé dans la table de transposition.
+            maximisant (bool): Camp qui joue les coups.
+
+        Retourne:
+            list: Les coups triés.
+        """
+        tueurs = self.tueurs[ply] if ply < PROFONDEUR_MAX else ()
+        bonus = self.historique[maximisant]
+        taille = self.taille
+
+        def priorite(coup):
+            if coup == coup_tt:
+                return (3, 0, 0)
+            if coup in tueurs:
+                return (2, -tueurs.index(coup), 0)
+            return (0, bonus[coup[0] * taille + coup[1]], self.score_statique(plateau, coup))
+
+        return sorted(coups, key=priorite, reverse=True)
+
+    def enregistrer_coupure(self, coup, ply, profondeur, indice, maximisant=True):
+        """
+        Mémorise un coup ayant provoqué une coupure beta.
+
+        Entrées:
+            coup (tuple): Le coup responsable de la coupure.
+            ply (int): Distance du nœud à la racine.
+            profondeur (int): Profondeur restante du nœud ; les coupures proches de la racine pèsent davantage.
+            indice (int): Rang du coup dans l'ordre d'exploration (0 pour le premier).
+            maximisant (bool): Camp qui a joué le coup.
+        """
+        self.coupures += 1
+        if indice == 0:
+            self.coupures_premier_coup += 1
+        if ply < PROFONDEUR_MAX:
+            tueurs = self.tueurs[ply]
+            if tueurs[0] != coup:
+                tueurs[1:] = tueurs[:-1]
+                tueurs[0] = coup
+        self.historique[maximisant][coup[0] * self.taille + coup[1]] += profondeur * profondeur
@@ -0,0 +1,171 @@
+# statistiques.py
+
+# Statistiques d'une recherche, remplies par MinimaxStrategy lorsque leur collecte est activée.
+# Elles expliquent le coût d'un coup : origine du coup (bibliothèque, solveur de menaces, recherche), nœuds visités,
+# évaluations de feuilles, efficacité de la table de transposition et de l'ordre des coups, facteur de branchement
+# par distance à la racine et répartition du temps entre évaluation et génération des coups.
+# Chaque coup peut être ajouté à un fichier JSON Lines (un objet JSON par ligne) pour être analysé ensuite.
+
+import json
+
+# Origine du coup joué
+ALEATOIRE = 'aleatoire'
+BIBLIOTHEQUE = 'bibliotheque'
+MENACES = 'menaces'
+RECHERCHE = 'recherche'
+
+
+class StatistiquesRecherche:
+    """
+    Statistiques de la recherche d'un coup.
+
+    Attributs:
+        couleur (str): La couleur qui joue.
+        difficulte (str): La difficulté de la stratégie.
+        nb_pierres (int): Nombre de pierres sur le plateau au début de la recherche.
+        coup (tuple): Le coup choisi.
+        origine (str): ALEATOIRE, BIBLIOTHEQUE, MENACES ou RECHERCHE.
+        profondeur_atteinte (int): Dernière profondeur entièrement explorée.
+        noeuds (int): Nœuds visités par la recherche principale.
+        noeuds_aides (int): Nœuds visités par les processus auxiliaires.
+        noeuds_menaces (int): Nœuds visités par le solveur de menaces.
+        evaluations (int): Nombre de feuilles évaluées.
+        sondages_tt (int): Nombre de consultations de la table de transposition.
+        succes_tt (int): Nombre de consultations ayant trouvé la position.
+        sauvegardes_tt (int): Nombre d'entrées écrites dans la table.
+        coupures (dict): Nombre de coupures beta selon l'indice (à partir de 0) du coup qui les a provoquées.
+        re_recherches (int): Nombre de réexplorations après l'échec d'une recherche à fenêtre nulle.
+        echecs_aspiration (int): Nombre d'itérations relancées hors de la fenêtre d'aspiration.
+        noeuds_par_ply (list): Nombre de nœuds visités à chaque distance de la racine (la racine comprise).
+        internes_par_ply (list): Nombre de nœuds développés (coups générés) à chaque distance de la racine.
+        coups_par_ply (list): Nombre total de coups générés à chaque distance de la racine.
+        temps_evaluation (float): Temps passé à évaluer les feuilles, en secondes.
+        temps_generation (float): Temps passé à générer et ordonner les coups, en secondes.
+        temps_profondeurs (list): Temps écoulé depuis le début du coup à la fin de chaque itération de
+            l'approfondissement itératif (profondeur 1, 2, ...), en secondes.
+        temps_total (float): Durée totale du choix du coup, en secondes.
+    """
+
+    def __init__(self, couleur, difficulte, nb_pierres):
+        self.couleur = couleur
+        self.difficulte = difficulte
+        self.nb_pierres = nb_pierres
+        self.coup = None
+        self.origine = None
+        self.profondeur_atteinte = 0
+        self.noeuds = 0
+        self.noeuds_aides = 0
+        self.noeuds_menaces = 0
+        self.evaluations = 0
+        self.sondages_tt = 0
+        self.succes_tt = 0
+        self.sauvegardes_tt = 0
+        self.coupures = {}
+        self.re_recherches = 0
+        self.echecs_aspiration = 0
+        self.noeuds_par_ply = []
+        self.internes_par_ply = []
+        self.coups_par_ply = []
+        self.temps_evaluation = 0.0
+        self.temps_generation = 0.0
+        self.temps_profondeurs = []
+        self.temps_total = 0.0
+
+    def enregistrer_noeud(self, ply):
+        """Compte un nœud visité à une distance donnée de la racine."""
+        while len(self.noeuds_par_ply) <= ply:
+            self.noeuds_par_ply.append(0)
+            self.internes_par_ply.append(0)
+            self.coups_par_ply.append(0)
+        self.noeuds_par_ply[ply] += 1
+
+    def enregistrer_developpement(self, ply, nb_coups, duree):
+        """
+        Compte un nœud développé (déjà compté par `enregistrer_noeud`), le nombre de coups générés et le temps passé
+        à les générer et les ordonner.
+        """
+        self.internes_par_ply[ply] += 1
+        self.coups_par_ply[ply] += nb_coups
+        self.temps_generation += duree
+
+    def enregistrer_coupure(self, indice):
+        """Compte une coupure beta provoquée par le coup d'indice donné."""
+        self.coupures[indice] = self.coupures.get(indice, 0) + 1
+
+    def taux_succes_tt(self):
+        """Retourne la proportion des consultations de la table ayant trouvé la position (entre 0 et 1)."""
+        return self.succes_tt / self.sondages_tt if self.sondages_tt else 0.0
+
+    def taux_coupure_premier_coup(self):
+        """Retourne la proportion des coupures provoquées par le premier coup exploré (entre 0 et 1)."""
+        total = sum(self.coupures.values())
+        return self.coupures.get(0, 0) / total if total else 0.0
+
+    def facteurs_branchement(self):
+        """
+        Calcule le facteur de branchement à chaque distance de la racine.
+
+        Retourne:
+            list: Pour chaque distance, un tuple (moyen, effectif) : nombre moyen de coups générés par nœud
+            développé, et nombre moyen d'enfants réellement visités (après élagage) par nœud développé.
+        """
+        facteurs = []
+        for ply, internes in enumerate(self.internes_par_ply):
+            if not internes:
+                break
+            enfants = self.noeuds_par_ply[ply + 1] if ply + 1 < len(self.noeuds_par_ply) else 0
+            facteurs.append((self.coups_par_ply[ply] / internes, enfants / internes))
+        return facteurs
+
+    def noeuds_par_seconde(self):
+        """Retourne le nombre de nœuds visités (recherche principale et solveur) par seconde."""
+        return (self.noeuds + self.noeuds_menaces) / self.temps_total if self.temps_total else 0.0
+
+    def en_dict(self):
+        """
+        Retourne les statistiques sous forme de dictionnaire sérialisable en JSON, grandeurs dérivées comprises.
+
+        Retourne:
+            dict: Les statistiques.
+        """
+        return {
+            'couleur': self.couleur,
+            'difficulte': self.difficulte,
+            'nb_pierres': self.nb_pierres,
+            'coup': None if self.coup is None else list(self.coup),
+            'origine': self.origine,
+            'profondeur_atteinte': self.profondeur_atteinte,
+            'noeuds': self.noeuds,
+            'noeuds_aides': self.noeuds_aides,
+            'noeuds_menaces': self.noeuds_menaces,
+            'evaluations': self.evaluations,
+            'sondages_tt': self.sondages_tt,
+            'succes_tt': self.succes_tt,
+            'sauvegardes_tt': self.sauvegardes_tt,
+            'taux_succes_tt': self.taux_succes_tt(),
+            'coupures': {str(indice): nombre for indice, nombre in sorted(self.coupures.items())},
+            'taux_coupure_premier_coup': self.taux_coupure_premier_coup(),
+            're_recherches': self.re_recherches,
+            'echecs_aspiration': self.echecs_aspiration,
+            'noeuds_par_ply': self.noeuds_par_ply,
+            'facteurs_branchement': [list(facteurs) for facteurs in self.facteurs_branchement()],
+            'temps_evaluation': self.temps_evaluation,
+            'temps_generation': self.temps_generation,
+            'temps_profondeurs': self.temps_profondeurs,
+            'temps_total': self.temps_total,
+            'noeuds_par_seconde': self.noeuds_par_seconde(),
+        }
+
+    def vers_json(self):
+        """Retourne les statistiques sous forme d'une ligne JSON."""
+        return json.dumps(self.en_dict(), ensure_ascii=False)
+
+    def exporter(self, chemin):
+        """
+        Ajoute les statistiques à la fin d'un fichier JSON Lines (une ligne par coup).
+
+        Entrée:
+            chemin (str): Le chemin du fichier.
+        """
+        with open(chemin, 'a', encoding='utf-8') as fichier:
+            fichier.write(self.vers_json() + '\n')
@@ -2,28 +2,303 @@
 
 # L'utilisation de la table de transposition réduit le nombre de positions à évaluer, et accelere l'exécution de l'algorithme
 
+import struct
+import weakref
+from multiprocessing import shared_memory
+
+from plateau.symetries import INVERSES, transformer
+
+# Type de borne associé au score d'une entrée (0 est réservé aux emplacements vides)
+EXACTE = 1
+BORNE_INFERIEURE = 2  # Le score réel est >= au score stocké (coupure beta)
+BORNE_SUPERIEURE = 3  # Le score réel est <= au score stocké (aucun coup n'a dépassé alpha)
+
+OCTETS_PAR_ENTREE = 16  # Une clé et un mot de données de 64 bits chacun
+MEMOIRE_PAR_DEFAUT = 8 * 1024 * 1024
+
+# Disposition des champs dans le mot de données de 64 bits
+_BITS_SCORE = 32
+_SCORE_MAX = (1 << (_BITS_SCORE - 1)) - 1  # Représente +inf (et -_SCORE_MAX représente -inf)
+_DECALAGE_PROFONDEUR = 32  # 6 bits
+_DECALAGE_DRAPEAU = 38  # 2 bits
+_DECALAGE_COUP = 40  # 16 bits : (ligne << 8 | colonne) + 1, 0 si aucun coup
+_DECALAGE_AGE = 56  # 8 bits
+
+# Fichier d'une table enregistrée : en-tête (signature, version, nombre d'entrées), puis les entrées occupées
+SIGNATURE_FICHIER = b'GMKT'
+VERSION_FICHIER = 1
+ENTETE_FICHIER = struct.Struct('<4sHI')
+ENTREE_FICHIER = struct.Struct('<QQ')  # Clé de la position, mot de données
+
+
+def _attacher_memoire(nom):
+    """
+    Ouvre un segment de mémoire partagée créé par un autre processus, sans en devenir responsable : seul le
+    processus créateur doit le détruire. Avant Python 3.13, l'ouverture enregistre le segment auprès du
+    gestionnaire de ressources, partagé par les processus lancés par multiprocessing : l'enregistrement est
+    alors un doublon sans effet.
+    """
+    try:
+        return shared_memory.SharedMemory(name=nom, track=False)  # Python 3.13 et suivants
+    except TypeError:
+        return shared_memory.SharedMemory(name=nom)
+
+
+def _liberer_memoire(memoire, vues, detruire):
+    """Libère les vues sur un segment de mémoire partagée, le ferme et le détruit si ce processus l'a créé."""
+    for vue in vues:
+        vue.release()
+    memoire.close()
+    if detruire:
+        try:
+            memoire.unlink()
+        except FileNotFoundError:
+            pass
+
+
 class TableDeTransposition:
-    def __init__(self):
-        self.table = {}
+    """
+    Table de transposition de capacité fixe, indexée par le hash de Zobrist des positions.
+
+    Les entrées sont rangées dans deux tableaux de mots de 64 bits alloués une fois pour toutes : la mémoire reste
+    donc constante quelle que soit la durée d'une partie ou d'un tournoi. Chaque entrée regroupe le score, le type
+    de borne (exacte, inférieure ou supérieure), la profondeur de recherche, le meilleur coup et l'âge de la
+    recherche qui l'a produite. La clé est stockée XOR les données, ce qui permet de rejeter une entrée à moitié
+    écrite ou appartenant à une autre position.
+
+    Remplacement : un emplacement est écrasé s'il est vide, s'il contient la même position, s'il date d'une
+    recherche précédente ou si la nouvelle entrée a été calculée à une profondeur au moins égale. La table est
+    conservée d'un coup à l'autre (et d'une partie à l'autre par JoueurIA) : les entrées des coups précédents restent
+    consultables jusqu'à ce que des entrées plus récentes les remplacent. Elle peut être enregistrée dans un fichier
+    (`enregistrer`) puis chargée dans une autre table (`charger`), par exemple pour préchauffer un tournoi.
+
+    La table peut être placée dans un segment de mémoire partagée (`partagee=True`) et ouverte par d'autres
+    processus à partir de son nom (`nom_memoire`). Aucun verrou n'est nécessaire : une entrée écrite en même temps
+    par deux processus, ou lue pendant son écriture, a une clé incohérente avec ses données et est simplement ignorée.
+
+    Attributs:
+        capacite (int): Nombre d'entrées (puissance de deux).
+        age (int): Âge de la recherche courante, incrémenté par `nouvelle_recherche`.
+        verifier_collisions (bool): Si True, chaque entrée conserve aussi une copie du plateau afin de détecter
+            les collisions de hash. Réservé aux tests : ce mode annule le gain mémoire du hachage.
+        collisions (int): Nombre de collisions détectées en mode vérification.
+        sondages (int): Nombre de recherches effectuées dans la table.
+        succes (int): Nombre de recherches ayant trouvé la position.
+        sauvegardes (int): Nombre d'entrées écrites.
+        rejets (int): Nombre d'écritures refusées par la politique de remplacement.
+        memoire_partagee (SharedMemory): Segment de mémoire partagée contenant la table, ou None.
+    """
+
+    def __init__(self, memoire_octets=MEMOIRE_PAR_DEFAUT, verifier_collisions=False, partagee=False, nom_memoire=None):
+        """
+        Alloue la table pour un budget mémoire donné.
+
+        Entrée:
+            memoire_octets (int): Budget mémoire en octets ; la capacité est la plus grande puissance de deux d'entrées
+                qui tient dans ce budget.
+            verifier_collisions (bool): Active le mode de détection des collisions (propre à chaque processus).
+            partagee (bool): Si True, la table est créée dans un segment de mémoire partagée.
+            nom_memoire (str, optionnel): Nom d'un segment existant à ouvrir, créé par un autre processus avec le
+                même budget mémoire.
+        """
+        capacite = 1
+        while capacite * 2 * OCTETS_PAR_ENTREE <= memoire_octets:
+            capacite *= 2
+        self.capacite = capacite
+        self.masque = capacite - 1
+        taille_octets = capacite * OCTETS_PAR_ENTREE
+        self.memoire_partagee = None
+        if nom_memoire is not None:
+            self.memoire_partagee = _attacher_memoire(nom_memoire)
+        elif partagee:
+            self.memoire_partagee = shared_memory.SharedMemory(create=True, size=taille_octets)
+        if self.memoire_partagee is None:
+            self.tampon = bytearray(taille_octets)
+        else:
+            self.tampon = self.memoire_partagee.buf[:taille_octets]
+        vue = memoryview(self.tampon)
+        self.cles = vue[:capacite * 8].cast('Q')
+        self.donnees = vue[capacite * 8:].cast('Q')
+        if self.memoire_partagee is not None:
+            # Le segment est libéré par `fermer`, ou au plus tard à la destruction de la table ou à la fin du processus
+            self._finaliseur = weakref.finalize(self, _liberer_memoire, self.memoire_partagee,
+                                                (self.cles, self.donnees, vue, self.tampon), nom_memoire is None)
+        self.age = 0
+        self.verifier_collisions = verifier_collisions
+        self.signatures = {}
+        self.collisions = 0
+        self.reinitialiser_statistiques()
+
+    def reinitialiser_statistiques(self):
+        """Remet à zéro les compteurs de sondages, succès et écritures."""
+        self.sondages = 0
+        self.succes = 0
+        self.sauvegardes = 0
+        self.rejets = 0
+
+    def taux_succes(self):
+        """Retourne la proportion de recherches ayant trouvé la position (entre 0 et 1)."""
+        return self.succes / self.sondages if self.sondages else 0.0
+
+    def nouvelle_recherche(self):
+        """
+        Incrémente l'âge de la table. Les entrées des recherches précédentes restent utilisables mais deviennent
+        remplaçables en priorité.
+        """
+        self.age = (self.age + 1) & 0xFF
+
+    @property
+    def nom_memoire(self):
+        """Nom du segment de mémoire partagée de la table, à transmettre aux autres processus (None si non partagée)."""
+        return None if self.memoire_partagee is None else self.memoire_partagee.name
 
-    def sauvegarder(self, cle, valeur):
+    def fermer(self):
         """
-        Sauvegarde une valeur avec une clé spécifique dans la table de transposition.
-        
+        Libère le segment de mémoire partagée de la table (et le détruit si ce processus l'a créé).
+        La table n'est plus utilisable ensuite.
+        """
+        if self.memoire_partagee is not None:
+            self._finaliseur()
+
+    def vider(self):
+        """Efface toutes les entrées de la table."""
+        self.tampon[:] = bytes(len(self.tampon))
+        self.signatures.clear()
+
+    def enregistrer(self, chemin):
+        """
+        Enregistre les entrées occupées de la table dans un fichier binaire, pour préchauffer une table ultérieure.
+
+        Entrée:
+            chemin (str): Le chemin du fichier à écrire.
+
+        Retourne:
+            int: Le nombre d'entrées enregistrées.
+        """
+        cles, donnees = self.cles, self.donnees
+        entrees = [(cles[idx] ^ mot, mot) for idx, mot in enumerate(donnees) if mot]
+        with open(chemin, 'wb') as fichier:
+            fichier.write(ENTETE_FICHIER.pack(SIGNATURE_FICHIER, VERSION_FICHIER, len(entrees)))
+            fichier.write(b''.join(ENTREE_FICHIER.pack(cle, mot) for cle, mot in entrees))
+        return len(entrees)
+
+    def charger(self, chemin):
+        """
+        Ajoute à la table les entrées d'un fichier écrit par `enregistrer`, quelle que soit la capacité de la table
+        qui l'a écrit. Un emplacement déjà occupé n'est remplacé que par une entrée calculée plus profondément.
+        Les entrées chargées n'ont pas de copie du plateau : elles sont ignorées en mode vérification des collisions.
+
+        Entrée:
+            chemin (str): Le chemin du fichier à lire.
+
+        Retourne:
+            int: Le nombre d'entrées ajoutées.
+        """
+        with open(chemin, 'rb') as fichier:
+            contenu = fichier.read()
+        if len(contenu) < ENTETE_FICHIER.size:
+            raise ValueError(f"Table de transposition invalide: {chemin}")
+        signature, version, nombre = ENTETE_FICHIER.unpack_from(contenu, 0)
+        if signature != SIGNATURE_FICHIER or version != VERSION_FICHIER:
+            raise ValueError(f"Table de transposition invalide ou de version non prise en charge: {chemin}")
+        if len(contenu) < ENTETE_FICHIER.size + nombre * ENTREE_FICHIER.size:
+            raise ValueError(f"Table de transposition tronquée: {chemin}")
+        ajoutees = 0
+        fin = ENTETE_FICHIER.size + nombre * ENTREE_FICHIER.size
+        for cle, mot in ENTREE_FICHIER.iter_unpack(contenu[ENTETE_FICHIER.size:fin]):
+            idx = cle & self.masque
+            ancienne = self.donnees[idx]
+            if ancienne and ((ancienne >> _DECALAGE_PROFONDEUR) & 0x3F) >= ((mot >> _DECALAGE_PROFONDEUR) & 0x3F):
+                continue
+            self.donnees[idx] = mot
+            self.cles[idx] = cle ^ mot
+            ajoutees += 1
+        return ajoutees
+
+    def sauvegarder(self, cle, score, profondeur, drapeau, coup=None, plateau=None, symetrie=0):
+        """
+        Sauvegarde le résultat d'une recherche dans la table, si la politique de remplacement l'autorise.
+
         Entrées:
-            cle (hashable): La clé sous laquelle la valeur doit être sauvegardée.
-            valeur (any): La valeur à sauvegarder.
+            cle (int): Hash de Zobrist de la position (trait compris).
+            score (float): Score trouvé pour la position.
+            profondeur (int): Profondeur de recherche restante à laquelle le score a été calculé.
+            drapeau (int): EXACTE, BORNE_INFERIEURE ou BORNE_SUPERIEURE.
+            coup (tuple, optionnel): Meilleur coup (ligne, colonne) trouvé pour la position.
+            plateau (Plateau, optionnel): La position correspondante, utilisée seulement en mode vérification.
+            symetrie (int, optionnel): Symétrie menant à la position canonique, si la clé est canonique.
         """
-        self.table[cle] = valeur
+        idx = cle & self.masque
+        ancienne = self.donnees[idx]
+        if ancienne and (self.cles[idx] ^ ancienne) != cle:
+            ancien_age = ancienne >> _DECALAGE_AGE
+            ancienne_profondeur = (ancienne >> _DECALAGE_PROFONDEUR) & 0x3F
+            if ancien_age == self.age and ancienne_profondeur > profondeur:
+                self.rejets += 1
+                return
 
-    def rechercher(self, cle):
+        if score >= _SCORE_MAX:
+            score = _SCORE_MAX
+        elif score <= -_SCORE_MAX:
+            score = -_SCORE_MAX
+        donnees = (
+            (int(score) + _SCORE_MAX)
+            | min(profondeur, 0x3F) << _DECALAGE_PROFONDEUR
+            | drapeau << _DECALAGE_DRAPEAU
+            | (0 if coup is None else ((coup[0] << 8 | coup[1]) + 1)) << _DECALAGE_COUP
+            | self.age << _DECALAGE_AGE
+        )
+        self.donnees[idx] = donnees
+        self.cles[idx] = cle ^ donnees
+        self.sauvegardes += 1
+        if self.verifier_collisions and plateau is not None:
+            self.signatures[idx] = self.signature(plateau, symetrie)
+
+    def rechercher(self, cle, plateau=None, symetrie=0):
         """
-        Cherche et retourne la valeur associée à une clé spécifique si elle existe dans la table.
-        
+        Cherche l'entrée associée à une position.
+
         Entrée:
-            cle (hashable): La clé dont la valeur associée doit être recherchée.
+            cle (int): Hash de Zobrist de la position (trait compris).
+            plateau (Plateau, optionnel): La position recherchée, utilisée seulement en mode vérification.
+            symetrie (int, optionnel): Symétrie menant à la position canonique, si la clé est canonique.
 
         Retourne:
-            La valeur associée à la clé ou None si la clé n'est pas trouvée.
+            tuple: (score, profondeur, drapeau, coup) ou None si la position n'est pas dans la table
+            (ou si une collision est détectée).
+        """
+        self.sondages += 1
+        idx = cle & self.masque
+        donnees = self.donnees[idx]
+        if not donnees or (self.cles[idx] ^ donnees) != cle:
+            return None
+        if self.verifier_collisions and plateau is not None:
+            if self.signatures.get(idx) != self.signature(plateau, symetrie):
+                self.collisions += 1
+                print(f"Collision de hash détectée pour la clé {cle}")
+                return None
+        self.succes += 1
+
+        score = (donnees & 0xFFFFFFFF) - _SCORE_MAX
+        if score == _SCORE_MAX:
+            score = float('inf')
+        elif score == -_SCORE_MAX:
+            score = float('-inf')
+        coup = (donnees >> _DECALAGE_COUP) & 0xFFFF
+        coup = None if coup == 0 else divmod(coup - 1, 256)
+        return score, (donnees >> _DECALAGE_PROFONDEUR) & 0x3F, (donnees >> _DECALAGE_DRAPEAU) & 0x3, coup
+
+    @staticmethod
+    def signature(plateau, symetrie=0):
+        """
+        Retourne une copie immuable du contenu du plateau, servant à détecter les collisions ; avec une symétrie,
+        celle du contenu de la position transformée (identique pour toutes les positions de même clé canonique).
         """
-        return self.table.get(cle, None)
+        if symetrie == 0:
+            return tuple(tuple(ligne) for ligne in plateau.plateau)
+        taille = plateau.taille
+        inverse = INVERSES[symetrie]
+        return tuple(
+            tuple(plateau.plateau[x][y] for x, y in (transformer(ligne, colonne, inverse, taille) for colonne in range(taille)))
+            for ligne in range(taille)
+        )
@@ -0,0 +1,152 @@
+import hashlib
+import itertools
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from joueur.joueur_ia import JoueurIA
+from plateau.plateau import Plateau
+from .observateurs import ObservateurConsole, ObservateurNul
+from .simulateur_partie import SimulateurPartie
+
+# Budget de nœuds par défaut de chaque coup d'un tournoi reproductible : de l'ordre de ce que la difficulté
+# 'difficile' visite pendant son budget de 3 secondes (assez pour terminer la profondeur 4 en début de partie).
+NOEUDS_PAR_COUP_DEFAUT = 40000
+
+# Budget de temps des coups d'un tournoi reproductible : seul le budget de nœuds arrête la recherche.
+SANS_LIMITE_DE_TEMPS = float('inf')
+
+
+def graine_partie(graine_maitre, indice_paire, indice_couleurs, indice_partie):
+    """
+    Dérive la graine d'une partie de la graine maîtresse du tournoi. La graine ne dépend que des indices de la
+    partie : elle est identique d'une exécution à l'autre, quel que soit l'ordre dans lequel les parties sont jouées.
+
+    Entrées:
+        graine_maitre (int): Graine du tournoi.
+        indice_paire (int): Indice de la paire de joueurs.
+        indice_couleurs (int): 0 si le premier joueur de la paire a les noirs, 1 sinon.
+        indice_partie (int): Indice de la partie pour cette paire et ces couleurs.
+
+    Retourne:
+        int: Graine de 64 bits de la partie.
+    """
+    texte = f"{graine_maitre}:{indice_paire}:{indice_couleurs}:{indice_partie}".encode()
+    return int.from_bytes(hashlib.blake2b(texte, digest_size=8).digest(), 'big')
+
+
+def jouer_partie_isolee(tache):
+    """
+    Joue une partie à partir d'une description sérialisable : le plateau et les joueurs sont construits dans le
+    processus qui joue la partie, et le générateur aléatoire est initialisé avec la graine de la partie.
+
+    Entrée:
+        tache (dict): Description de la partie (joueurs noir et blanc sous forme de dict nom/difficulte, graine,
+            indices de la partie, budget par coup, dossier des tables de transposition préchauffées).
+
+    Retourne:
+        dict: La tâche complétée du nom du gagnant ('gagnant', None en cas de nul), du nombre de coups joués et des
+        mesures de coût de chaque joueur ('mesures', par nom : voir SimulateurPartie.mesures).
+    """
+    random.seed(tache['graine'])  # None : graine tirée du système (tournoi non reproductible)
+    plateau = Plateau()
+    noir = JoueurIA('N', tache['noir']['difficulte'], plateau, tache['noir']['nom'])
+    blanc = JoueurIA('B', tache['blanc']['difficulte'], plateau, tache['blanc']['nom'])
+    if tache.get('dossier_tables') is not None:
+        noir.charger_tables(tache['dossier_tables'])
+        blanc.charger_tables(tache['dossier_tables'])
+    observateur = ObservateurNul() if tache.get('silencieux', True) else ObservateurConsole()
+    simulateur = SimulateurPartie(noir, blanc, plateau, observateur, tache.get('temps_par_coup'),
+                                  tache.get('noeuds_par_coup'))
+    couleur_gagnante = simulateur.jouer_partie()
+    noms = {'N': noir.nom, 'B': blanc.nom}
+    mesures = {noms[couleur]: mesures for couleur, mesures in simulateur.mesures.items()}
+    return dict(tache, gagnant=noms.get(couleur_gagnante), nb_coups=len(plateau.historique), mesures=mesures)
+
+
+class ExecuteurTournoi:
+    """
+    Planifie chaque partie d'un tournoi (paire de joueurs, couleurs, indice de la partie) comme une tâche
+    indépendante, exécutée dans un pool de processus.
+
+    Un tournoi doté d'une graine est reproductible à l'identique, quels que soient la machine, sa charge et le nombre
+    de processus : chaque coup n'est limité que par un budget de nœuds (NOEUDS_PAR_COUP_DEFAUT par défaut), car la
+    profondeur atteinte sous un budget de temps dépend de la vitesse du processus. Un budget de temps n'est accepté
+    que pour un tournoi sans graine.
+
+    Attributs:
+        joueurs (list): Les joueurs du tournoi (JoueurIA), décrits aux processus par leur nom et leur difficulté.
+        nb_parties_par_couleur (int): Nombre de parties jouées par chaque paire pour chaque attribution des couleurs.
+        graine (int): Graine maîtresse, dont sont dérivées les graines de toutes les parties (None : graines tirées
+            du système, tournoi non reproductible).
+        nb_processus (int): Nombre de processus du pool (1 : parties jouées dans le processus courant).
+        temps_par_coup (float): Budget en secondes de chaque coup (tournoi avec graine : SANS_LIMITE_DE_TEMPS ;
+            sans graine, None : budget de la difficulté de chaque joueur).
+        noeuds_par_coup (int): Nombre maximal de nœuds de chaque coup (tournoi avec graine : NOEUDS_PAR_COUP_DEFAUT
+            par défaut ; sans graine, None : pas de limite).
+        dossier_tables (str): Dossier des tables de transposition (voir JoueurIA.enregistrer_tables) chargées par
+            chaque joueur au début de chaque partie, ou None pour partir de tables vides.
+    """
+
+    def __init__(self, joueurs, nb_parties_par_couleur=1, graine=0, nb_processus=None, temps_par_coup=None,
+                 noeuds_par_coup=None, dossier_tables=None):
+        self.joueurs = joueurs
+        self.nb_parties_par_couleur = nb_parties_par_couleur
+        if graine is not None:
+            if temps_par_coup is not None:
+                raise ValueError("Un budget de temps par coup rend le tournoi dépendant de la machine : "
+                                 "utilisez noeuds_par_coup, ou graine=None pour un tournoi non reproductible")
+            temps_par_coup = SANS_LIMITE_DE_TEMPS
+            if noeuds_par_coup is None:
+                noeuds_par_coup = NOEUDS_PAR_COUP_DEFAUT
+        self.graine = graine
+        self.nb_processus = nb_processus or os.cpu_count() or 1
+        self.temps_par_coup = temps_par_coup
+        self.noeuds_par_coup = noeuds_par_coup
+        self.dossier_tables = dossier_tables
+
+    def taches(self):
+        """
+        Construit la liste des parties du tournoi, dans un ordre fixe.
+
+        Retourne:
+            list: Une description sérialisable (dict) par partie.
+        """
+        taches = []
+        for indice_paire, (joueur1, joueur2) in enumerate(itertools.combinations(self.joueurs, 2)):
+            spec1 = {'nom': joueur1.nom, 'difficulte': joueur1.difficulte}
+            spec2 = {'nom': joueur2.nom, 'difficulte': joueur2.difficulte}
+            for indice_couleurs, (noir, blanc) in enumerate([(spec1, spec2), (spec2, spec1)]):
+                for indice_partie in range(self.nb_parties_par_couleur):
+                    if self.graine is None:
+                        graine = None
+                    else:
+                        graine = graine_partie(self.graine, indice_paire, indice_couleurs, indice_partie)
+                    taches.append({
+                        'paire': indice_paire,
+                        'joueur1': joueur1.nom,
+                        'joueur2': joueur2.nom,
+                        'noir': noir,
+                        'blanc': blanc,
+                        'indice_couleurs': indice_couleurs,
+                        'indice_partie': indice_partie,
+                        'graine': graine,
+                        'temps_par_coup': self.temps_par_coup,
+                        'noeuds_par_coup': self.noeuds_par_coup,
+                        'dossier_tables': self.dossier_tables,
+                    })
+        return taches
+
+    def executer(self):
+        """
+        Joue toutes les parties du tournoi.
+
+        Retourne:
+            list: Les résultats des parties (voir `jouer_partie_isolee`), dans l'ordre de `taches` quel que soit
+            l'ordre dans lequel les processus les ont terminées.
+        """
+        taches = self.taches()
+        if self.nb_processus <= 1:
+            return [jouer_partie_isolee(tache) for tache in taches]
+        with ProcessPoolExecutor(self.nb_processus) as executeur:
+            return list(executeur.map(jouer_partie_isolee, taches))
@@ -1,5 +1,4 @@
-from .simulateur_partie import SimulateurPartie
-from plateau.plateau import Plateau
+from .executeur_tournoi import ExecuteurTournoi
 
 
 class GestionnaireTournoi:
@@ -9,26 +8,50 @@ class GestionnaireTournoi:
     Attributs :
         joueurs (list): Liste des instances de JoueurIA participant au tournoi.
         nb_parties_par_match (int): Nombre de parties jouées entre chaque paire de joueurs lors d'un match.
+        graine (int): Graine maîtresse du tournoi : deux tournois de même graine donnent les mêmes résultats
+            (None : tournoi non reproductible, voir ExecuteurTournoi).
+        nb_processus (int): Nombre de processus utilisés pour jouer les parties (None : un par cœur).
+        temps_par_coup (float): Budget en secondes de chaque coup, uniquement pour un tournoi sans graine (None :
+            budget de la difficulté de chaque joueur).
+        noeuds_par_coup (int): Nombre maximal de nœuds de chaque coup (None : NOEUDS_PAR_COUP_DEFAUT pour un tournoi
+            avec graine, pas de limite sinon).
+        dossier_tables (str): Dossier des tables de transposition préchauffées chargées au début de chaque partie.
         resultats (list): Liste des résultats des matchs.
         scores (dict): Dictionnaire des scores des joueurs.
+        couts (dict): Pour chaque joueur, le nombre de coups joués, le temps total et maximal de réflexion et le
+            nombre total de nœuds visités sur l'ensemble du tournoi.
     """
 
-    def __init__(self, joueurs, nb_parties_par_match=1):
+    def __init__(self, joueurs, nb_parties_par_match=1, graine=0, nb_processus=None, temps_par_coup=None,
+                 noeuds_par_coup=None, dossier_tables=None):
         """
         Initialise le gestionnaire du tournoi avec une liste de joueurs et le nombre de parties par match.
         Entrée:
             joueurs (list): Liste des instances de JoueurIA.
             nb_parties_par_match (int): Nombre de parties que chaque paire de joueurs jouera par match.
+            graine (int): Graine maîtresse du tournoi (None : tournoi non reproductible).
+            nb_processus (int): Nombre de processus utilisés pour jouer les parties (None : un par cœur).
+            temps_par_coup (float): Budget en secondes de chaque coup (tournoi sans graine uniquement).
+            noeuds_par_coup (int): Nombre maximal de nœuds de chaque coup.
+            dossier_tables (str): Dossier des tables de transposition préchauffées (None : tables vides).
         """
         self.joueurs = joueurs
         self.nb_parties_par_match = nb_parties_par_match
+        self.graine = graine
+        self.nb_processus = nb_processus
+        self.temps_par_coup = temps_par_coup
+        self.noeuds_par_coup = noeuds_par_coup
+        self.dossier_tables = dossier_tables
         self.resultats = []
         # Initialisation du dictionnaire des scores
         self.scores = {joueur.nom: 0 for joueur in joueurs}
+        self.couts = {joueur.nom: {'coups': 0, 'temps': 0.0, 'temps_max': 0.0, 'noeuds': 0} for joueur in joueurs}
 
     def organiser_match(self, joueur1, joueur2):
         """
-        Organise et exécute un match entre deux joueurs.
+        Organise et exécute un match entre deux joueurs : `nb_parties_par_match` parties avec chaque attribution des
+        couleurs, jouées par ExecuteurTournoi comme celles d'un tournoi (graines dérivées de celle du tournoi, mêmes
+        budgets par coup, couleurs des joueurs inchangées). Le bilan est ajouté à `resultats`, `scores` et `couts`.
 
         Entrées :
             joueur1 (JoueurIA): Le premier joueur du match.
@@ -37,50 +60,77 @@ class GestionnaireTournoi:
         Retourne:
             dict: Un dictionnaire contenant les résultats du match (nombre de victoires, nuls, etc.).
         """
-        resultats_match = {'victoires_joueur1': 0, 'victoires_joueur2': 0, 'nuls': 0}
-        couleurs = [('N', 'B'), ('B', 'N')]  # Alternance des couleurs pour chaque match
-        for couleur1, couleur2 in couleurs:
-            plateau = Plateau()
-            joueur1.couleur = couleur1
-            joueur2.couleur = couleur2
-            simulateur = SimulateurPartie(joueur1, joueur2, plateau)
-            gagnant = simulateur.jouer_partie()
-            if gagnant == couleur1:
-                resultats_match['victoires_joueur1'] += 1
-                self.scores[joueur1.nom] += 3
-            elif gagnant == couleur2:
-                resultats_match['victoires_joueur2'] += 1
-                self.scores[joueur2.nom] += 3
-            else:
-                resultats_match['nuls'] += 1
-                self.scores[joueur1.nom] += 1
-                self.scores[joueur2.nom] += 1
-        return resultats_match
+        executeur = ExecuteurTournoi([joueur1, joueur2], self.nb_parties_par_match, self.graine, self.nb_processus,
+                                     self.temps_par_coup, self.noeuds_par_coup, self.dossier_tables)
+        bilans = self.enregistrer_parties(executeur.executer())
+        return bilans[0][2]
 
     def organiser_tournoi(self):
         """
-        Organise et exécute le tournoi complet entre tous les joueurs.
+        Organise et exécute le tournoi complet entre tous les joueurs : chaque paire joue `nb_parties_par_match`
+        parties avec chaque attribution des couleurs. Les parties sont indépendantes et jouées en parallèle,
+        chacune avec sa propre graine dérivée de la graine du tournoi.
         """
         self.reinitialiser_resultats()
-        total_matches = 3
-        for _ in range(total_matches // 2):  # Chaque match est joué deux fois, donc diviser par 2
-            for joueur1, joueur2 in [(self.joueurs[0], self.joueurs[1]), (self.joueurs[1], self.joueurs[0])]:
-                resultats = self.organiser_match(joueur1, joueur2)
-                self.resultats.append((joueur1, joueur2, resultats))
+        executeur = ExecuteurTournoi(self.joueurs, self.nb_parties_par_match, self.graine, self.nb_processus,
+                                     self.temps_par_coup, self.noeuds_par_coup, self.dossier_tables)
+        self.enregistrer_parties(executeur.executer())
+
+    def enregistrer_parties(self, parties):
+        """
+        Fusionne les résultats des parties jouées par l'exécuteur dans `resultats` (un bilan par paire) et `scores`.
+
+        Entrée:
+            parties (list): Les résultats de `ExecuteurTournoi.executer`.
+
+        Retourne:
+            list: Les bilans ajoutés à `resultats`, sous la forme (joueur1, joueur2, bilan).
+        """
+        par_nom = {joueur.nom: joueur for joueur in self.joueurs}
+        bilans = {}
+        for partie in parties:
+            joueur1, joueur2 = partie['joueur1'], partie['joueur2']
+            for nom, mesures in partie['mesures'].items():
+                self.ajouter_couts(nom, mesures)
+            bilan = bilans.setdefault((joueur1, joueur2), {'victoires_joueur1': 0, 'victoires_joueur2': 0, 'nuls': 0})
+            if partie['gagnant'] == joueur1:
+                bilan['victoires_joueur1'] += 1
+                self.scores[joueur1] += 3
+            elif partie['gagnant'] == joueur2:
+                bilan['victoires_joueur2'] += 1
+                self.scores[joueur2] += 3
+            else:
+                bilan['nuls'] += 1
+                self.scores[joueur1] += 1
+                self.scores[joueur2] += 1
+        ajoutes = [(par_nom[joueur1], par_nom[joueur2], bilan) for (joueur1, joueur2), bilan in bilans.items()]
+        self.resultats.extend(ajoutes)
+        return ajoutes
+
+    def ajouter_couts(self, nom, mesures):
+        """
+        Ajoute les mesures de coût d'une partie (voir SimulateurPartie.mesures) au total d'un joueur.
+
+        Entrées:
+            nom (str): Le nom du joueur.
+            mesures (dict): Les mesures du joueur pour la partie.
+        """
+        couts = self.couts[nom]
+        couts['coups'] += mesures['coups']
+        couts['temps'] += mesures['temps']
+        couts['temps_max'] = max(couts['temps_max'], mesures['temps_max'])
+        couts['noeuds'] += mesures['noeuds']
 
     def jouer_et_enregistrer_matchs(self, joueur1, joueur2):
         """
-        Joue et enregistre les résultats pour les matchs entre deux joueurs spécifiques.
+        Joue et enregistre les résultats pour les matchs entre deux joueurs spécifiques. Chaque joueur ayant les
+        deux couleurs au cours du match, un seul match suffit.
 
         Entrée:
             joueur1 (JoueurIA): Le premier joueur.
             joueur2 (JoueurIA): Le second joueur.
         """
-        for _ in range(1): 
-            resultats = self.organiser_match(joueur1, joueur2)
-            self.resultats.append((joueur1, joueur2, resultats))
-            resultats = self.organiser_match(joueur2, joueur1)
-            self.resultats.append((joueur2, joueur1, resultats))
+        self.organiser_match(joueur1, joueur2)
     
     def afficher_resultats(self):
         """
@@ -96,9 +146,16 @@ class GestionnaireTournoi:
         for place, (nom, score) in enumerate(sorted_scores, start=1):
             print(f"{place}. {nom} avec {score} points")
 
+        print("\nCoût par coup:")
+        for nom, couts in self.couts.items():
+            nb_coups = max(couts['coups'], 1)
+            print(f"{nom}: {1000 * couts['temps'] / nb_coups:.1f} ms en moyenne "
+                  f"({1000 * couts['temps_max']:.1f} ms au plus), {couts['noeuds'] // nb_coups} nœuds en moyenne")
+
     def reinitialiser_resultats(self):
         """
         Réinitialise les résultats et les scores pour préparer un nouveau tournoi.
         """
         self.resultats = []
         self.scores = {joueur.nom: 0 for joueur in self.joueurs}
+        self.couts = {joueur.nom: {'coups': 0, 'temps': 0.0, 'temps_max': 0.0, 'noeuds': 0} for joueur in self.joueurs}
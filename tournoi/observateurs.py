@@ -0,0 +1,98 @@
+class ObservateurPartie:
+    """
+    Interface des observateurs d'une partie : SimulateurPartie notifie l'observateur à chaque étape de la boucle de
+    jeu. Toutes les méthodes ne font rien, ce qui en fait l'observateur nul des parties sans affichage : aucune
+    chaîne n'est construite pendant la partie.
+    """
+
+    def debut_coup(self, simulateur):
+        """
+        Appelée avant que le joueur actuel choisisse son coup.
+
+        Entrée:
+            simulateur (SimulateurPartie): La partie observée.
+        """
+
+    def coup_joue(self, simulateur, coup):
+        """
+        Appelée après qu'un coup valide a été posé sur le plateau.
+
+        Entrées:
+            simulateur (SimulateurPartie): La partie observée.
+            coup (tuple): Les coordonnées (ligne, colonne) du coup joué.
+        """
+
+    def coup_invalide(self, simulateur, coup):
+        """
+        Appelée lorsque le coup proposé par le joueur actuel n'a pas pu être joué.
+
+        Entrées:
+            simulateur (SimulateurPartie): La partie observée.
+            coup (tuple): Le coup refusé (None si le joueur n'a proposé aucun coup).
+        """
+
+    def changement_joueur(self, simulateur):
+        """
+        Appelée après que le trait est passé à l'autre joueur.
+
+        Entrée:
+            simulateur (SimulateurPartie): La partie observée.
+        """
+
+    def fin_partie(self, simulateur, gagnant):
+        """
+        Appelée une fois la partie terminée.
+
+        Entrées:
+            simulateur (SimulateurPartie): La partie observée.
+            gagnant (JoueurIA): Le vainqueur, ou None en cas de match nul.
+        """
+
+
+ObservateurNul = ObservateurPartie
+
+
+class ObservateurResume(ObservateurPartie):
+    """
+    Observateur qui n'affiche qu'une ligne de bilan à la fin de chaque partie.
+    """
+
+    def fin_partie(self, simulateur, gagnant):
+        nb_coups = len(simulateur.plateau.historique)
+        if gagnant is None:
+            print(f"{simulateur.joueur1.nom} - {simulateur.joueur2.nom} : match nul en {nb_coups} coups")
+        else:
+            print(f"{simulateur.joueur1.nom} - {simulateur.joueur2.nom} : {gagnant.nom} ({gagnant.couleur}) "
+                  f"gagne en {nb_coups} coups")
+
+
+class ObservateurConsole(ObservateurPartie):
+    """
+    Observateur qui affiche le plateau en couleurs avant chaque coup et commente chaque étape de la partie.
+    """
+
+    def afficher_plateau(self, plateau):
+        """
+        Affiche le plateau de jeu avec le rendu du plateau lui-même (Plateau.afficher_plateau).
+
+        Entrée:
+            plateau (Plateau): Le plateau à afficher.
+        """
+        plateau.afficher_plateau()
+
+    def debut_coup(self, simulateur):
+        self.afficher_plateau(simulateur.plateau)
+
+    def coup_joue(self, simulateur, coup):
+        print(f"{simulateur.joueur_actuel.nom} ({simulateur.joueur_actuel.couleur}) joue: {coup}")
+
+    def coup_invalide(self, simulateur, coup):
+        print(f"Coup invalide de {simulateur.joueur_actuel.nom}: {coup}")
+
+    def changement_joueur(self, simulateur):
+        print(f"Changement de joueur, c'est maintenant au tour de {simulateur.joueur_actuel.nom}")
+
+    def fin_partie(self, simulateur, gagnant):
+        if gagnant is not None:
+            print(f"{gagnant.nom} remporte la partie !")
+            self.afficher_plateau(simulateur.plateau)
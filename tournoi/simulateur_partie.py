@@ -1,7 +1,6 @@
-from strategie.evaluation import Evaluation
-from colorama import Fore, Style, init
+import time
 
-init(autoreset=True)  
+from .observateurs import ObservateurConsole
 
 
 class SimulateurPartie:
@@ -12,73 +11,51 @@ class SimulateurPartie:
         joueur2 (JoueurIA): Le deuxième joueur de la partie.
         plateau (Plateau): Le plateau de jeu sur lequel la partie est jouée.
         joueur_actuel (JoueurIA): Le joueur qui a le tour de jouer.
+        observateur (ObservateurPartie): Notifié à chaque étape de la partie (affichage console par défaut ;
+            ObservateurNul pour une partie sans aucun affichage).
+        temps_par_coup (float): Budget en secondes de chaque coup (None : budget de la difficulté du joueur).
+        noeuds_par_coup (int): Nombre maximal de nœuds de chaque coup (None : pas de limite). Contrairement au
+            budget de temps, il rend les parties reproductibles d'une machine à l'autre.
+        mesures (dict): Pour chaque couleur, le nombre de coups choisis, le temps total et maximal de réflexion
+            (en secondes) et le nombre total de nœuds visités.
     """
 
-    def __init__(self, joueur1, joueur2, plateau):
+    def __init__(self, joueur1, joueur2, plateau, observateur=None, temps_par_coup=None, noeuds_par_coup=None):
         self.joueur1 = joueur1
         self.joueur2 = joueur2
         self.plateau = plateau
         self.joueur_actuel = joueur1
-
-        self.evaluation1 = Evaluation(plateau, joueur1.couleur, joueur1.difficulte)
-        self.evaluation2 = Evaluation(plateau, joueur2.couleur, joueur2.difficulte)
-        self.evaluation_actuelle = self.evaluation1  # Commence avec le joueur1
+        self.observateur = observateur if observateur is not None else ObservateurConsole()
+        self.temps_par_coup = temps_par_coup
+        self.noeuds_par_coup = noeuds_par_coup
+        self.mesures = {
+            joueur.couleur: {'coups': 0, 'temps': 0.0, 'temps_max': 0.0, 'noeuds': 0} for joueur in (joueur1, joueur2)
+        }
 
     def afficher_plateau(self):
         """
         Affiche le plateau de jeu.
         """
-        PIERRE_NOIRE = Fore.BLUE + '●' + Style.RESET_ALL 
-        PIERRE_BLANCHE = Fore.LIGHTWHITE_EX + '○' + Style.RESET_ALL 
-        VIDE = ' ' + Style.RESET_ALL  
-
-        espacement_entre_colonnes = "  "
-        header = Fore.BLUE + " " * 3  
-        header += espacement_entre_colonnes.join(Fore.BLUE + f"{i+1:2d}" for i in range(self.plateau.taille))
-        print(header)
-
-        for idx, ligne in enumerate(self.plateau.plateau):
-        
-            print(Fore.BLUE + "  +" + "---+" * self.plateau.taille)
-
-        
-            row_display = Fore.BLUE + f"{idx+1:2d}| "  
-            row_display += " | ".join(
-                PIERRE_NOIRE if cell == 'B' else PIERRE_BLANCHE if cell == 'N' else VIDE for cell in ligne
-            ) + " |"
-            print(row_display)
-
-        print(Fore.BLUE + "  +" + "---+" * self.plateau.taille)
+        self.plateau.afficher_plateau()
 
     def jouer_coup(self):
         """
-        Choisi et joue le meilleur coup possible pour le joueur actuel basé sur l'évaluation de l'état du plateau après chaque coup potentiel.
+        Demande son coup au joueur actuel, qui le choisit avec son propre moteur de recherche sous le budget par coup
+        de la partie, et mesure le temps de réflexion et le nombre de nœuds visités.
 
         Retourne:
-            tuple: Le meilleur coup trouvé sous la forme d'un tuple (x, y), où x et y sont les coordonnées du coup sur le plateau.
+            tuple: Le coup choisi sous la forme d'un tuple (x, y), ou None si le joueur n'en a trouvé aucun.
         """
-        coups_possibles = self.generer_coups_possibles()
-        meilleur_score = float('-inf')
-        meilleur_coup = None
-
-        for coup in coups_possibles:
-            plateau_temp = self.plateau.copier()
-            plateau_temp.placer_pierre(*coup, self.joueur_actuel.couleur)
-            score = self.evaluation_actuelle.evaluer(plateau_temp)
-            if score > meilleur_score:
-                meilleur_score = score
-                meilleur_coup = coup
+        debut = time.perf_counter()
+        coup = self.joueur_actuel.jouer_coup(self.plateau, self.temps_par_coup, self.noeuds_par_coup)
+        duree = time.perf_counter() - debut
 
-        return meilleur_coup
-
-    def generer_coups_possibles(self):
-        """
-        Génère une liste de tous les coups possibles sur le plateau de jeu actuel basés sur les cases vides disponibles.
-
-        Retourne:
-            list of tuples: Une liste de tuples, chaque tuple représentant les coordonnées (x, y) d'un coup possible.
-        """
-        return [(x, y) for x in range(self.plateau.taille) for y in range(self.plateau.taille) if self.plateau[x][y] == '.']
+        mesures = self.mesures[self.joueur_actuel.couleur]
+        mesures['coups'] += 1
+        mesures['temps'] += duree
+        mesures['temps_max'] = max(mesures['temps_max'], duree)
+        mesures['noeuds'] += self.joueur_actuel.noeuds_dernier_coup()
+        return coup
 
     def jouer_partie(self):
         """
@@ -88,17 +65,17 @@ class SimulateurPartie:
             str: La couleur du gagnant ('B' ou 'N') si un joueur gagne, sinon None si la partie se termine par un match nul.
         """
         while not self.plateau.est_jeu_termine():
-            self.afficher_plateau()
+            self.observateur.debut_coup(self)
             coup = self.jouer_coup()
             if coup is not None and self.plateau.placer_pierre(*coup, self.joueur_actuel.couleur):
-                print(f"{self.joueur_actuel.nom} ({self.joueur_actuel.couleur}) joue: {coup}")
-                if self.plateau.verifier_victoire(*coup, self.joueur_actuel.couleur):
-                    print(f"{self.joueur_actuel.nom} remporte la partie !")
-                    self.afficher_plateau()
-                    return self.joueur_actuel.couleur
+                self.observateur.coup_joue(self, coup)
+                if self.plateau.gagnant is not None:
+                    self.observateur.fin_partie(self, self.joueur_actuel)
+                    return self.plateau.gagnant
             else:
-                print(f"Coup invalide de {self.joueur_actuel.nom}: {coup}")
+                self.observateur.coup_invalide(self, coup)
             self.changer_joueur()
+        self.observateur.fin_partie(self, None)
 
     def changer_joueur(self):
         """
@@ -109,9 +86,7 @@ class SimulateurPartie:
         """
         if self.joueur_actuel == self.joueur1:
             self.joueur_actuel = self.joueur2
-            self.evaluation_actuelle = self.evaluation2
         else:
             self.joueur_actuel = self.joueur1
-            self.evaluation_actuelle = self.evaluation1
-        print(f"Changement de joueur, c'est maintenant au tour de {self.joueur_actuel.nom}")
+        self.observateur.changement_joueur(self)
 